@@ -60,18 +60,21 @@
        → Methods:
            - run()                    → Execute complete OTP login workflow
            - mark_all_as_read()       → Mark all emails as read
+           - close_mail()             → Log out of the shared IMAP connection
            - _extract_email_body()    → Extract email body content
            - get_latest_otp_after_request() → Get OTP from Gmail
            - login_async()            → Async login workflow
            - login_sync()             → Sync login workflow
 
     Module-level Functions (for backward compatibility):
-       - login_with_otp_async(page)   → Async OTP login wrapper
+       - login_with_otp_async(page)   → Async OTP login wrapper (page optional)
+       - get_warm_page()              → New page from the shared warm browser
+       - close_warm_browser()         → Close the shared warm browser
        - login_with_otp_sync(page)   → Sync OTP login wrapper
 
 🧩 Dependencies:
     - playwright         → Automate web login flow
-    - imaplib, email     → Handle Gmail IMAP for OTP retrieval
+    - imapclient, email  → Handle Gmail IMAP (incl. IDLE) for OTP retrieval
     - asyncio            → Async flow
 
 🧠 Author:
@@ -80,21 +83,116 @@
     Date: 2025-11-10
 =======================================================================
 """
+import os
 import re
 import time
-import imaplib
 import email
 from email import message
 import asyncio
 import datetime
 import logging
 from typing import Optional
+from imapclient import IMAPClient, SEEN
 from playwright.async_api import async_playwright, Page
 from playwright.sync_api import sync_playwright
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by the OTP polling loop. The OTP is anchored on the
+# marker phrase in the mail. The bare 6-digit match is only a fallback when
+# OTP_EMAIL_SENDER / OTP_EMAIL_SUBJECT restrict the search to the OTP mails, since
+# any other mail may carry unrelated 6-digit numbers (order IDs, tracking numbers).
+_OTP_RE = re.compile(r'(?:OTP|verification code|code)\D{0,30}(\d{6})(?!\d)', re.IGNORECASE)
+_OTP_FALLBACK_RE = re.compile(r'(?<!\d)(\d{6})(?!\d)')
+
+# First inbox re-check interval in seconds; doubles up to OTP_DELAY
+_OTP_POLL_MIN_INTERVAL = 0.5
+
+# Newest unread mails fetched together per poll
+_OTP_FETCH_BATCH = 5
+
+# Bytes of an HTML-only body scanned for the OTP
+_HTML_BODY_LIMIT = 4096
+
+# Only the MIME headers needed to decode the body are pulled, never the full RFC822
+# message, plus the server's arrival time. BODY.PEEK leaves the \Seen flag untouched.
+_OTP_FETCH_ITEMS = (
+    "INTERNALDATE",
+    "BODY.PEEK[HEADER.FIELDS (MIME-VERSION CONTENT-TYPE CONTENT-TRANSFER-ENCODING)]",
+    "BODY.PEEK[TEXT]",
+)
+
+# Seconds a mail's INTERNALDATE may precede the OTP request and still count, to
+# absorb clock drift between this machine and the mail server
+_OTP_CLOCK_SKEW = 30
+
+# Session cookies saved after a successful login (project root, git-ignored)
+SESSION_STATE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "nimar_state.json"
+)
+
+# How long to wait for the login form before assuming the session is still valid
+_LOGIN_FORM_GRACE_MS = 1000
+
+# Per-attempt budget for clicking Verify OTP once the button is attached
+_VERIFY_CLICK_TIMEOUT_MS = 1500
+
+# Resource types run() does not download: the login page needs none of them.
+# Stylesheets stay, since the OTP selectors rely on CSS visibility.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# No --start-maximized / --disable-web-security: the login page needs neither, and
+# they cost extra paint work and site isolation
+_LAUNCH_ARGS = [
+    "--ignore-certificate-errors",
+    "--ignore-ssl-errors",
+    "--no-proxy-server"
+]
+
+_OTP_INPUT_SELECTOR = "input[aria-label^='Please enter OTP character']"
+# Anything that shows the credentials were accepted (both are CSS, so one selector string)
+_OTP_STAGE_SELECTOR = f"{_OTP_INPUT_SELECTOR}, button:has-text('OTP')"
+
+# Writes every OTP digit in one evaluate call. The native value setter is used so
+# framework-controlled inputs (React etc.) pick up the change from the input event.
+# Returns the resulting input values so the caller can verify the batch took.
+_FILL_OTP_JS = """([selector, digits]) => {
+    const inputs = document.querySelectorAll(selector);
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    digits.split('').forEach((digit, i) => {
+        setValue.call(inputs[i], digit);
+        inputs[i].dispatchEvent(new Event('input', { bubbles: true }));
+        inputs[i].dispatchEvent(new Event('change', { bubbles: true }));
+    });
+    return Array.from(inputs).map(input => input.value).join('');
+}"""
+
+# Current joined value of the OTP inputs
+_READ_OTP_JS = """(selector) => Array.from(document.querySelectorAll(selector)).map(input => input.value).join('')"""
+
+# True once the portal accepted the credentials: URL moved away from the login
+# page, or the OTP inputs / an OTP button are rendered
+_LOGIN_ACCEPTED_JS = """([initialUrl, inputSelector]) => {
+    const url = location.href;
+    if (!url.includes('/login') || url !== initialUrl) return true;
+    if (document.querySelector(inputSelector)) return true;
+    return Array.from(document.querySelectorAll('button')).some(b => (b.textContent || '').includes('OTP'));
+}"""
+
+# Debug dump of the page's buttons in one round-trip (no per-button handles)
+_BUTTON_DUMP_JS = """() => {
+    const buttons = document.querySelectorAll('button');
+    return {
+        total: buttons.length,
+        buttons: Array.from(buttons).slice(0, 10).map(b => ({
+            text: (b.innerText || '').slice(0, 50),
+            visible: !!b.offsetParent
+        }))
+    };
+}"""
+
 from NIMAR.env_variables import (
     EMAIL_USER,
     EMAIL_PASS,
@@ -108,46 +206,115 @@ from NIMAR.env_variables import (
     OTP_BUTTON_TIMEOUT,
     OTP_EMAIL_WAIT_TIME,
     OTP_INPUT_DELAY,
+    OTP_INPUT_DELAY_SECONDS,
     OTP_VERIFY_BUTTON_TIMEOUT,
     OTP_LOGIN_COMPLETE_WAIT,
     BROWSER_HEADLESS,
     BROWSER_IGNORE_HTTPS_ERRORS,
     BROWSER_NO_VIEWPORT,
-    MANUAL_OTP
+    MANUAL_OTP,
+    OTP_EMAIL_SENDER,
+    OTP_EMAIL_SUBJECT
 )
 
-if not EMAIL_USER:
-    raise ValueError("EMAIL_USER environment variable is required.")
-if not EMAIL_PASS:
-    raise ValueError("EMAIL_PASS environment variable is required.")
-if not PORTAL_URL:
-    raise ValueError("PORTAL_URL environment variable is required.")
-if not USERNAME:
-    raise ValueError("USERNAME environment variable is required.")
-if not PASSWORD:
-    raise ValueError("PASSWORD environment variable is required.")
-if not EMAIL_SERVER:
-    raise ValueError("EMAIL_SERVER environment variable is required.")
-if not OTP_RETRIES:
-    raise ValueError("OTP_RETRIES environment variable is required.")
-if not OTP_DELAY:
-    raise ValueError("OTP_DELAY environment variable is required.")
-if not OTP_CREDENTIAL_ENTRY_WAIT:
-    raise ValueError("OTP_CREDENTIAL_ENTRY_WAIT environment variable is required.")
-if not OTP_BUTTON_TIMEOUT:
-    raise ValueError("OTP_BUTTON_TIMEOUT environment variable is required.")
-if not OTP_EMAIL_WAIT_TIME:
-    raise ValueError("OTP_EMAIL_WAIT_TIME environment variable is required.")
-if not OTP_INPUT_DELAY:
-    raise ValueError("OTP_INPUT_DELAY environment variable is required.")
-if not OTP_VERIFY_BUTTON_TIMEOUT:
-    raise ValueError("OTP_VERIFY_BUTTON_TIMEOUT environment variable is required.")
-if not OTP_LOGIN_COMPLETE_WAIT:
-    raise ValueError("OTP_LOGIN_COMPLETE_WAIT environment variable is required.")
+_REQUIRED_ENV = {
+    "EMAIL_USER": EMAIL_USER,
+    "EMAIL_PASS": EMAIL_PASS,
+    "PORTAL_URL": PORTAL_URL,
+    "USERNAME": USERNAME,
+    "PASSWORD": PASSWORD,
+    "EMAIL_SERVER": EMAIL_SERVER,
+    "OTP_RETRIES": OTP_RETRIES,
+    "OTP_DELAY": OTP_DELAY,
+    "OTP_CREDENTIAL_ENTRY_WAIT": OTP_CREDENTIAL_ENTRY_WAIT,
+    "OTP_BUTTON_TIMEOUT": OTP_BUTTON_TIMEOUT,
+    "OTP_EMAIL_WAIT_TIME": OTP_EMAIL_WAIT_TIME,
+    "OTP_INPUT_DELAY": OTP_INPUT_DELAY,
+    "OTP_VERIFY_BUTTON_TIMEOUT": OTP_VERIFY_BUTTON_TIMEOUT,
+    "OTP_LOGIN_COMPLETE_WAIT": OTP_LOGIN_COMPLETE_WAIT,
+}
+# Missing means unset/empty; a legitimate 0 (e.g. OTP_DELAY=0) is accepted
+_missing_env = [name for name, value in _REQUIRED_ENV.items() if value is None or value == ""]
+if _missing_env:
+    raise ValueError(f"Required environment variables are missing: {', '.join(_missing_env)}")
 # Note: BROWSER_HEADLESS, BROWSER_IGNORE_HTTPS_ERRORS, and BROWSER_NO_VIEWPORT have defaults
 # and can legitimately be False, so we don't validate them here
 
 
+def _union_locator(page, selectors: tuple, visible_only: bool = False):
+    """
+    Combine several CSS/XPath selectors into one Playwright locator.
+    
+    Playwright resolves the union in a single retry loop, so waiting on it
+    costs one timeout instead of one per candidate selector. Works with both
+    sync and async Page objects (locator()/or_() are not awaitable).
+    
+    Args:
+        page: Playwright Page object (sync or async)
+        selectors (tuple): Selector strings to try
+        visible_only (bool): Match only visible elements, so .first can't land
+            on a hidden element that happens to match first
+    
+    Returns:
+        Locator: Locator matching any of the selectors
+    """
+    if visible_only:
+        selectors = tuple(f"{selector} >> visible=true" for selector in selectors)
+    locator = page.locator(selectors[0])
+    for selector in selectors[1:]:
+        locator = locator.or_(page.locator(selector))
+    return locator
+
+
+async def _block_heavy_resources(route):
+    """
+    Route handler that aborts requests for _BLOCKED_RESOURCE_TYPES.
+    
+    Args:
+        route: Playwright async Route object
+    """
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _race_selectors(page, selectors: tuple, timeout: int):
+    """
+    Wait for any of several selectors to become visible, concurrently.
+    
+    Each selector gets its own wait_for_selector task and the first visible
+    match wins; the remaining waits are cancelled. Unlike a union locator this
+    is not thrown off by a hidden element that happens to match first.
+    
+    Args:
+        page: Playwright async Page object
+        selectors (tuple): Selector strings to race
+        timeout (int): Overall timeout in milliseconds
+    
+    Returns:
+        ElementHandle or None: First visible match, None if nothing appeared in time
+    """
+    pending = {
+        asyncio.create_task(page.wait_for_selector(selector, timeout=timeout, state="visible"))
+        for selector in selectors
+    }
+    winner = None
+    try:
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and task.result():
+                    winner = task.result()
+                    break
+                logger.debug("OTP button selector wait failed: %.100s", task.exception())
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return winner
+
+
 class NimarOTPAutomation:
     """
     Main automation class for NIMAR OTP-based login workflow.
@@ -164,42 +331,109 @@ class NimarOTPAutomation:
         mail_server (str): IMAP server address
         retries (int): Maximum retry attempts for OTP
         delay (int): Delay between retries in seconds
+        credential_entry_wait (int): Wait after credential entry in ms
+        otp_button_timeout (int): OTP button wait timeout in ms
+        otp_email_wait_time (int): Email delivery wait in ms
+        otp_input_delay (int): Delay between OTP digits in ms
+        otp_verify_button_timeout (int): Verify button wait timeout in ms
+        otp_login_complete_wait (int): Wait after OTP verification in ms
     
     Example:
         >>> automation = NimarOTPAutomation()
         >>> await automation.run()
     """
     
+    # Fixed attribute set: no per-instance __dict__, cheaper attribute access
+    __slots__ = (
+        "email_user", "email_pass", "portal_url", "username", "password",
+        "mail_server", "retries", "delay",
+        "credential_entry_wait", "otp_button_timeout", "otp_email_wait_time",
+        "otp_input_delay", "otp_verify_button_timeout", "otp_login_complete_wait",
+        "_mail",
+    )
+    
+    # Selectors shared by login_async() and login_sync(); tuples so they are
+    # built once at class creation and cannot be mutated per instance
+    LOGIN_BUTTON_SELECTORS = (
+        'button[type="submit"]',  # Try submit button first
+        '//button[@type="submit"]',
+        'button:has-text("Login")',
+        '//button[normalize-space()="Login"]',
+    )
+    OTP_BUTTON_SELECTORS = (
+        '//*[@id="portal"]/div/div/div/div[2]/div/button[3]',
+        'button:has-text("OTP")',
+        'button:has-text("Send OTP")',
+        'button:has-text("Request OTP")',
+        '//button[contains(text(), "OTP")]',
+        '//button[contains(@class, "otp")]',
+    )
+    VERIFY_OTP_SELECTOR = "//button[normalize-space()='Verify OTP']"
+    
     def __init__(self):
         """
         Initialize NIMAR OTP automation.
         
-        Loads all configuration from env_variables.py module.
+        Loads all configuration from env_variables.py module. Required values
+        are validated once at module import.
         """
         self.email_user = EMAIL_USER
         self.email_pass = EMAIL_PASS
         self.portal_url = PORTAL_URL
         self.username = USERNAME
         self.password = PASSWORD
+        self.mail_server = EMAIL_SERVER
+        self.retries = OTP_RETRIES
+        self.delay = OTP_DELAY
         
-        if not all([self.email_user, self.email_pass, self.portal_url, self.username, self.password]):
-            logger.critical("Missing one or more required environment variables.")
-            raise ValueError("Missing required environment variables. Check env_variables.py.")
+        # Playwright timings in milliseconds (already ints from env_variables._get_int)
+        self.credential_entry_wait = OTP_CREDENTIAL_ENTRY_WAIT
+        self.otp_button_timeout = OTP_BUTTON_TIMEOUT
+        self.otp_email_wait_time = OTP_EMAIL_WAIT_TIME
+        self.otp_input_delay = OTP_INPUT_DELAY
+        self.otp_verify_button_timeout = OTP_VERIFY_BUTTON_TIMEOUT
+        self.otp_login_complete_wait = OTP_LOGIN_COMPLETE_WAIT
         
-        mail_server = EMAIL_SERVER
-        if not mail_server:
-            raise ValueError("EMAIL_SERVER environment variable is required. Set it in env_variables.py.")
-        self.mail_server = mail_server
+        # IMAP connection shared by mark_all_as_read() and the OTP poll (see _get_mail)
+        self._mail = None
+    
+    def _get_mail(self) -> IMAPClient:
+        """
+        Return a logged-in IMAP connection with INBOX selected.
         
-        retries_str = OTP_RETRIES
-        if not retries_str:
-            raise ValueError("OTP_RETRIES environment variable is required. Set it in env_variables.py.")
-        self.retries = int(retries_str)
+        The connection is opened once and reused for the rest of the login
+        flow, saving a TLS handshake + LOGIN per IMAP step. A cached handle is
+        probed with NOOP and transparently reopened if the server dropped it.
         
-        delay_str = OTP_DELAY
-        if not delay_str:
-            raise ValueError("OTP_DELAY environment variable is required. Set it in env_variables.py.")
-        self.delay = int(delay_str)
+        Returns:
+            IMAPClient: Ready-to-use IMAP connection (UID based)
+        """
+        if self._mail is not None:
+            try:
+                self._mail.noop()
+                return self._mail
+            except (IMAPClient.AbortError, IMAPClient.Error, OSError):
+                logger.info("IMAP connection dropped, reconnecting...")
+                self._mail = None
+        
+        mail = IMAPClient(self.mail_server, ssl=True)
+        mail.login(self.email_user, self.email_pass)
+        mail.select_folder("INBOX")
+        self._mail = mail
+        return mail
+    
+    def close_mail(self):
+        """
+        Log out of the shared IMAP connection, if one is open.
+        """
+        if self._mail is None:
+            return
+        try:
+            self._mail.logout()
+        except Exception as e:
+            logger.debug("IMAP logout failed: %s", e)
+        finally:
+            self._mail = None
     
     def mark_all_as_read(self) -> bool:
         """
@@ -209,11 +443,11 @@ class NimarOTPAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            mail = imaplib.IMAP4_SSL(self.mail_server)
-            mail.login(self.email_user, self.email_pass)
-            mail.select("inbox")
-            mail.store("1:*", "+FLAGS", "\\Seen")
-            mail.logout()
+            mail = self._get_mail()
+            # Only touch unread messages; silent suppresses the per-message FETCH echo
+            unread = mail.search(["UNSEEN"])
+            if unread:
+                mail.add_flags(unread, [SEEN], silent=True)
             logger.info("All previous emails marked as read.")
             return True
         except Exception as e:
@@ -224,24 +458,90 @@ class NimarOTPAutomation:
         """
         Extract text body from email message.
         
+        The text/plain part is preferred. HTML is only used as a fallback and
+        is truncated to _HTML_BODY_LIMIT bytes, since the OTP sits in the first
+        visible sentence and the rest is markup. Single-part mails and the usual
+        flat multipart/alternative shape are handled without walking the MIME
+        tree; nested layouts fall back to msg.walk().
+        
         Args:
             msg (message.Message): Email message object
         
         Returns:
             str: Email body text
         """
-        body = ""
-        if msg.is_multipart():
-            for part in msg.walk():
-                if part.get_content_type() in ["text/plain", "text/html"]:
-                    try:
-                        body = part.get_payload(decode=True).decode(errors="ignore")
-                        break
-                    except Exception:
-                        continue
-        else:
-            body = msg.get_payload(decode=True).decode(errors="ignore")
-        return body
+        if not msg.is_multipart():
+            payload = msg.get_payload(decode=True) or b""
+            if msg.get_content_type() == "text/html":
+                payload = payload[:_HTML_BODY_LIMIT]
+            return payload.decode(errors="ignore")
+        
+        parts = msg.get_payload()
+        if any(part.is_multipart() for part in parts):
+            parts = list(msg.walk())
+        
+        html = None
+        for part in parts:
+            content_type = part.get_content_type()
+            if content_type == "text/plain":
+                plain = part.get_payload(decode=True)
+                if plain:
+                    return plain.decode(errors="ignore")
+            elif content_type == "text/html" and html is None:
+                html = part.get_payload(decode=True)
+        return (html or b"")[:_HTML_BODY_LIMIT].decode(errors="ignore")
+    
+    @staticmethod
+    def _message_from_fetch(data: dict) -> message.Message:
+        """
+        Rebuild an email message from one message's FETCH data for _OTP_FETCH_ITEMS.
+        
+        Args:
+            data (dict): Item name (bytes) → value, as returned per UID by IMAPClient.fetch()
+        
+        Returns:
+            message.Message: Message built from the MIME headers + body text
+        """
+        headers = text = b""
+        for key, value in data.items():
+            if key.startswith(b"BODY[HEADER"):
+                headers = value or b""
+            elif key == b"BODY[TEXT]":
+                text = value or b""
+        return email.message_from_bytes(headers + text)
+    
+    def _wait_for_new_mail(self, mail: IMAPClient, timeout: float) -> bool:
+        """
+        Block until the server pushes a new message or the timeout expires.
+        
+        Uses the IMAP IDLE command (RFC 2177) so the OTP mail is picked up as
+        soon as it lands instead of after a fixed sleep. Falls back to
+        time.sleep() when the server does not advertise IDLE.
+        
+        Args:
+            mail (IMAPClient): Logged-in IMAP connection with INBOX selected
+            timeout (float): Maximum time to wait in seconds
+        
+        Returns:
+            bool: True if an EXISTS notification was received, False otherwise
+        """
+        if not mail.has_capability("IDLE"):
+            time.sleep(timeout)
+            return False
+        
+        deadline = time.monotonic() + timeout
+        mail.idle()
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                # Other untagged updates (flag changes, EXPUNGE) just resume the wait
+                for response in mail.idle_check(timeout=remaining):
+                    if len(response) > 1 and response[1] == b"EXISTS":
+                        return True
+        finally:
+            mail.idle_done()
     
     def get_latest_otp_after_request(self, request_time: datetime.datetime) -> Optional[str]:
         """
@@ -254,48 +554,237 @@ class NimarOTPAutomation:
             str or None: 6-digit OTP code if found, None otherwise
         """
         try:
-            mail = imaplib.IMAP4_SSL(self.mail_server)
-            mail.login(self.email_user, self.email_pass)
-            mail.select("inbox")
-
-            for attempt in range(self.retries):
-                result, data = mail.search(None, "ALL")
-                if not data or not data[0]:
-                    logger.info(f"No new emails yet (attempt {attempt + 1}/{self.retries})...")
-                    time.sleep(self.delay)
-                    continue
-
-                latest_email_id = data[0].split()[-1]
-                result, msg_data = mail.fetch(latest_email_id, "(RFC822 INTERNALDATE)")
-                msg = email.message_from_bytes(msg_data[0][1])
-                internal_date = msg_data[0][0].decode(errors="ignore")
-
-                match = re.search(r'\d{1,2}-[A-Za-z]{3}-\d{4} \d{2}:\d{2}:\d{2}', internal_date)
-                if match:
-                    email_time = datetime.datetime.strptime(match.group(), "%d-%b-%Y %H:%M:%S")
-                    if email_time <= request_time:
-                        time.sleep(self.delay)
-                        continue
-
-                body = self._extract_email_body(msg)
-                otp_match = re.search(r"\b\d{6}\b", body)
-                if otp_match:
-                    otp = otp_match.group()
-                    logger.info("New OTP received.")
-                    mail.logout()
-                    return otp
-
-                logger.info(f"Waiting for OTP email... (attempt {attempt + 1}/{self.retries})")
-                time.sleep(self.delay)
+            mail = self._get_mail()
+
+            # Let the server narrow it down: unread mail since the day before the request
+            # (SINCE is a calendar date, and a UTC/server timezone mismatch mustn't drop
+            # the OTP). That still admits up to two days of mail, and mark_all_as_read()
+            # can fail, so each candidate's INTERNALDATE is checked against the request.
+            since = (request_time - datetime.timedelta(days=1)).date()
+            not_before = request_time.timestamp() - _OTP_CLOCK_SKEW
+            criteria = ["UNSEEN", "SINCE", since]
+            if OTP_EMAIL_SENDER:
+                criteria += ["FROM", OTP_EMAIL_SENDER]
+            if OTP_EMAIL_SUBJECT:
+                criteria += ["SUBJECT", OTP_EMAIL_SUBJECT]
+
+            # Bind hot-loop callables as locals once (LOAD_FAST instead of attribute lookups)
+            search, fetch = mail.search, mail.fetch
+            message_from_fetch, extract_body = self._message_from_fetch, self._extract_email_body
+            otp_search = _OTP_RE.search
+            # Bare 6-digit fallback only when the search is limited to the OTP sender/subject
+            otp_fallback_search = _OTP_FALLBACK_RE.search if (OTP_EMAIL_SENDER or OTP_EMAIL_SUBJECT) else None
+            wait_for_new_mail = self._wait_for_new_mail
+            info = logger.info
+            monotonic = time.monotonic
+
+            # Adaptive polling: check quickly at first, then back off exponentially up to
+            # OTP_DELAY. The total budget matches the old fixed email wait + retries * delay.
+            deadline = monotonic() + self.otp_email_wait_time / 1000 + self.retries * self.delay
+            max_interval = max(self.delay, _OTP_POLL_MIN_INTERVAL)
+            interval = _OTP_POLL_MIN_INTERVAL
+            attempt = 0
+
+            while True:
+                attempt += 1
+                uids = search(criteria)
+                if uids:
+                    # Pull the newest few candidates in a single FETCH round-trip
+                    uids = sorted(uids)[-_OTP_FETCH_BATCH:]
+                    messages = fetch(uids, _OTP_FETCH_ITEMS)
+                    for uid in reversed(uids):
+                        data = messages.get(uid)
+                        if not data:
+                            continue
+                        # INTERNALDATE comes back as a naive local datetime
+                        arrived_at = data.get(b"INTERNALDATE")
+                        if arrived_at is not None and arrived_at.timestamp() < not_before:
+                            continue  # Delivered before the OTP was requested
+                        body = extract_body(message_from_fetch(data))
+                        otp_match = otp_search(body)
+                        if not otp_match and otp_fallback_search:
+                            otp_match = otp_fallback_search(body)
+                        if otp_match:
+                            otp = otp_match.group(1)
+                            info("New OTP received.")
+                            return otp
+
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                wait = min(interval, remaining)
+                info("Waiting for OTP email... (attempt %d, next check in %.1fs)", attempt, wait)
+                wait_for_new_mail(mail, wait)
+                interval = min(interval * 2, max_interval)
 
             logger.error("OTP not received within expected time.")
-            mail.logout()
             return None
 
         except Exception as e:
             logger.error(f"Error while fetching OTP: {e}")
             return None
 
+    def _log_credentials(self):
+        """
+        Log the portal/email settings used for this login (password masked).
+        """
+        # One multi-line record instead of eight separate emits
+        logger.info(
+            "\n%s\n🔐 LOGIN CREDENTIALS BEING USED:"
+            "\n   Portal URL: %s"
+            "\n   Username: %s"
+            "\n   Password: %s"
+            "\n   Email User: %s"
+            "\n   Email Server: %s"
+            "\n%s",
+            "=" * 60,
+            self.portal_url,
+            self.username,
+            '*' * len(self.password) if self.password else 'NOT SET',
+            self.email_user,
+            self.mail_server,
+            "=" * 60,
+        )
+    
+    @staticmethod
+    def _log_button_dump(dump: dict):
+        """
+        Log the result of _BUTTON_DUMP_JS (shared by both login paths).
+        
+        Args:
+            dump (dict): {"total": int, "buttons": [{"text": str, "visible": bool}, ...]}
+        """
+        logger.debug("Found %d buttons on the page:", dump["total"])
+        for i, btn in enumerate(dump["buttons"]):  # Show first 10 buttons
+            logger.debug("  Button %d: %s", i + 1, btn["text"] if btn["visible"] else "[hidden]")
+    
+    @staticmethod
+    def _manual_otp() -> str:
+        """
+        Return the OTP configured in MANUAL_OTP (shared by both login paths).
+        
+        The 6-digit code is pulled out with the precompiled fallback pattern, so
+        surrounding whitespace or punctuation (e.g. pasted "OTP: 123456.") is
+        tolerated. A value without a 6-digit run is used as-is, stripped.
+        
+        Returns:
+            str: Manual OTP code
+        """
+        match = _OTP_FALLBACK_RE.search(MANUAL_OTP)
+        otp = match.group(1) if match else MANUAL_OTP.strip()
+        logger.info(f"✅ Using manual OTP: {otp}")
+        return otp
+    
+    async def _fill_otp_async(self, page, otp: str):
+        """
+        Enter the OTP into the six input boxes (async version).
+        
+        All digits are written in a single page.evaluate round-trip. If the
+        portal rejects that (values don't stick), the OTP is typed as real key
+        events into the first box, relying on the component to advance focus.
+        Per-digit fills paced by OTP_INPUT_DELAY are the last resort.
+        
+        Args:
+            page: Playwright async Page object
+            otp (str): 6-digit OTP code
+        """
+        filled = await page.evaluate(_FILL_OTP_JS, [_OTP_INPUT_SELECTOR, otp])
+        if filled == otp:
+            return
+        logger.warning("Batch OTP fill did not stick, typing it instead.")
+        otp_inputs = page.locator(_OTP_INPUT_SELECTOR)
+        await otp_inputs.first.focus()
+        await page.keyboard.type(otp, delay=0)
+        if await page.evaluate(_READ_OTP_JS, _OTP_INPUT_SELECTOR) == otp:
+            return
+        logger.warning("Typed OTP did not stick, falling back to per-digit input.")
+        for i, digit in enumerate(otp):
+            await otp_inputs.nth(i).fill(digit)
+            await page.wait_for_timeout(self.otp_input_delay)
+    
+    def _fill_otp_sync(self, page, otp: str):
+        """
+        Enter the OTP into the six input boxes (sync version).
+        
+        All digits are written in a single page.evaluate round-trip. If the
+        portal rejects that (values don't stick), the OTP is typed as real key
+        events into the first box, relying on the component to advance focus.
+        Per-digit fills paced by OTP_INPUT_DELAY are the last resort.
+        
+        Args:
+            page: Playwright sync Page object
+            otp (str): 6-digit OTP code
+        """
+        filled = page.evaluate(_FILL_OTP_JS, [_OTP_INPUT_SELECTOR, otp])
+        if filled == otp:
+            return
+        logger.warning("Batch OTP fill did not stick, typing it instead.")
+        otp_inputs = page.locator(_OTP_INPUT_SELECTOR)
+        otp_inputs.first.focus()
+        page.keyboard.type(otp, delay=0)
+        if page.evaluate(_READ_OTP_JS, _OTP_INPUT_SELECTOR) == otp:
+            return
+        logger.warning("Typed OTP did not stick, falling back to per-digit input.")
+        for i, digit in enumerate(otp):
+            otp_inputs.nth(i).fill(digit)
+            time.sleep(OTP_INPUT_DELAY_SECONDS)
+    
+    async def _login_form_visible_async(self, page) -> bool:
+        """
+        Check whether the portal login form is shown (async version).
+        
+        Args:
+            page: Playwright async Page object
+        
+        Returns:
+            bool: True if the username field becomes visible within a short grace period
+        """
+        try:
+            await page.locator("#name").wait_for(state="visible", timeout=_LOGIN_FORM_GRACE_MS)
+            return True
+        except Exception:
+            return False
+    
+    def _login_form_visible_sync(self, page) -> bool:
+        """
+        Check whether the portal login form is shown (sync version).
+        
+        Args:
+            page: Playwright sync Page object
+        
+        Returns:
+            bool: True if the username field becomes visible within a short grace period
+        """
+        try:
+            page.locator("#name").wait_for(state="visible", timeout=_LOGIN_FORM_GRACE_MS)
+            return True
+        except Exception:
+            return False
+    
+    async def _save_session_state_async(self, page):
+        """
+        Persist cookies/local storage so the next run can take the fast path (async version).
+        
+        Args:
+            page: Playwright async Page object
+        """
+        try:
+            await page.context.storage_state(path=SESSION_STATE_FILE)
+        except Exception as e:
+            logger.warning(f"Could not save session state: {e}")
+    
+    def _save_session_state_sync(self, page):
+        """
+        Persist cookies/local storage so the next run can take the fast path (sync version).
+        
+        Args:
+            page: Playwright sync Page object
+        """
+        try:
+            page.context.storage_state(path=SESSION_STATE_FILE)
+        except Exception as e:
+            logger.warning(f"Could not save session state: {e}")
+    
     async def login_async(self, page) -> bool:
         """
         Perform complete login workflow (asynchronous version).
@@ -307,28 +796,26 @@ class NimarOTPAutomation:
         bool: True if login successful, False otherwise
         """
         try:
-            # Log credentials being used
-            logger.info("=" * 60)
-            logger.info("🔐 LOGIN CREDENTIALS BEING USED:")
-            logger.info(f"   Portal URL: {self.portal_url}")
-            logger.info(f"   Username: {self.username}")
-            logger.info(f"   Password: {'*' * len(self.password) if self.password else 'NOT SET'}")
-            logger.info(f"   Email User: {self.email_user}")
-            logger.info(f"   Email Server: {self.mail_server}")
-            logger.info("=" * 60)
-            
-            self.mark_all_as_read()
+            self._log_credentials()
+            
+            # IMAP cleanup and portal navigation are independent, so overlap them.
+            # The IMAP client is blocking, hence the worker thread. A manual OTP needs no mailbox.
+            mark_task = None
+            if not MANUAL_OTP:
+                mark_task = asyncio.create_task(asyncio.to_thread(self.mark_all_as_read))
             
             current_url = page.url
             if self.portal_url not in current_url:
                 logger.info("Opening NIMAR user portal...")
                 await page.goto(self.portal_url)
             await page.wait_for_load_state("networkidle")
+            if mark_task:
+                await mark_task
             
-            credential_entry_wait_str = OTP_CREDENTIAL_ENTRY_WAIT
-            if not credential_entry_wait_str:
-                raise ValueError("OTP_CREDENTIAL_ENTRY_WAIT environment variable is required. Set it in env_variables.py.")
-            credential_entry_wait = int(credential_entry_wait_str)
+            # Fast path: a still-valid session cookie redirects past the login form
+            if "/login" not in page.url and not await self._login_form_visible_async(page):
+                logger.info("Already authenticated — skipping OTP login.")
+                return True
             
             # Wait for login form to be ready
             logger.info("Waiting for login form...")
@@ -339,38 +826,25 @@ class NimarOTPAutomation:
             await page.fill("#password", self.password)
             logger.info("Login credentials entered.")
             
-            # Wait a moment for form validation
-            await page.wait_for_timeout(500)
-            
             # Click the Login button explicitly - wait for it to be enabled
             logger.info("Clicking Login button...")
-            login_button_selectors = [
-                'button[type="submit"]',  # Try submit button first
-                '//button[@type="submit"]',
-                'button:has-text("Login")',
-                '//button[normalize-space()="Login"]',
-            ]
-            
             login_clicked = False
-            for selector in login_button_selectors:
-                try:
-                    login_btn = page.locator(selector).first
-                    # Wait for button to be visible and enabled
-                    await login_btn.wait_for(state="visible", timeout=5000)
-                    # Check if button is enabled (not disabled)
-                    is_disabled = await login_btn.get_attribute("disabled")
-                    if is_disabled is None or is_disabled == "false":
-                        # Wait for any animations/transitions
-                        await page.wait_for_timeout(300)
-                        await login_btn.click()
-                        login_clicked = True
-                        logger.info(f"Login button clicked using selector: {selector[:50]}")
-                        break
-                    else:
-                        logger.warning(f"Login button found but is disabled with selector: {selector[:50]}")
-                except Exception as e:
-                    logger.warning(f"Error with selector {selector[:50]}: {str(e)[:100]}")
-                    continue
+            # All candidates resolve through a single union locator: one wait instead of one per selector
+            login_btn = _union_locator(page, self.LOGIN_BUTTON_SELECTORS).first
+            try:
+                # Wait for button to be visible and enabled
+                await login_btn.wait_for(state="visible", timeout=5000)
+                # Check if button is enabled (not disabled)
+                is_disabled = await login_btn.get_attribute("disabled")
+                if is_disabled is None or is_disabled == "false":
+                    # click() itself waits for the button to be visible, enabled and stable
+                    await login_btn.click()
+                    login_clicked = True
+                    logger.info("Login button clicked.")
+                else:
+                    logger.warning("Login button found but is disabled.")
+            except Exception as e:
+                logger.warning(f"Login button not found: {str(e)[:100]}")
             
             if not login_clicked:
                 # Try submitting the form directly
@@ -402,160 +876,122 @@ class NimarOTPAutomation:
             except Exception:
                 pass
             
-            # Check if we're still on login page or if OTP section appeared
-            max_wait = 10
-            otp_section_found = False
-            for i in range(max_wait):
-                current_url = page.url
-                # Check if URL changed
-                if "/login" not in current_url or current_url != initial_url:
-                    logger.info("Navigation detected (URL changed).")
-                    break
-                
-                # Check if OTP section appeared (even if URL didn't change)
-                try:
-                    # Try to find OTP-related elements
-                    otp_inputs = await page.locator("input[aria-label^='Please enter OTP character']").count()
-                    if otp_inputs > 0:
-                        logger.info("OTP section detected on page.")
-                        otp_section_found = True
-                        break
-                except Exception:
-                    pass
-                
-                # Check for OTP button
-                try:
-                    otp_btn_check = page.locator('button:has-text("OTP"), button[type="button"]:has-text("OTP")').first
-                    if await otp_btn_check.is_visible(timeout=1000):
-                        logger.info("OTP button detected on page.")
-                        otp_section_found = True
-                        break
-                except Exception:
-                    pass
-                
-                await page.wait_for_timeout(1000)
-            
-            # Additional wait to ensure page is ready
-            await page.wait_for_timeout(credential_entry_wait)
-    
-            otp_button_timeout_str = OTP_BUTTON_TIMEOUT
-            if not otp_button_timeout_str:
-                raise ValueError("OTP_BUTTON_TIMEOUT environment variable is required. Set it in env_variables.py.")
-            otp_button_timeout = int(otp_button_timeout_str)
-            
-            # Try multiple selectors for OTP button
-            otp_btn = None
-            otp_selectors = [
-                '//*[@id="portal"]/div/div/div/div[2]/div/button[3]',
-                'button:has-text("OTP")',
-                'button:has-text("Send OTP")',
-                'button:has-text("Request OTP")',
-                '//button[contains(text(), "OTP")]',
-                '//button[contains(@class, "otp")]',
+            # Race the two "login accepted" signals and continue as soon as either fires
+            waiters = [
+                asyncio.create_task(page.wait_for_url(
+                    lambda url: "/login" not in url or url != initial_url, timeout=10000
+                )),
+                asyncio.create_task(page.wait_for_selector(
+                    _OTP_STAGE_SELECTOR, timeout=10000
+                )),
             ]
+            done, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            for waiter in pending:
+                waiter.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if any(waiter.exception() is None for waiter in done):
+                logger.info("Navigation or OTP section detected.")
+            else:
+                logger.warning("No navigation or OTP section detected after login.")
             
-            logger.info(f"Looking for OTP button (timeout: {otp_button_timeout}ms)...")
-            # Use minimum 5 seconds per selector, or divide timeout evenly
-            timeout_per_selector = max(5000, otp_button_timeout // len(otp_selectors))
-            for selector in otp_selectors:
-                try:
-                    logger.info(f"Trying selector: {selector[:50]}...")
-                    otp_btn = await page.wait_for_selector(selector, timeout=timeout_per_selector, state="visible")
-                    if otp_btn:
-                        logger.info(f"Found OTP button using selector: {selector[:50]}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector '{selector[:50]}' not found: {str(e)[:100]}")
-                    continue
+            # Let the post-login requests settle (bounded by the configured entry wait)
+            try:
+                await page.wait_for_load_state("networkidle", timeout=self.credential_entry_wait)
+            except Exception:
+                pass
+            
+            logger.info("Looking for OTP button (timeout: %sms)...", self.otp_button_timeout)
+            otp_btn = await _race_selectors(page, self.OTP_BUTTON_SELECTORS, self.otp_button_timeout)
+            if otp_btn:
+                logger.info("Found OTP button.")
             
             if not otp_btn:
                 # Debug: Take screenshot and show page content
                 logger.error("OTP button not found with any selector.")
                 logger.error(f"Current URL: {page.url}")
-                logger.info("Taking screenshot for debugging...")
-                try:
-                    await page.screenshot(path="otp_button_not_found.png")
-                    logger.info("Screenshot saved as 'otp_button_not_found.png'")
-                except Exception as screenshot_error:
-                    logger.warning(f"Could not take screenshot: {screenshot_error}")
                 
-                # Show available buttons for debugging
-                try:
-                    buttons = await page.locator("button").all()
-                    logger.debug(f"Found {len(buttons)} buttons on the page:")
-                    for i, btn in enumerate(buttons[:10]):  # Show first 10 buttons
-                        try:
-                            text = (await btn.text_content())[:50] if await btn.is_visible() else "[hidden]"
-                            logger.debug(f"  Button {i+1}: {text}")
-                        except:
-                            pass
-                except Exception:
-                    pass
+                # Screenshot and button dump cost disk I/O and browser round-trips,
+                # so they only run with LOG_LEVEL=DEBUG
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Taking screenshot for debugging...")
+                    try:
+                        await page.screenshot(path="otp_button_not_found.png")
+                        logger.debug("Screenshot saved as 'otp_button_not_found.png'")
+                    except Exception as screenshot_error:
+                        logger.warning(f"Could not take screenshot: {screenshot_error}")
+                    
+                    try:
+                        self._log_button_dump(await page.evaluate(_BUTTON_DUMP_JS))
+                    except Exception:
+                        pass
                 
-                raise Exception("OTP button not found. Check screenshot for page state.")
+                raise Exception("OTP button not found. Set LOG_LEVEL=DEBUG for a screenshot of the page state.")
             
             await otp_btn.click()
             logger.info("OTP request initiated.")
     
             otp_request_time = datetime.datetime.now(datetime.UTC)
             logger.info("OTP requested. Waiting for email delivery...")
-    
-            otp_email_wait_time_str = OTP_EMAIL_WAIT_TIME
-            if not otp_email_wait_time_str:
-                raise ValueError("OTP_EMAIL_WAIT_TIME environment variable is required. Set it in env_variables.py.")
-            otp_email_wait_time = int(otp_email_wait_time_str)
-            await page.wait_for_timeout(otp_email_wait_time)
-    
+            
+            # Poll the inbox in a worker thread (IDLE wakes it on delivery) while the
+            # page renders the OTP inputs; no fixed email-delivery sleep is needed
+            otp_task = None
+            if not MANUAL_OTP:
+                otp_task = asyncio.create_task(
+                    asyncio.to_thread(self.get_latest_otp_after_request, otp_request_time)
+                )
+            try:
+                await page.locator(_OTP_INPUT_SELECTOR).nth(5).wait_for(
+                    state="attached", timeout=self.otp_email_wait_time
+                )
+            except Exception:
+                pass
+            
             # Check if manual OTP is provided, otherwise retrieve from email
             if MANUAL_OTP:
-                otp = MANUAL_OTP.strip()
-                logger.info(f"✅ Using manual OTP: {otp}")
+                otp = self._manual_otp()
             else:
-                otp = self.get_latest_otp_after_request(otp_request_time)
+                otp = await otp_task
                 if not otp:
                     logger.error("❌ OTP retrieval failed. Exiting login sequence.")
                     return False
     
-            otp_inputs = await page.query_selector_all("input[aria-label^='Please enter OTP character']")
-            if len(otp_inputs) == 6:
-                otp_input_delay_str = OTP_INPUT_DELAY
-                if not otp_input_delay_str:
-                    raise ValueError("OTP_INPUT_DELAY environment variable is required. Set it in env_variables.py.")
-                otp_input_delay = int(otp_input_delay_str)
-                
-                for i, digit in enumerate(otp):
-                    await otp_inputs[i].fill(digit)
-                    await page.wait_for_timeout(otp_input_delay)
+            otp_input_count = await page.locator(_OTP_INPUT_SELECTOR).count()
+            if otp_input_count == 6:
+                await self._fill_otp_async(page, otp)
                 
+                # The full timeout only covers the button appearing; the click itself
+                # gets a short budget before escalating to a forced click
+                verify_btn = page.locator(self.VERIFY_OTP_SELECTOR)
+                await verify_btn.wait_for(state="attached", timeout=self.otp_verify_button_timeout)
                 try:
-                    otp_verify_button_timeout_str = OTP_VERIFY_BUTTON_TIMEOUT
-                    if not otp_verify_button_timeout_str:
-                        raise ValueError("OTP_VERIFY_BUTTON_TIMEOUT environment variable is required. Set it in env_variables.py.")
-                    otp_verify_button_timeout = int(otp_verify_button_timeout_str)
-                    verify_btn = await page.wait_for_selector(
-                        "//button[normalize-space()='Verify OTP']", timeout=otp_verify_button_timeout
-                    )
-                    await verify_btn.click()
+                    await verify_btn.click(timeout=_VERIFY_CLICK_TIMEOUT_MS)
                     logger.info("OTP verified.")
                 except Exception:
-                    verify_btn = await page.query_selector("//button[normalize-space()='Verify OTP']")
-                    await page.evaluate("(el) => el.click()", verify_btn)
-                    logger.warning("Used JavaScript fallback click for Verify OTP.")
+                    await verify_btn.click(force=True, timeout=_VERIFY_CLICK_TIMEOUT_MS)
+                    logger.warning("Used forced click fallback for Verify OTP.")
             else:
                 logger.error("OTP input fields missing or incorrect.")
                 return False
     
-            otp_login_complete_wait_str = OTP_LOGIN_COMPLETE_WAIT
-            if not otp_login_complete_wait_str:
-                raise ValueError("OTP_LOGIN_COMPLETE_WAIT environment variable is required. Set it in env_variables.py.")
-            otp_login_complete_wait = int(otp_login_complete_wait_str)
-            await page.wait_for_timeout(otp_login_complete_wait)
+            # Done as soon as the portal leaves the login page and its requests settle,
+            # both bounded by the configured wait (no fixed sleep)
+            settle_deadline = time.monotonic() + self.otp_login_complete_wait / 1000
+            try:
+                await page.wait_for_url(lambda url: "/login" not in url, timeout=self.otp_login_complete_wait)
+                remaining_ms = max(1, (settle_deadline - time.monotonic()) * 1000)  # 0 would mean no timeout
+                await page.wait_for_load_state("networkidle", timeout=remaining_ms)
+            except Exception:
+                pass
+            await self._save_session_state_async(page)
             logger.info("Login flow complete.")
             return True
             
         except Exception as e:
             logger.error(f"Login failed: {e}")
             return False
+        finally:
+            self.close_mail()
     
     def login_sync(self, page) -> bool:
         """
@@ -568,17 +1004,11 @@ class NimarOTPAutomation:
             bool: True if login successful, False otherwise
         """
         try:
-            # Log credentials being used
-            logger.info("=" * 60)
-            logger.info("🔐 LOGIN CREDENTIALS BEING USED:")
-            logger.info(f"   Portal URL: {self.portal_url}")
-            logger.info(f"   Username: {self.username}")
-            logger.info(f"   Password: {'*' * len(self.password) if self.password else 'NOT SET'}")
-            logger.info(f"   Email User: {self.email_user}")
-            logger.info(f"   Email Server: {self.mail_server}")
-            logger.info("=" * 60)
-            
-            self.mark_all_as_read()
+            self._log_credentials()
+            
+            # A manual OTP needs no mailbox, so skip the IMAP login entirely
+            if not MANUAL_OTP:
+                self.mark_all_as_read()
             
             current_url = page.url
             if self.portal_url not in current_url:
@@ -586,10 +1016,10 @@ class NimarOTPAutomation:
                 page.goto(self.portal_url)
                 page.wait_for_load_state("networkidle")
             
-            credential_entry_wait_str = OTP_CREDENTIAL_ENTRY_WAIT
-            if not credential_entry_wait_str:
-                raise ValueError("OTP_CREDENTIAL_ENTRY_WAIT environment variable is required. Set it in env_variables.py.")
-            credential_entry_wait = int(credential_entry_wait_str) / 1000
+            # Fast path: a still-valid session cookie redirects past the login form
+            if "/login" not in page.url and not self._login_form_visible_sync(page):
+                logger.info("Already authenticated — skipping OTP login.")
+                return True
             
             # Wait for login form to be ready
             logger.info("Waiting for login form...")
@@ -600,38 +1030,25 @@ class NimarOTPAutomation:
             page.fill("#password", self.password)
             logger.info("Login credentials entered.")
             
-            # Wait a moment for form validation
-            time.sleep(0.5)
-            
             # Click the Login button explicitly - wait for it to be enabled
             logger.info("Clicking Login button...")
-            login_button_selectors = [
-                'button[type="submit"]',  # Try submit button first
-                '//button[@type="submit"]',
-                'button:has-text("Login")',
-                '//button[normalize-space()="Login"]',
-            ]
-            
             login_clicked = False
-            for selector in login_button_selectors:
-                try:
-                    login_btn = page.locator(selector).first
-                    # Wait for button to be visible and enabled
-                    login_btn.wait_for(state="visible", timeout=5000)
-                    # Check if button is enabled (not disabled)
-                    is_disabled = login_btn.get_attribute("disabled")
-                    if is_disabled is None or is_disabled == "false":
-                        # Wait for any animations/transitions
-                        time.sleep(0.3)
-                        login_btn.click()
-                        login_clicked = True
-                        logger.info(f"Login button clicked using selector: {selector[:50]}")
-                        break
-                    else:
-                        logger.warning(f"Login button found but is disabled with selector: {selector[:50]}")
-                except Exception as e:
-                    logger.warning(f"Error with selector {selector[:50]}: {str(e)[:100]}")
-                    continue
+            # All candidates resolve through a single union locator: one wait instead of one per selector
+            login_btn = _union_locator(page, self.LOGIN_BUTTON_SELECTORS).first
+            try:
+                # Wait for button to be visible and enabled
+                login_btn.wait_for(state="visible", timeout=5000)
+                # Check if button is enabled (not disabled)
+                is_disabled = login_btn.get_attribute("disabled")
+                if is_disabled is None or is_disabled == "false":
+                    # click() itself waits for the button to be visible, enabled and stable
+                    login_btn.click()
+                    login_clicked = True
+                    logger.info("Login button clicked.")
+                else:
+                    logger.warning("Login button found but is disabled.")
+            except Exception as e:
+                logger.warning(f"Login button not found: {str(e)[:100]}")
             
             if not login_clicked:
                 # Try submitting the form directly
@@ -663,97 +1080,50 @@ class NimarOTPAutomation:
             except Exception:
                 pass
             
-            # Check if we're still on login page or if OTP section appeared
-            max_wait = 10
-            otp_section_found = False
-            for i in range(max_wait):
-                current_url = page.url
-                # Check if URL changed
-                if "/login" not in current_url or current_url != initial_url:
-                    logger.info("Navigation detected (URL changed).")
-                    break
-                
-                # Check if OTP section appeared (even if URL didn't change)
-                try:
-                    # Try to find OTP-related elements
-                    otp_inputs = page.locator("input[aria-label^='Please enter OTP character']").count()
-                    if otp_inputs > 0:
-                        logger.info("OTP section detected on page.")
-                        otp_section_found = True
-                        break
-                except Exception:
-                    pass
-                
-                # Check for OTP button
-                try:
-                    otp_btn_check = page.locator('button:has-text("OTP"), button[type="button"]:has-text("OTP")').first
-                    if otp_btn_check.is_visible(timeout=1000):
-                        logger.info("OTP button detected on page.")
-                        otp_section_found = True
-                        break
-                except Exception:
-                    pass
-                
-                time.sleep(1)
-            
-            # Additional wait to ensure page is ready
-            time.sleep(credential_entry_wait)
-            
-            otp_button_timeout_str = OTP_BUTTON_TIMEOUT
-            if not otp_button_timeout_str:
-                raise ValueError("OTP_BUTTON_TIMEOUT environment variable is required. Set it in env_variables.py.")
-            otp_button_timeout = int(otp_button_timeout_str)
-            
-            # Try multiple selectors for OTP button
-            otp_btn = None
-            otp_selectors = [
-                '//*[@id="portal"]/div/div/div/div[2]/div/button[3]',
-                'button:has-text("OTP")',
-                'button:has-text("Send OTP")',
-                'button:has-text("Request OTP")',
-                '//button[contains(text(), "OTP")]',
-                '//button[contains(@class, "otp")]',
-            ]
+            # Wait in-page until the URL changes or the OTP section shows up
+            try:
+                page.wait_for_function(_LOGIN_ACCEPTED_JS, arg=[initial_url, _OTP_INPUT_SELECTOR], timeout=10000)
+                logger.info("Navigation or OTP section detected.")
+            except Exception as e:
+                logger.warning("No navigation or OTP section detected after login: %.100s", e)
             
-            logger.info(f"Looking for OTP button (timeout: {otp_button_timeout}ms)...")
-            # Use minimum 5 seconds per selector, or divide timeout evenly
-            timeout_per_selector = max(5000, otp_button_timeout // len(otp_selectors))
-            for selector in otp_selectors:
-                try:
-                    logger.info(f"Trying selector: {selector[:50]}...")
-                    otp_btn = page.wait_for_selector(selector, timeout=timeout_per_selector, state="visible")
-                    if otp_btn:
-                        logger.info(f"Found OTP button using selector: {selector[:50]}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector '{selector[:50]}' not found: {str(e)[:100]}")
-                    continue
+            # Let the post-login requests settle (bounded by the configured entry wait)
+            try:
+                page.wait_for_load_state("networkidle", timeout=self.credential_entry_wait)
+            except Exception:
+                pass
+            
+            logger.info("Looking for OTP button (timeout: %sms)...", self.otp_button_timeout)
+            # Visible matches only, like _race_selectors() on the async path
+            otp_btn = _union_locator(page, self.OTP_BUTTON_SELECTORS, visible_only=True).first
+            try:
+                otp_btn.wait_for(state="visible", timeout=self.otp_button_timeout)
+                logger.info("Found OTP button.")
+            except Exception as e:
+                logger.debug("OTP button selectors not found: %.100s", e)
+                otp_btn = None
             
             if not otp_btn:
                 # Debug: Take screenshot and show page content
                 logger.error("OTP button not found with any selector.")
                 logger.error(f"Current URL: {page.url}")
-                logger.info("Taking screenshot for debugging...")
-                try:
-                    page.screenshot(path="otp_button_not_found.png")
-                    logger.info("Screenshot saved as 'otp_button_not_found.png'")
-                except Exception as screenshot_error:
-                    logger.warning(f"Could not take screenshot: {screenshot_error}")
                 
-                # Show available buttons for debugging
-                try:
-                    buttons = page.locator("button").all()
-                    logger.debug(f"Found {len(buttons)} buttons on the page:")
-                    for i, btn in enumerate(buttons[:10]):  # Show first 10 buttons
-                        try:
-                            text = btn.text_content()[:50] if btn.is_visible() else "[hidden]"
-                            logger.debug(f"  Button {i+1}: {text}")
-                        except:
-                            pass
-                except Exception:
-                    pass
+                # Screenshot and button dump cost disk I/O and browser round-trips,
+                # so they only run with LOG_LEVEL=DEBUG
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Taking screenshot for debugging...")
+                    try:
+                        page.screenshot(path="otp_button_not_found.png")
+                        logger.debug("Screenshot saved as 'otp_button_not_found.png'")
+                    except Exception as screenshot_error:
+                        logger.warning(f"Could not take screenshot: {screenshot_error}")
+                    
+                    try:
+                        self._log_button_dump(page.evaluate(_BUTTON_DUMP_JS))
+                    except Exception:
+                        pass
                 
-                raise Exception("OTP button not found. Check screenshot for page state.")
+                raise Exception("OTP button not found. Set LOG_LEVEL=DEBUG for a screenshot of the page state.")
             
             otp_btn.click()
             logger.info("OTP request initiated.")
@@ -761,60 +1131,60 @@ class NimarOTPAutomation:
             otp_request_time = datetime.datetime.now(datetime.UTC)
             logger.info("OTP requested. Waiting for email delivery...")
             
-            otp_email_wait_time_str = OTP_EMAIL_WAIT_TIME
-            if not otp_email_wait_time_str:
-                raise ValueError("OTP_EMAIL_WAIT_TIME environment variable is required. Set it in env_variables.py.")
-            otp_email_wait_time = int(otp_email_wait_time_str) / 1000
-            time.sleep(otp_email_wait_time)
+            # Wait for the OTP inputs instead of a fixed email-delivery sleep; the IMAP
+            # poll below blocks in IDLE until the mail actually arrives
+            try:
+                page.locator(_OTP_INPUT_SELECTOR).nth(5).wait_for(
+                    state="attached", timeout=self.otp_email_wait_time
+                )
+            except Exception:
+                pass
             
             # Check if manual OTP is provided, otherwise retrieve from email
             if MANUAL_OTP:
-                otp = MANUAL_OTP.strip()
-                logger.info(f"✅ Using manual OTP: {otp}")
+                otp = self._manual_otp()
             else:
                 otp = self.get_latest_otp_after_request(otp_request_time)
                 if not otp:
                     logger.error("❌ OTP retrieval failed. Exiting login sequence.")
                     return False
             
-            otp_inputs = page.locator("input[aria-label^='Please enter OTP character']").all()
-            if len(otp_inputs) == 6:
-                otp_input_delay_str = OTP_INPUT_DELAY
-                if not otp_input_delay_str:
-                    raise ValueError("OTP_INPUT_DELAY environment variable is required. Set it in env_variables.py.")
-                otp_input_delay = int(otp_input_delay_str) / 1000
-                for i, digit in enumerate(otp):
-                    otp_inputs[i].fill(digit)
-                    time.sleep(otp_input_delay)
+            otp_input_count = page.locator(_OTP_INPUT_SELECTOR).count()
+            if otp_input_count == 6:
+                self._fill_otp_sync(page, otp)
                 
+                # The full timeout only covers the button appearing; the click itself
+                # gets a short budget before escalating to a forced click
+                verify_btn = page.locator(self.VERIFY_OTP_SELECTOR)
+                verify_btn.wait_for(state="attached", timeout=self.otp_verify_button_timeout)
                 try:
-                    verify_btn = page.locator("//button[normalize-space()='Verify OTP']")
-                    otp_verify_button_timeout_str = OTP_VERIFY_BUTTON_TIMEOUT
-                    if not otp_verify_button_timeout_str:
-                        raise ValueError("OTP_VERIFY_BUTTON_TIMEOUT environment variable is required. Set it in env_variables.py.")
-                    otp_verify_button_timeout = int(otp_verify_button_timeout_str)
-                    verify_btn.wait_for(state="visible", timeout=otp_verify_button_timeout)
-                    verify_btn.click()
+                    verify_btn.click(timeout=_VERIFY_CLICK_TIMEOUT_MS)
                     logger.info("OTP verified.")
                 except Exception:
-                    verify_btn = page.locator("//button[normalize-space()='Verify OTP']")
-                    verify_btn.click(force=True)
-                    logger.warning("Used JavaScript fallback click for Verify OTP.")
+                    verify_btn.click(force=True, timeout=_VERIFY_CLICK_TIMEOUT_MS)
+                    logger.warning("Used forced click fallback for Verify OTP.")
             else:
                 logger.error("OTP input fields missing or incorrect.")
                 return False
             
-            otp_login_complete_wait_str = OTP_LOGIN_COMPLETE_WAIT
-            if not otp_login_complete_wait_str:
-                raise ValueError("OTP_LOGIN_COMPLETE_WAIT environment variable is required. Set it in env_variables.py.")
-            otp_login_complete_wait = int(otp_login_complete_wait_str) / 1000
-            time.sleep(otp_login_complete_wait)
+            # Done as soon as the portal leaves the login page and its requests settle,
+            # both bounded by the configured wait (no fixed sleep)
+            settle_deadline = time.monotonic() + self.otp_login_complete_wait / 1000
+            try:
+                page.wait_for_url(lambda url: "/login" not in url, timeout=self.otp_login_complete_wait)
+                remaining_ms = max(1, (settle_deadline - time.monotonic()) * 1000)  # 0 would mean no timeout
+                page.wait_for_load_state("networkidle", timeout=remaining_ms)
+            except Exception:
+                pass
+            self._save_session_state_sync(page)
             logger.info("Login flow complete.")
             return True
             
         except Exception as e:
             logger.error(f"Login failed: {e}")
             return False
+        finally:
+            self.close_mail()
     
     async def login_with_otp_async(self, page, email_user=None, email_pass=None, 
                                    portal_url=None, username=None, password=None):
@@ -847,14 +1217,28 @@ class NimarOTPAutomation:
         
         return await self.login_async(page)
     
+    @classmethod
+    async def get_shared_browser(cls):
+        """
+        Return the process-wide Chromium instance, launching it on first use.
+        
+        Callers create their own contexts on it ("one browser, many contexts"),
+        so repeat runs skip the Chromium cold start.
+        
+        Returns:
+            Browser: Playwright async Browser object
+        """
+        async with _warm_lock:
+            return await _ensure_shared_browser()
+    
     async def run(self):
         """
         Execute the complete OTP login automation workflow.
         
         This method orchestrates the entire login process:
-        - Initializes browser
+        - Opens a new context on the shared browser (see get_shared_browser)
         - Performs login
-        - Closes browser
+        - Closes the context (the browser stays up for the next run)
         
         Returns:
             bool: True if login successful, False otherwise
@@ -864,53 +1248,101 @@ class NimarOTPAutomation:
             >>> await automation.run()
         """
         try:
-            async with async_playwright() as p:
-                launch_args = [
-                    "--ignore-certificate-errors",
-                    "--ignore-ssl-errors",
-                    "--disable-web-security",
-                    "--no-proxy-server",
-                    "--start-maximized"
-                ]
-                
-                # BROWSER_HEADLESS, BROWSER_IGNORE_HTTPS_ERRORS, and BROWSER_NO_VIEWPORT are booleans
-                # from env_variables.py (they have defaults and can be False)
-                browser_headless = BROWSER_HEADLESS
-                browser_ignore_https = BROWSER_IGNORE_HTTPS_ERRORS
-                browser_no_viewport = BROWSER_NO_VIEWPORT
-                
-                browser = await p.chromium.launch(headless=browser_headless, args=launch_args)
-                context = await browser.new_context(
-                    ignore_https_errors=browser_ignore_https,
-                    no_viewport=browser_no_viewport,
-                    viewport=None
-                )
-                page = await context.new_page()
-                
-                success = await self.login_async(page)
-                
-                if success:
-                    logger.info("Login flow complete. Closing browser...")
-                else:
-                    logger.error("Login failed. Closing browser...")
-                
-                try:
-                    if not page.is_closed():
-                        otp_login_complete_wait_str = OTP_LOGIN_COMPLETE_WAIT
-                        if otp_login_complete_wait_str:
-                            otp_login_complete_wait = int(otp_login_complete_wait_str)
-                            await page.wait_for_timeout(otp_login_complete_wait)
-                    await browser.close()
-                except Exception as e:
-                    logger.warning(f"Browser close exception: {e}")
-                
-                return success
+            # One shared Chromium process; each run only gets a fresh context
+            browser = await self.get_shared_browser()
+            context = await browser.new_context(
+                ignore_https_errors=BROWSER_IGNORE_HTTPS_ERRORS,
+                no_viewport=BROWSER_NO_VIEWPORT,
+                viewport=None
+            )
+            await context.route("**/*", _block_heavy_resources)
+            page = await context.new_page()
+            
+            success = await self.login_async(page)
+            
+            if success:
+                logger.info("Login flow complete. Closing browser context...")
+            else:
+                logger.error("Login failed. Closing browser context...")
+            
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Browser context close exception: {e}")
+            
+            return success
         except Exception as e:
             logger.error(f"Error during automation: {e}")
             return False
 
 
-async def login_with_otp_async(page, email_user=None, email_pass=None, portal_url=None, username=None, password=None):
+# Browser shared by NimarOTPAutomation.run() and by every login_with_otp_async()
+# call made without a page. Launching Chromium dominates login time; the warm
+# context used by get_warm_page() also keeps its cookie jar between logins.
+_pw = None
+_browser = None
+_context = None
+_warm_lock = asyncio.Lock()
+
+
+async def _ensure_shared_browser():
+    """
+    Launch the shared browser if needed. Caller must hold _warm_lock.
+    
+    Returns:
+        Browser: Playwright async Browser object
+    """
+    global _pw, _browser
+    if _browser is None:
+        _pw = await async_playwright().start()
+        _browser = await _pw.chromium.launch(headless=BROWSER_HEADLESS, args=_LAUNCH_ARGS)
+    return _browser
+
+
+async def get_warm_page() -> Page:
+    """
+    Return a new page from the shared, lazily-launched browser context.
+    
+    The first call starts Playwright and launches Chromium, restoring the
+    session saved by the last successful login; later calls only open a new
+    tab in the same context.
+    
+    Returns:
+        Page: Playwright async Page object
+    """
+    global _context
+    async with _warm_lock:
+        if _context is None:
+            browser = await _ensure_shared_browser()
+            _context = await browser.new_context(
+                ignore_https_errors=BROWSER_IGNORE_HTTPS_ERRORS,
+                no_viewport=BROWSER_NO_VIEWPORT,
+                viewport=None,
+                storage_state=SESSION_STATE_FILE if os.path.exists(SESSION_STATE_FILE) else None
+            )
+    return await _context.new_page()
+
+
+async def close_warm_browser():
+    """
+    Close the shared browser started by get_warm_page() / run(), if any.
+    
+    Must be awaited on the same event loop that created the browser.
+    """
+    global _pw, _browser, _context
+    async with _warm_lock:
+        try:
+            if _browser:
+                await _browser.close()
+            if _pw:
+                await _pw.stop()
+        except Exception as e:
+            logger.warning(f"Error closing warm browser: {e}")
+        finally:
+            _pw = _browser = _context = None
+
+
+async def login_with_otp_async(page=None, email_user=None, email_pass=None, portal_url=None, username=None, password=None):
     """
     Performs OTP-based login on an existing Playwright page (async version).
     
@@ -918,7 +1350,8 @@ async def login_with_otp_async(page, email_user=None, email_pass=None, portal_ur
     It creates a NimarOTPAutomation instance and calls its method.
     
     Args:
-        page: Playwright async Page object (from async_playwright)
+        page: Playwright async Page object (from async_playwright). If None, a page
+              from the shared warm browser (get_warm_page) is used
         email_user (str, optional): Gmail email address. If None, loaded from env_variables.py
         email_pass (str, optional): Gmail app password. If None, loaded from env_variables.py
         portal_url (str, optional): Portal URL. If None, loaded from env_variables.py
@@ -928,6 +1361,8 @@ async def login_with_otp_async(page, email_user=None, email_pass=None, portal_ur
     Returns:
         bool: True if login successful, False otherwise
     """
+    if page is None:
+        page = await get_warm_page()
     automation = NimarOTPAutomation()
     return await automation.login_with_otp_async(page, email_user, email_pass, portal_url, username, password)
 
@@ -966,6 +1401,17 @@ if __name__ == "__main__":
     async def run_automation():
         """Main entry point for standalone script execution."""
         automation = NimarOTPAutomation()
-        await automation.run()
+        try:
+            await automation.run()
+        finally:
+            await close_warm_browser()
+    
+    # uvloop speeds up the asyncio loop pumping Playwright's protocol messages;
+    # it is optional (and unavailable on Windows), so fall back to the stdlib loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     asyncio.run(run_automation())
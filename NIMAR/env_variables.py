@@ -7,10 +7,13 @@ from dotenv import load_dotenv
 # This is important on Windows where USERNAME is a system variable
 load_dotenv(override=True)
 
+# Snapshot the environment once; every constant below is parsed from it at import
+_ENV = dict(os.environ)
+
 
 def _get_bool(key: str, default: bool = False) -> bool:
     """Convert environment variable to boolean."""
-    value = os.getenv(key)
+    value = _ENV.get(key)
     if value is None:
         return default
     return str(value).lower() in ('true', '1', 'yes', 'on')
@@ -18,7 +21,7 @@ def _get_bool(key: str, default: bool = False) -> bool:
 
 def _get_int(key: str, default: int = None) -> int:
     """Convert environment variable to integer."""
-    value = os.getenv(key)
+    value = _ENV.get(key)
     if value is None:
         return default
     try:
@@ -29,7 +32,7 @@ def _get_int(key: str, default: int = None) -> int:
 
 def _get_float(key: str, default: float = None) -> float:
     """Convert environment variable to float."""
-    value = os.getenv(key)
+    value = _ENV.get(key)
     if value is None:
         return default
     try:
@@ -39,14 +42,14 @@ def _get_float(key: str, default: float = None) -> float:
 
 
 # --- Portal / App Credentials [ALL] ---
-PORTAL_URL = os.getenv('PORTAL_URL')
-USERNAME = os.getenv('USERNAME')
-PASSWORD = os.getenv('PASSWORD')
+PORTAL_URL = _ENV.get('PORTAL_URL')
+USERNAME = _ENV.get('USERNAME')
+PASSWORD = _ENV.get('PASSWORD')
 
 # --- Email (Gmail IMAP) [ALL] ---
-EMAIL_USER = os.getenv('EMAIL_USER')
-EMAIL_PASS = os.getenv('EMAIL_PASS')
-EMAIL_SERVER = os.getenv('EMAIL_SERVER')
+EMAIL_USER = _ENV.get('EMAIL_USER')
+EMAIL_PASS = _ENV.get('EMAIL_PASS')
+EMAIL_SERVER = _ENV.get('EMAIL_SERVER')
 
 # --- Browser Settings [ALL] ---
 BROWSER_HEADLESS = _get_bool('BROWSER_HEADLESS', False)
@@ -62,8 +65,14 @@ OTP_VERIFY_BUTTON_TIMEOUT = _get_int('OTP_VERIFY_BUTTON_TIMEOUT', 8000)
 OTP_LOGIN_COMPLETE_WAIT = _get_int('OTP_LOGIN_COMPLETE_WAIT', 3000)
 OTP_RETRIES = _get_int('OTP_RETRIES', 15)
 OTP_DELAY = _get_int('OTP_DELAY', 5)
+# Seconds variants for time.sleep() callers, computed once
+OTP_INPUT_DELAY_SECONDS = OTP_INPUT_DELAY / 1000
 # Manual OTP (if set, will use this instead of retrieving from email)
-MANUAL_OTP = os.getenv('MANUAL_OTP')
+MANUAL_OTP = _ENV.get('MANUAL_OTP')
+# OTP sender address (if set, IMAP search is restricted to mails from this sender)
+OTP_EMAIL_SENDER = _ENV.get('OTP_EMAIL_SENDER')
+# OTP subject text (if set, IMAP search is also restricted to mails whose subject contains it)
+OTP_EMAIL_SUBJECT = _ENV.get('OTP_EMAIL_SUBJECT')
 
 # --- Upload Workflow Timings [UPLOAD, VALIDATION] ---
 WAIT_TIMEOUT = _get_int('WAIT_TIMEOUT', 20)
@@ -93,39 +102,40 @@ CLICK_PORTAL_START_UPLOAD_MAX_RETRIES = _get_int('CLICK_PORTAL_START_UPLOAD_MAX_
 START_UPLOAD_ENABLED_CHECK_MAX_ATTEMPTS = _get_int('START_UPLOAD_ENABLED_CHECK_MAX_ATTEMPTS', 10)
 
 # --- File Upload Paths [UPLOAD] ---
-DESKTOP_FOLDER = os.getenv('DESKTOP_FOLDER')
-ZIP_FILE = os.getenv('ZIP_FILE')
-DESKTOP_PATH = os.getenv('DESKTOP_PATH')
-DOWNLOADS_FOLDER = os.getenv('DOWNLOADS_FOLDER', 'Downloads')
+DESKTOP_FOLDER = _ENV.get('DESKTOP_FOLDER')
+ZIP_FILE = _ENV.get('ZIP_FILE')
+DESKTOP_PATH = _ENV.get('DESKTOP_PATH')
+DOWNLOADS_FOLDER = _ENV.get('DOWNLOADS_FOLDER', 'Downloads')
 
 # --- Circle Name [UPLOAD, VALIDATION] ---
-CIRCLE_NAME = os.getenv('CIRCLE_NAME')
+CIRCLE_NAME = _ENV.get('CIRCLE_NAME')
 
 # --- Metadata Form Fields [UPLOAD, VALIDATION] ---
-POST_TITLE = os.getenv('POST_TITLE')
-CONTENT_TITLE = os.getenv('CONTENT_TITLE')
-DESCRIPTION = os.getenv('DESCRIPTION')
-KEYWORDS = os.getenv('KEYWORDS')
+POST_TITLE = _ENV.get('POST_TITLE')
+CONTENT_TITLE = _ENV.get('CONTENT_TITLE')
+DESCRIPTION = _ENV.get('DESCRIPTION')
+KEYWORDS = _ENV.get('KEYWORDS')
 
 # --- Validation Script Settings [VALIDATION] ---
-FILE_URL_1 = os.getenv('FILE_URL_1')
-FILE_URL_2 = os.getenv('FILE_URL_2')
-FILE_URL_3 = os.getenv('FILE_URL_3')
-S3_BUCKET_URL = os.getenv('S3_BUCKET_URL')
+FILE_URL_1 = _ENV.get('FILE_URL_1')
+FILE_URL_2 = _ENV.get('FILE_URL_2')
+FILE_URL_3 = _ENV.get('FILE_URL_3')
+S3_BUCKET_URL = _ENV.get('S3_BUCKET_URL')
 
 # --- Logging [ALL] ---
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVEL = _ENV.get('LOG_LEVEL', 'INFO')
 
 # --- Live Stream Settings [LIVE] ---
 LIVE_USE_SYSTEM_CHROME = _get_bool('LIVE_USE_SYSTEM_CHROME', True)
 LIVE_BROWSER_HEADLESS = _get_bool('LIVE_BROWSER_HEADLESS', False)
 LIVE_USE_CHROME_CHANNEL = _get_bool('LIVE_USE_CHROME_CHANNEL', False)
+LIVE_BLOCK_HEAVY_RESOURCES = _get_bool('LIVE_BLOCK_HEAVY_RESOURCES', True)
 WAIT_AFTER_GET_STREAM = _get_int('WAIT_AFTER_GET_STREAM', 5)
 
 # --- Elastic Search & Advanced Search Settings [ELASTIC_SEARCH] ---
 ELASTIC_SEARCH_FUZZY_THRESHOLD = _get_int('ELASTIC_SEARCH_FUZZY_THRESHOLD', 70)
-ELASTIC_SEARCH_NOISE_WORDS = os.getenv('ELASTIC_SEARCH_NOISE_WORDS')
+ELASTIC_SEARCH_NOISE_WORDS = _ENV.get('ELASTIC_SEARCH_NOISE_WORDS')
 ELASTIC_SEARCH_PAGE_LOAD_TIMEOUT = _get_int('ELASTIC_SEARCH_PAGE_LOAD_TIMEOUT', 20000)
 ELASTIC_SEARCH_ELEMENT_WAIT_TIMEOUT = _get_int('ELASTIC_SEARCH_ELEMENT_WAIT_TIMEOUT', 10000)
 ELASTIC_SEARCH_SCROLL_PAUSE_TIME = _get_int('ELASTIC_SEARCH_SCROLL_PAUSE_TIME', 500)
-ELASTIC_SEARCH_DEFAULT_KEYWORD = os.getenv('ELASTIC_SEARCH_DEFAULT_KEYWORD', 'news')
+ELASTIC_SEARCH_DEFAULT_KEYWORD = _ENV.get('ELASTIC_SEARCH_DEFAULT_KEYWORD', 'news')
@@ -79,19 +79,35 @@
     Date: 2025-11-10
 =======================================================================
 """
-import re
 import time
 import uuid
+import functools
+import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Tuple, List
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 
-from NIMAR.auth.otp import login_with_otp_sync
+from NIMAR.auth.otp import login_with_otp_sync, SESSION_STATE_FILE
+from NIMAR.logging_config import setup_logging
 
 # Import environment variables
 from NIMAR.env_variables import (
     PORTAL_URL,
+    USERNAME,
+    PASSWORD,
+    EMAIL_USER,
+    EMAIL_PASS,
+    EMAIL_SERVER,
+    OTP_CREDENTIAL_ENTRY_WAIT,
+    OTP_BUTTON_TIMEOUT,
+    OTP_EMAIL_WAIT_TIME,
+    OTP_INPUT_DELAY,
+    OTP_VERIFY_BUTTON_TIMEOUT,
+    OTP_LOGIN_COMPLETE_WAIT,
+    OTP_RETRIES,
+    OTP_DELAY,
     BROWSER_HEADLESS,
     BROWSER_IGNORE_HTTPS_ERRORS,
     BROWSER_NO_VIEWPORT,
@@ -101,9 +117,646 @@ from NIMAR.env_variables import (
     LIVE_BROWSER_HEADLESS,
     LIVE_USE_SYSTEM_CHROME,
     LIVE_USE_CHROME_CHANNEL,
+    LIVE_BLOCK_HEAVY_RESOURCES,
     LOG_LEVEL
 )
 
+# Progress goes through logging instead of print(): below-level messages are dropped
+# without touching stdout, and the handlers (console + log file) are set up once by
+# setup_logging(LOG_LEVEL). Silent until the application configures logging.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Saved login sessions (written by the OTP login) younger than this are reused, in seconds
+_SESSION_STATE_MAX_AGE = 3600
+
+# Image/font URLs the live browser skips when LIVE_BLOCK_HEAVY_RESOURCES is on. Blocked
+# through CDP Network.setBlockedURLs rather than page routing, because routing turns
+# off the HTTP cache. Stylesheets stay (visibility checks and clicks depend on layout)
+# and so does media (the player)
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _clock_text(sec: int) -> str:
+    """Format whole seconds as M:SS, or H:MM:SS from an hour up."""
+    h, rem = divmod(sec, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
+
+def _fmt_clock(sec) -> str:
+    """Format a video time in seconds like the player does ("0:00" if not a number)."""
+    try:
+        sec = int(float(sec))
+    except (TypeError, ValueError, OverflowError):
+        return "0:00"
+    return _clock_text(sec)
+
+
+# MediaError codes as logged when a started stream fails to load
+_MEDIA_ERROR_DESCRIPTIONS = {
+    1: "MEDIA_ERR_ABORTED: User aborted loading",
+    2: "MEDIA_ERR_NETWORK: Network error while loading",
+    3: "MEDIA_ERR_DECODE: Decoding error",
+    4: "MEDIA_ERR_SRC_NOT_SUPPORTED: Format not supported",
+}
+
+# Seconds of uninterrupted NETWORK_NO_SOURCE after which the stream is taken as absent
+_NO_SOURCE_GRACE_S = 6
+
+# True once the live video is actually playing. While it isn't, the page's player
+# is nudged: play() every 2s once data is buffered, and load()/play() every 20s.
+# Argument: wait start time (epoch ms), so the nudge schedule restarts per wait.
+# A decode/unsupported-source error ends the wait early with {errorCode, error}.
+_VIDEO_PLAYING_JS = """(start) => {
+    const v = window.__nimarGetVideo();
+    if (!v) return false;
+    if (v.error && (v.error.code === 3 || v.error.code === 4)) {
+        return { errorCode: v.error.code, error: v.error.message };
+    }
+    if (!v.paused && !v.ended && v.currentTime > 0 && v.readyState >= 2) return true;
+    let w = window.__nimarPlayWait;
+    if (!w || w.start !== start) w = window.__nimarPlayWait = { start, kicks: 0, playAt: 0 };
+    const now = Date.now();
+    if (v.paused && v.readyState >= 2 && v.buffered.length > 0 && now - w.playAt >= 2000) {
+        w.playAt = now;
+        v.play().catch(e => console.log('Play attempt:', e.name));
+    }
+    const due = Math.floor((now - start) / 20000);
+    if (due > w.kicks) {
+        w.kicks = due;
+        if (v.networkState === 0 || v.networkState === 3) v.load();
+        if (v.paused) v.play().catch(e => console.log('Periodic play attempt:', e.name));
+    }
+    return false;
+}"""
+
+# Installed with page.add_init_script() in run(): pushes a small state snapshot to the
+# reportVideoState binding whenever a <video> changes state (media events don't bubble,
+# so they are caught in the capture phase)
+_VIDEO_STATE_REPORTER_JS = """(() => {
+    const events = ['loadedmetadata', 'canplay', 'playing', 'waiting', 'error'];
+    events.forEach(type => document.addEventListener(type, e => {
+        const v = e.target;
+        // Skip the synthetic events __kickVideo() dispatches
+        if (!e.isTrusted || !(v instanceof HTMLVideoElement) || typeof window.reportVideoState !== 'function') return;
+        window.reportVideoState({
+            event: type,
+            readyState: v.readyState,
+            networkState: v.networkState,
+            paused: v.paused,
+            currentTime: v.currentTime,
+            errorCode: v.error ? v.error.code : null
+        });
+    }, true));
+})();"""
+
+# Page-side helpers installed once with page.add_init_script() in run(), so the hot
+# calls in start_live_stream() and track_live_stream_time() only send the function name:
+#   __nimarGetVideo() - the page's <video> (null if none), cached until it is detached;
+#                       every video script in this module finds the video through it
+#   __findStreamUrl() - stream URL from the page's HLS.js instance, <source> tags or
+#                       data attributes (null if none)
+#   __nimarSnapshot() - plain video state (readyState, networkState, paused, ended,
+#                       currentTime, duration, src, error, errorCode, buffered range);
+#                       callers derive playing/ready/errored from it
+#   __videoState()    - __nimarSnapshot() plus the page's HLS.js state, logged when the
+#                       video didn't start
+#   __collectTimeSamples() - starts buffering [epoch ms, currentTime, duration] samples
+#                       from timeupdate events into __nimarSamples
+#   __watchStreamTime() - logs time-like text ("12:34 / 56:78") found in the page and
+#                       any that appears later, tagged [STREAM_TIME]
+#   __kickVideo()     - fires the media/window events, load() and play() that wake
+#                       up the page's player; run automatically by a MutationObserver
+#                       when a <video> appears or gets a new src
+_PAGE_HELPERS_JS = r"""
+// The page's <video>, looked up again only once the cached one has left the document
+// (a navigation starts a fresh document, and with it a fresh cache)
+window.__nimarVideo = null;
+window.__nimarGetVideo = function () {
+    var v = window.__nimarVideo;
+    if (!v || !v.isConnected) v = window.__nimarVideo = document.querySelector('video');
+    return v;
+};
+
+window.__findStreamUrl = function () {
+    // Check for HLS.js instance
+    if (typeof Hls !== 'undefined') {
+        var videos = document.querySelectorAll('video');
+        for (var i = 0; i < videos.length; i++) {
+            if (videos[i].hls && videos[i].hls.url) return videos[i].hls.url;
+        }
+        // Check window for HLS instances
+        if (window.hlsInstances && window.hlsInstances.length > 0) return window.hlsInstances[0].url;
+    }
+    // Check for video source elements
+    var v = window.__nimarGetVideo();
+    if (v) {
+        var sources = v.querySelectorAll('source');
+        for (var i = 0; i < sources.length; i++) {
+            var src = sources[i].src;
+            if (src && (src.includes('.m3u8') || src.includes('nginx-clipping'))) return src;
+        }
+    }
+    // Check data attributes or hidden inputs
+    var streamInputs = document.querySelectorAll('[data-stream-url], [data-hls-url], input[type="hidden"][value*=".m3u8"]');
+    for (var i = 0; i < streamInputs.length; i++) {
+        var url = streamInputs[i].getAttribute('data-stream-url') ||
+                  streamInputs[i].getAttribute('data-hls-url') ||
+                  streamInputs[i].value;
+        if (url && url.includes('.m3u8')) return url;
+    }
+    return null;
+};
+
+window.__nimarSnapshot = function (v) {
+    v = v || window.__nimarGetVideo();
+    if (!v) return { exists: false };
+    var b = v.buffered;
+    return {
+        exists: true,
+        readyState: v.readyState,
+        networkState: v.networkState,
+        paused: v.paused,
+        ended: v.ended,
+        currentTime: v.currentTime,
+        duration: v.duration,
+        src: v.src || v.currentSrc || 'no src',
+        error: v.error ? v.error.message : null,
+        errorCode: v.error ? v.error.code : null,
+        bufferedStart: b.length ? b.start(0) : null,
+        bufferedEnd: b.length ? b.end(0) : null
+    };
+};
+
+window.__videoState = function () {
+    var v = window.__nimarGetVideo();
+    var state = window.__nimarSnapshot(v);
+    if (!v) return state;
+    var hasPageHLS = !!(v.hls && typeof v.hls.loadSource === 'function');
+    var hlsState = null;
+    if (hasPageHLS) {
+        try { hlsState = v.hls.levels ? v.hls.levels.length : 0; } catch (e) { hlsState = 'unknown'; }
+    }
+    var src = v.src || v.currentSrc || '';
+    state.hasPageHLS = hasPageHLS;
+    state.hlsReady = hasPageHLS && v.hls.media !== null;
+    state.hlsState = hlsState;
+    state.sourceType = src.startsWith('blob:') ? 'blob' : (src.startsWith('http') ? 'http' : 'none');
+    return state;
+};
+
+// Time samples [epoch ms, currentTime, duration] taken on timeupdate whenever the
+// video's whole second changes (at most 32); __collectTimeSamples() clears the buffer
+// and installs the listener once per document
+window.__nimarSamples = [];
+window.__collectTimeSamples = function () {
+    window.__nimarSamples = [];
+    window.__nimarSampleSec = null;
+    if (window.__nimarSampling) return;
+    window.__nimarSampling = true;
+    // timeupdate doesn't bubble, so it is caught in the capture phase
+    document.addEventListener('timeupdate', function (e) {
+        var v = e.target, buf = window.__nimarSamples;
+        var sec = Math.floor(v.currentTime);
+        if (!(v.duration > 0) || sec === window.__nimarSampleSec || buf.length >= 32) return;
+        window.__nimarSampleSec = sec;
+        buf.push([Date.now(), v.currentTime, v.duration]);
+    }, true);
+};
+
+window.__watchStreamTime = function () {
+    const TAG = '[STREAM_TIME]';
+    const seen = new Set();
+    const timePattern = /\b\d{1,2}:\d{2}(?::\d{2})?(\s*\/\s*\d{1,2}:\d{2}(?::\d{2})?)?\b/;
+    // Elements already scanned; the player re-renders the same elements constantly
+    // (attribute changes), and their new text arrives as its own mutations anyway
+    const visited = new WeakSet();
+
+    function addMatch(text, found){
+        const m = text.trim().match(timePattern);
+        if (m && m[0] && !seen.has(m[0])){
+            seen.add(m[0]);
+            found.push(m[0]);
+        }
+    }
+
+    function scanAllTextNodes(root){
+        root = root || document.body;
+        const found = [];
+        if (visited.has(root)) return found;
+        visited.add(root);
+        // One substring scan decides whether the subtree is worth walking at all
+        const text = root.textContent || '';
+        if (!timePattern.test(text)) return found;
+        if (!root.firstElementChild){
+            addMatch(text, found);
+            return found;
+        }
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, null);
+        let node;
+        while ((node = walker.nextNode())){
+            addMatch(node.textContent || '', found);
+        }
+        return found;
+    }
+
+    const initial = scanAllTextNodes(document.body);
+    if (initial.length){
+        console.log(TAG + ' initial: ' + initial.join(', '));
+    }
+
+    if (!window.__streamTimeObserver){
+        window.__streamTimeObserver = new MutationObserver((mutations)=>{
+            let any = false;
+            for (const m of mutations){
+                if (m.type === 'childList'){
+                    m.addedNodes && m.addedNodes.forEach(n=>{
+                        if (n.nodeType === Node.TEXT_NODE){
+                            const t = (n.textContent||'').trim();
+                            const mm = t.match(timePattern);
+                            if (mm && mm[0] && !seen.has(mm[0])){ seen.add(mm[0]); console.log(TAG + ' update: ' + mm[0]); any = true; }
+                        } else if (n.nodeType === Node.ELEMENT_NODE){
+                            const f = scanAllTextNodes(n);
+                            if (f.length){ console.log(TAG + ' update: ' + f.join(', ')); any = true; }
+                        }
+                    });
+                } else if (m.type === 'characterData'){
+                    const t = (m.target && m.target.data || '').trim();
+                    const mm = t.match(timePattern);
+                    if (mm && mm[0] && !seen.has(mm[0])){ seen.add(mm[0]); console.log(TAG + ' update: ' + mm[0]); any = true; }
+                } else if (m.type === 'attributes'){
+                    const el = m.target;
+                    const f = scanAllTextNodes(el);
+                    if (f.length){ console.log(TAG + ' update: ' + f.join(', ')); any = true; }
+                }
+            }
+        });
+        window.__streamTimeObserver.observe(document.body, { subtree: true, childList: true, characterData: true, attributes: true });
+    }
+
+    return initial;
+};
+
+window.__kickVideo = function (v) {
+    v = v || window.__nimarGetVideo();
+    if (v) {
+        // Trigger all video events that might wake up the player
+        ['loadstart', 'loadedmetadata', 'canplay', 'canplaythrough', 'loadeddata', 'play', 'playing'].forEach(function (eventName) {
+            try { v.dispatchEvent(new Event(eventName, { bubbles: true })); } catch (e) {}
+        });
+        // Force load if needed
+        if (v.networkState === 0 || v.networkState === 3) v.load();
+        // Try to play
+        if (v.paused) v.play().catch(function (e) { console.log('Auto-play blocked:', e); });
+    }
+    // Also trigger any window events that might initialize the player
+    try {
+        window.dispatchEvent(new Event('load'));
+        window.dispatchEvent(new Event('DOMContentLoaded'));
+    } catch (e) {}
+};
+
+// Kick each <video> once when it is inserted and again whenever the player gives it a
+// new src, so no round-trip from Python is needed to wake the player up
+new MutationObserver(function () {
+    var v = window.__nimarGetVideo();
+    if (v && v.__nimarKickedSrc !== v.src) {
+        v.__nimarKickedSrc = v.src;
+        window.__kickVideo(v);
+    }
+}).observe(document, { childList: true, subtree: true, attributes: true, attributeFilter: ['src'] });
+"""
+
+# Buttons that may (re)start the page's stream, tried as one union
+_STREAM_BUTTONS_CSS = ", ".join([
+    "button:has-text('Get Stream')",
+    "button:has-text('Load Stream')",
+    "button:has-text('Start Stream')",
+    "button[class*='stream']",
+    "button[id*='stream']",
+])
+
+# Plays the given video muted, up to 3 attempts 2s apart, each waiting (up to 5s) for
+# play() to settle; the play() override installed in run() unmutes it once playback has
+# started. Returns {success, attempt, paused, readyState, error}
+_PLAY_MUTED_JS = """async (v) => {
+    v.muted = true;
+    let error = null;
+    for (let attempt = 1; attempt <= 3; attempt++) {
+        try {
+            await Promise.race([
+                v.play(),
+                new Promise((_, reject) => setTimeout(() => reject(new Error('play() did not start within 5s')), 5000))
+            ]);
+            if (!v.paused) return { success: true, attempt, paused: false, readyState: v.readyState };
+        } catch (e) {
+            error = e.message;
+        }
+        if (attempt < 3) await new Promise(r => setTimeout(r, 2000));
+    }
+    return { success: false, error, paused: v.paused, readyState: v.readyState };
+}"""
+
+# Manual play attempt for start_live_stream plus the follow-up checks, in one call:
+# play() (or load() when the video has no source at all), then up to 5s in the page
+# until the video plays or errors, then one snapshot. Returns {play, state}, state
+# being __nimarSnapshot() plus sourcesReport, the video's <source> tags already
+# rendered for the log ("<n> found" and one "- src (type: ...)" line each, or '')
+_PLAY_AND_PROBE_JS = """async (v) => {
+    // Muted so the autoplay policy allows play()
+    v.preload = 'auto';
+    v.muted = true;
+    
+    // Check if video player library is present (HLS.js, Video.js, etc.)
+    const hasHLS = typeof Hls !== 'undefined';
+    const hasVideoJS = typeof videojs !== 'undefined';
+    let playerReady = true;
+    if (hasHLS) {
+        const hls = v.hls || (window.hlsInstances && window.hlsInstances[0]);
+        if (hls) playerReady = hls.readyState === 2;  // HLS.READY
+    }
+    
+    let play;
+    if (v.readyState === 0 && v.networkState === 3) {
+        // Only reload when there is no data and no source (load() interrupts loading)
+        try { v.load(); } catch (e) { console.log('Video load() error:', e); }
+        play = { success: true, action: 'load_called', playerReady };
+    } else if (v.readyState >= 1 || (playerReady && v.networkState >= 2)) {
+        try {
+            v.play().catch(e => {
+                // AbortError is common while the player reloads the source
+                if (e.name !== 'AbortError') console.error('Video play() failed:', e.name, e.message);
+            });
+            play = {
+                success: true, action: 'play_attempted', autoplay: v.autoplay,
+                error: v.error ? v.error.message : null,
+                errorCode: v.error ? v.error.code : null,
+                playerReady, hasHLS, hasVideoJS
+            };
+        } catch (e) {
+            play = { success: false, error: e.message, playerReady };
+        }
+    } else {
+        play = { success: true, action: 'waiting_for_data', playerReady, hasHLS, hasVideoJS };
+    }
+    play.readyState = v.readyState;
+    play.networkState = v.networkState;
+    
+    // Settle on the first 'playing' or 'error' event (or right away if it already
+    // plays), 5s at most
+    if (v.paused || v.currentTime === 0) {
+        await new Promise(resolve => {
+            const done = () => {
+                clearTimeout(timer);
+                v.removeEventListener('playing', done);
+                v.removeEventListener('error', done);
+                resolve();
+            };
+            const timer = setTimeout(done, 5000);
+            v.addEventListener('playing', done);
+            v.addEventListener('error', done);
+        });
+    }
+    
+    const state = window.__nimarSnapshot(v);
+    const sources = v.querySelectorAll('source');
+    state.sourcesReport = sources.length
+        ? sources.length + ' found' + Array.from(sources, s =>
+            '\n     - ' + (s.src || 'N/A') + ' (type: ' + (s.type || 'N/A') + ')').join('')
+        : '';
+    return { play, state };
+}"""
+
+# Reads the channel list in one round-trip: (name, 1-based button index) for each
+# visible, named channel button, stopping at the first one without a label
+# (same as the old per-index button[i]/div[2]/p probes)
+_GET_CHANNELS_JS = """(containerSelector) => {
+    const container = document.querySelector(containerSelector);
+    if (!container) return [];
+    const buttons = Array.from(container.children).filter(el => el.tagName === 'BUTTON');
+    const channels = [];
+    for (let i = 0; i < buttons.length; i++) {
+        const label = buttons[i].querySelector(':scope > div:nth-of-type(2) > p');
+        const name = label && label.getClientRects().length ? (label.textContent || '').trim() : '';
+        if (!name) break;
+        channels.push([name, i + 1]);
+    }
+    return channels;
+}"""
+
+# True once an opened channel is rendered: a <video> exists or the Start Live
+# button (CSS selector passed as the argument) is visible
+_CHANNEL_OPENED_JS = """(startLiveSelector) => {
+    if (window.__nimarGetVideo()) return true;
+    const btn = document.querySelector(startLiveSelector);
+    return !!(btn && btn.getClientRects().length);
+}"""
+
+# Clicks the first element matching one of the given CSS selectors; returns the
+# selector that was clicked, or null if none matched
+_CLICK_FIRST_JS = """(selectors) => {
+    for (const sel of selectors) {
+        const el = document.querySelector(sel);
+        if (el) {
+            el.click();
+            return sel;
+        }
+    }
+    return null;
+}"""
+
+# The video's duration once it is known (finite and > 0), else false; used to wait for
+# a previous day's stream after Get Stream. Argument: the src before the click (from
+# _VIDEO_SRC_TIME_JS); while the video still plays that src its duration is not taken,
+# since hls.js gives the live stream a finite duration too
+_VIDEO_DURATION_JS = """(oldSrc) => {
+    const v = window.__nimarGetVideo();
+    if (!v || (oldSrc && (v.currentSrc || v.src) === oldSrc)) return false;
+    return isFinite(v.duration) && v.duration > 0 ? v.duration : false;
+}"""
+
+# [currentSrc || src, currentTime] of the video (null if none); tells when Get Stream
+# has swapped in the previous day's stream
+_VIDEO_SRC_TIME_JS = """() => {
+    const v = window.__nimarGetVideo();
+    return v ? [v.currentSrc || v.src, v.currentTime] : null;
+}"""
+
+# [readyState, duration] of the video (null if none); while the duration is unknown
+# the video is loaded and briefly played so the metadata arrives
+_VIDEO_LOAD_DURATION_JS = """() => {
+    const v = window.__nimarGetVideo();
+    if (!v) return null;
+    if (!(isFinite(v.duration) && v.duration > 0)) {
+        try {
+            v.load();
+            v.play();
+            setTimeout(() => { try { v.pause(); } catch (e) {} }, 500);
+        } catch (e) {}
+    }
+    return [v.readyState, isFinite(v.duration) ? v.duration : null];
+}"""
+
+# Logs "[STREAM_TIME] video: <current> / <duration>" every second (once per document)
+_STREAM_TIME_TICKER_JS = """() => {
+    if (window.__streamTimeVideoTimer) return 'already-set';
+    function fmt(sec) {
+        if (isNaN(sec) || sec < 0) return '0:00';
+        sec = Math.floor(sec);
+        const h = Math.floor(sec / 3600);
+        const m = Math.floor((sec % 3600) / 60);
+        const s = sec % 60;
+        const mm = (h > 0 ? String(m).padStart(2, '0') : String(m));
+        const ss = String(s).padStart(2, '0');
+        return h > 0 ? `${h}:${mm}:${ss}` : `${m}:${ss}`;
+    }
+    window.__streamTimeVideoTimer = setInterval(() => {
+        const v = window.__nimarGetVideo();
+        if (!v) return;
+        console.log('[STREAM_TIME] video: ' + fmt(v.currentTime) + ' / ' + fmt(v.duration));
+    }, 1000);
+    return 'set';
+}"""
+
+# The date input / picker that shows up once the calendar button is clicked, and the
+# day cells of the open picker
+_DATE_PICKER_CSS = (
+    'input[type="date"], input[placeholder*="date" i], input[aria-label*="date" i], '
+    'input[name*="date" i], .MuiInputBase-input, [role="dialog"], [role="presentation"], '
+    '.MuiPickersPopper-root, .MuiPopover-root'
+)
+_CALENDAR_DAYS_CSS = '.MuiPickersDay-root, [role="gridcell"], button[data-date]'
+_PICKER_POPUP_CSS = '.MuiPickersPopper-root, .MuiPopover-root'
+
+# Clicks the calendar day matching [dayNumber, 'YYYY-MM-DD'] (by text, aria-label or
+# data-date) inside an open date picker; true if one was clicked
+_CLICK_CALENDAR_DAY_JS = """([dayNum, dateStr]) => {
+    const buttons = Array.from(document.querySelectorAll('button, [role="button"]'));
+    for (const btn of buttons) {
+        const text = (btn.textContent || '').trim();
+        const ariaLabel = (btn.getAttribute('aria-label') || '').toLowerCase();
+        const dataDate = btn.getAttribute('data-date');
+        if (text === String(dayNum) ||
+            text === String(dayNum).padStart(2, '0') ||
+            ariaLabel.includes(dateStr.toLowerCase()) ||
+            dataDate === dateStr) {
+            // Make sure it's in a calendar context
+            const parent = btn.closest('[role="dialog"], [role="presentation"], .MuiPickersPopper-root, .MuiPopover-root, .MuiCalendarPicker-root');
+            if (parent) {
+                btn.click();
+                return true;
+            }
+        }
+    }
+    return false;
+}"""
+
+# Types the given 'YYYY-MM-DD' into the first visible date input (or the first input
+# of an open picker dialog), firing input/change; true if one was set
+_SET_DATE_INPUT_JS = """(dateValue) => {
+    function setVal(el, val) {
+        el.value = val;
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    const isVisible = el => !!(el && el.offsetParent !== null);
+    const inputs = Array.from(document.querySelectorAll('input')).filter(isVisible);
+    for (const el of inputs) {
+        const t = (el.getAttribute('type') || '').toLowerCase();
+        const ph = (el.getAttribute('placeholder') || '').toLowerCase();
+        const ar = (el.getAttribute('aria-label') || '').toLowerCase();
+        const name = (el.getAttribute('name') || '').toLowerCase();
+        if (t === 'date' || ph.includes('date') || ar.includes('date') || name.includes('date')) {
+            setVal(el, dateValue);
+            return true;
+        }
+    }
+    const dialogs = document.querySelectorAll('[role="dialog"], [role="presentation"], .MuiPickersPopper-root, .MuiPopover-root');
+    for (const d of dialogs) {
+        const el = d.querySelector('input');
+        if (isVisible(el)) {
+            setVal(el, dateValue);
+            return true;
+        }
+    }
+    return false;
+}"""
+
+# Logs each <video> src change and reloads the video on it; run on every page load
+_VIDEO_SRC_WATCH_JS = """() => {
+    const observer = new MutationObserver(mutations => {
+        mutations.forEach(mutation => {
+            if (mutation.type === 'attributes' && mutation.attributeName === 'src') {
+                const v = mutation.target;
+                console.log('Video src changed:', v.src || v.currentSrc);
+                if (v.src || v.currentSrc) v.load();
+            }
+        });
+    });
+    document.querySelectorAll('video').forEach(v => {
+        observer.observe(v, { attributes: true, attributeFilter: ['src'] });
+    });
+    // Also observe new video elements
+    new MutationObserver(mutations => {
+        mutations.forEach(mutation => {
+            mutation.addedNodes.forEach(node => {
+                if (node.tagName === 'VIDEO') observer.observe(node, { attributes: true, attributeFilter: ['src'] });
+            });
+        });
+    }).observe(document.body, { childList: true, subtree: true });
+}"""
+
+# [currentTime, duration, readyState, networkState, paused, hasError] of a held <video>
+# handle; null once the element has been detached so the caller knows to re-acquire it
+_VIDEO_PROBE_JS = "(v) => v.isConnected ? [v.currentTime, v.duration, v.readyState, v.networkState, v.paused, !!v.error] : null"
+
+# Nudges a paused video that has metadata to play; run once before _VIDEO_READY_JS
+_PLAY_IF_PAUSED_JS = """() => {
+    const v = window.__nimarGetVideo();
+    if (v && v.paused && v.readyState >= 1) {
+        // AbortError is common while the player reloads the source
+        v.play().catch(e => { if (e.name !== 'AbortError') console.log('Video play error:', e.name, e.message); });
+    }
+}"""
+
+# Predicate for track_live_stream_time's video wait. Returns the video's state once it
+# is playing, has current data, or has metadata plus buffered data ({ready: 'playing'
+# | 'ready' | 'buffered'}), or once it has failed for good ({failed: 'error'} for
+# MEDIA_ERR_DECODE / MEDIA_ERR_SRC_NOT_SUPPORTED, {failed: 'no_source'} after
+# NETWORK_NO_SOURCE with no data for graceMs). False while still loading.
+# Argument: {graceMs, start}; start (epoch ms) restarts the no-source clock per wait.
+_VIDEO_READY_JS = """({ graceMs, start }) => {
+    const v = window.__nimarGetVideo();
+    if (!v) return false;
+    const state = window.__nimarSnapshot(v);
+    if (v.error && (v.error.code === 3 || v.error.code === 4)) return { ...state, failed: 'error' };
+    if (!v.paused && v.currentTime > 0) return { ...state, ready: 'playing' };
+    if (v.readyState >= 2) return { ...state, ready: 'ready' };
+    if (v.readyState >= 1 && v.buffered.length > 0) return { ...state, ready: 'buffered' };
+    let w = window.__nimarReadyWait;
+    if (!w || w.start !== start) w = window.__nimarReadyWait = { start, noSourceSince: 0 };
+    if (v.networkState === 3 && v.readyState === 0) {
+        w.noSourceSince = w.noSourceSince || Date.now();
+        if (Date.now() - w.noSourceSince >= graceMs) return { ...state, failed: 'no_source' };
+    } else {
+        w.noSourceSince = 0;
+    }
+    return false;
+}"""
+
+# Failure diagnostics gathered in one round-trip
+_PAGE_INFO_JS = """() => ({
+    url: location.href,
+    title: document.title,
+    buttons: document.querySelectorAll('button').length
+})"""
+
 
 class LiveTestSaveClipAutomation:
     """
@@ -121,12 +774,35 @@ class LiveTestSaveClipAutomation:
         live_status_pc (str): PC time when live status was captured
         prev_total_seconds (float): Previous day stream duration in seconds
         prev_date_token (str): Previous day date token
+        video_state (dict): Last video state pushed by the page (reportVideoState binding)
+        captured_stream_urls (list): Stream playlist URLs seen by the response listener
     
     Example:
         >>> automation = LiveTestSaveClipAutomation()
         >>> success = automation.run()
     """
     
+    # Navigation selectors shared by the live menu / channel methods. CSS translations of
+    # the portal's absolute XPaths (div[n] -> div:nth-of-type(n)), so they resolve through
+    # the native querySelector path instead of the XPath evaluator
+    # (e.g. //*[@id="root"]/div/div[1]/div[3]/div/div[6]/a/div/p for the Live button)
+    LIVE_ANCHOR_CSS = '#root > div > div:nth-of-type(1) > div:nth-of-type(3) > div > div:nth-of-type(6) > a'
+    LIVE_BTN_CSS = LIVE_ANCHOR_CSS + ' > div > p'
+    CHANNELS_CONTAINER_CSS = '#root > div > div:nth-of-type(2) > div > div > div:nth-of-type(3) > div'
+    CHANNEL_BUTTON_CSS = CHANNELS_CONTAINER_CSS + ' > button:nth-of-type({})'
+    CHANNEL_LABEL_CSS = CHANNEL_BUTTON_CSS + ' > div:nth-of-type(2) > p'
+    START_LIVE_PARENT_CSS = (
+        '#root > div > div:nth-of-type(2) > div > div > div:nth-of-type(3) > div:nth-of-type(1)'
+        ' > div:nth-of-type(3) > div:nth-of-type(2) > button:nth-of-type(3)'
+    )
+    START_LIVE_BTN_CSS = START_LIVE_PARENT_CSS + ' > p'
+    
+    # Timeout tiers (ms) for waits that follow a full WAIT_TIMEOUT wait: fallback probes
+    # for elements that should already be there, retries, and slow page transitions
+    FAST_WAIT_MS = 500
+    NORMAL_WAIT_MS = 3000
+    SLOW_WAIT_MS = 10000
+    
     def __init__(self):
         """
         Initialize live test save clip automation.
@@ -141,6 +817,14 @@ class LiveTestSaveClipAutomation:
         self.live_status_pc = ""
         self.prev_total_seconds = None
         self.prev_date_token = ""
+        self.video_state = None
+        self.captured_stream_urls = []
+        self._video_handle = None
+        
+        # Wait settings resolved once (WAIT_TIMEOUT / LOGIN_SUCCESS_WAIT are seconds)
+        self._wait_s = float(WAIT_TIMEOUT or 20)
+        self._wait_ms = int(self._wait_s * 1000)
+        self._login_wait_s = float(LOGIN_SUCCESS_WAIT or 5)
     
     def _print_block(self, title: str, lines: List[str]) -> None:
         """
@@ -151,10 +835,151 @@ class LiveTestSaveClipAutomation:
             lines (List[str]): List of lines to print
         """
         sep = "=" * 50
-        print(f"\n{sep}\n{title}\n{sep}")
+        logger.info(f"\n{sep}\n{title}\n{sep}")
         for line in lines:
-            print(line)
-        print(sep)
+            logger.info(line)
+        logger.info(sep)
+    
+    def _fresh_session_state(self) -> Optional[str]:
+        """
+        Return the saved login session file if it is recent enough to reuse.
+        
+        The OTP login writes cookies/local storage to SESSION_STATE_FILE after a
+        successful login; loading it into the new context lets login_with_otp_sync()
+        take its already-authenticated fast path and skip the OTP round entirely.
+        
+        Returns:
+            Optional[str]: Path to the session file, or None if missing or older than an hour
+        """
+        try:
+            age = time.time() - os.path.getmtime(SESSION_STATE_FILE)
+        except OSError:
+            return None
+        return SESSION_STATE_FILE if age < _SESSION_STATE_MAX_AGE else None
+    
+    def _poll(self, predicate, timeout: float, initial: float = 0.05, cap: float = 1.0) -> bool:
+        """
+        Poll a condition with exponential backoff until it holds or the timeout expires.
+        
+        The first check is immediate; the pause then starts at ``initial`` and
+        doubles up to ``cap``, so a fast page returns in milliseconds while a slow
+        one is not hammered with checks.
+        
+        Args:
+            predicate (Callable[[], bool]): Condition to check (exceptions count as False)
+            timeout (float): Maximum time to wait in seconds
+            initial (float): First pause between checks in seconds
+            cap (float): Longest pause between checks in seconds
+        
+        Returns:
+            bool: True if the condition held before the timeout, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial
+        while True:
+            try:
+                if predicate():
+                    return True
+            except Exception:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, cap)
+    
+    def _video_element(self):
+        """
+        Return a handle to the page's <video>, acquiring it on first use.
+        
+        The handle is kept until the main frame navigates or the element is
+        detached, so repeated probes skip the document lookup.
+        
+        Returns:
+            ElementHandle: The video element, or None if the page has none yet
+        """
+        if self._video_handle is None:
+            self._video_handle = self.page.query_selector("video")
+        return self._video_handle
+    
+    def _reset_video_handle(self) -> None:
+        """Drop the cached video handle so the next probe looks the element up again."""
+        handle, self._video_handle = self._video_handle, None
+        if handle is not None:
+            try:
+                handle.dispose()
+            except Exception:
+                pass
+    
+    def _probe_video(self) -> Optional[list]:
+        """
+        Read the video's playback state through the cached element handle.
+        
+        A detached or stale handle is dropped and the element looked up once more.
+        
+        Returns:
+            Optional[list]: [currentTime, duration, readyState, networkState, paused,
+            hasError], or None if there is no video
+        """
+        for _ in range(2):
+            video = self._video_element()
+            if video is None:
+                return None
+            try:
+                vals = video.evaluate(_VIDEO_PROBE_JS)
+            except Exception:
+                vals = None
+            if vals is not None:
+                return vals
+            self._reset_video_handle()
+        return None
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _env_snapshot(cls) -> Tuple[Tuple[str, Tuple[Tuple[str, object], ...]], ...]:
+        """
+        Build the categorised environment variable listing once.
+        
+        The values are module constants fixed at import, so the result is
+        cached for the lifetime of the process.
+        
+        Returns:
+            Tuple: ((category, ((var_name, value), ...)), ...)
+        """
+        return (
+            ("Portal Credentials", (
+                ("PORTAL_URL", PORTAL_URL),
+                ("USERNAME", USERNAME),
+                ("PASSWORD", PASSWORD),
+            )),
+            ("Email Settings", (
+                ("EMAIL_USER", EMAIL_USER),
+                ("EMAIL_PASS", EMAIL_PASS),
+                ("EMAIL_SERVER", EMAIL_SERVER),
+            )),
+            ("Browser Settings", (
+                ("BROWSER_HEADLESS", BROWSER_HEADLESS),
+                ("BROWSER_IGNORE_HTTPS_ERRORS", BROWSER_IGNORE_HTTPS_ERRORS),
+                ("BROWSER_NO_VIEWPORT", BROWSER_NO_VIEWPORT),
+            )),
+            ("OTP Login Timings", (
+                ("OTP_CREDENTIAL_ENTRY_WAIT", OTP_CREDENTIAL_ENTRY_WAIT),
+                ("OTP_BUTTON_TIMEOUT", OTP_BUTTON_TIMEOUT),
+                ("OTP_EMAIL_WAIT_TIME", OTP_EMAIL_WAIT_TIME),
+                ("OTP_INPUT_DELAY", OTP_INPUT_DELAY),
+                ("OTP_VERIFY_BUTTON_TIMEOUT", OTP_VERIFY_BUTTON_TIMEOUT),
+                ("OTP_LOGIN_COMPLETE_WAIT", OTP_LOGIN_COMPLETE_WAIT),
+                ("OTP_RETRIES", OTP_RETRIES),
+                ("OTP_DELAY", OTP_DELAY),
+            )),
+            ("Wait Timeouts", (
+                ("WAIT_TIMEOUT", WAIT_TIMEOUT),
+                ("LOGIN_SUCCESS_WAIT", LOGIN_SUCCESS_WAIT),
+            )),
+            ("Logging", (
+                ("LOG_LEVEL", LOG_LEVEL),
+            )),
+        )
     
     def display_env_variables(self) -> None:
         """
@@ -163,299 +988,147 @@ class LiveTestSaveClipAutomation:
         This method prints all environment variables organized by category,
         masking sensitive information like passwords.
         """
-        from NIMAR.env_variables import (
-            PORTAL_URL, USERNAME, PASSWORD,
-            EMAIL_USER, EMAIL_PASS, EMAIL_SERVER,
-            OTP_CREDENTIAL_ENTRY_WAIT, OTP_BUTTON_TIMEOUT, OTP_EMAIL_WAIT_TIME,
-            OTP_INPUT_DELAY, OTP_VERIFY_BUTTON_TIMEOUT, OTP_LOGIN_COMPLETE_WAIT,
-            OTP_RETRIES, OTP_DELAY
-        )
-        
-        print("\n" + "="*80)
-        print("📋 ENVIRONMENT VARIABLES LOADED FROM env_variables.py (Live Test Module)")
-        print("="*80)
+        logger.info("\n" + "="*80)
+        logger.info("📋 ENVIRONMENT VARIABLES LOADED FROM env_variables.py (Live Test Module)")
+        logger.info("="*80)
         
         sensitive_vars = ["PASSWORD", "EMAIL_PASS", "PASS"]
-        all_vars = {
-            "Portal Credentials": {
-                "PORTAL_URL": PORTAL_URL,
-                "USERNAME": USERNAME,
-                "PASSWORD": PASSWORD
-            },
-            "Email Settings": {
-                "EMAIL_USER": EMAIL_USER,
-                "EMAIL_PASS": EMAIL_PASS,
-                "EMAIL_SERVER": EMAIL_SERVER
-            },
-            "Browser Settings": {
-                "BROWSER_HEADLESS": BROWSER_HEADLESS,
-                "BROWSER_IGNORE_HTTPS_ERRORS": BROWSER_IGNORE_HTTPS_ERRORS,
-                "BROWSER_NO_VIEWPORT": BROWSER_NO_VIEWPORT
-            },
-            "OTP Login Timings": {
-                "OTP_CREDENTIAL_ENTRY_WAIT": OTP_CREDENTIAL_ENTRY_WAIT,
-                "OTP_BUTTON_TIMEOUT": OTP_BUTTON_TIMEOUT,
-                "OTP_EMAIL_WAIT_TIME": OTP_EMAIL_WAIT_TIME,
-                "OTP_INPUT_DELAY": OTP_INPUT_DELAY,
-                "OTP_VERIFY_BUTTON_TIMEOUT": OTP_VERIFY_BUTTON_TIMEOUT,
-                "OTP_LOGIN_COMPLETE_WAIT": OTP_LOGIN_COMPLETE_WAIT,
-                "OTP_RETRIES": OTP_RETRIES,
-                "OTP_DELAY": OTP_DELAY
-            },
-            "Wait Timeouts": {
-                "WAIT_TIMEOUT": WAIT_TIMEOUT,
-                "LOGIN_SUCCESS_WAIT": LOGIN_SUCCESS_WAIT
-            },
-            "Logging": {
-                "LOG_LEVEL": LOG_LEVEL
-            }
-        }
         
         missing_vars = []
-        for category, vars_dict in all_vars.items():
-            print(f"\n📂 {category}:")
-            for var_name, value in vars_dict.items():
+        for category, category_vars in self._env_snapshot():
+            logger.info(f"\n📂 {category}:")
+            for var_name, value in category_vars:
                 if value is None:
-                    print(f"   ❌ {var_name}: NOT SET (MISSING)")
+                    logger.info(f"   ❌ {var_name}: NOT SET (MISSING)")
                     missing_vars.append(var_name)
                 else:
                     if any(sensitive in var_name.upper() for sensitive in sensitive_vars):
                         masked_value = "*" * min(len(value), 20) + ("..." if len(value) > 20 else "")
-                        print(f"   ✅ {var_name}: {masked_value}")
+                        logger.info(f"   ✅ {var_name}: {masked_value}")
                     else:
-                        print(f"   ✅ {var_name}: {value}")
+                        logger.info(f"   ✅ {var_name}: {value}")
         
         if missing_vars:
-            print(f"\n⚠️  WARNING: {len(missing_vars)} variable(s) missing from env_variables.py:")
+            logger.warning(f"\n⚠️  {len(missing_vars)} variable(s) missing from env_variables.py:")
             for var in missing_vars:
-                print(f"      - {var}")
-            print("\n   Please add these variables to your env_variables.py.")
+                logger.info(f"      - {var}")
+            logger.info("\n   Please add these variables to your env_variables.py.")
         else:
-            print("\n✅ All environment variables are loaded successfully!")
+            logger.info("\n✅ All environment variables are loaded successfully!")
         
-        print("="*80 + "\n")
+        logger.info("="*80 + "\n")
     
     def navigate_to_live_menu(self) -> bool:
         """
         Navigate to live stream menu section.
         
         This method forcefully clicks Live button using the specific XPath provided.
-        Uses multiple click strategies to ensure successful navigation.
+        The label, its parent anchor and a visible "Live" text label are tried as
+        one locator union, so a missing element costs a single timeout; a
+        JavaScript click on the same union is the fallback.
         
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
             clicked = False
             
-            # Method 1: Use the specific XPath provided by user (PRIMARY METHOD)
-            # XPath: //*[@id="root"]/div/div[1]/div[3]/div/div[6]/a/div/p
+            # The Live entry by its specific path — the <p> label or its parent anchor —
+            # or, when the sidebar structure changed, any visible "Live" label. Whichever
+            # resolves first is clicked after one wait (PRIMARY METHOD)
+            live_btn = self.page.locator(self.LIVE_BTN_CSS).or_(
+                self.page.locator(self.LIVE_ANCHOR_CSS)
+            ).or_(
+                self.page.locator("p:text-is('Live'):visible")
+            ).first
             try:
-                print("🔍 Attempting to click Live button using specific XPath...")
-                live_btn = self.page.locator('//*[@id="root"]/div/div[1]/div[3]/div/div[6]/a/div/p')
-                live_btn.wait_for(state="visible", timeout=wait_timeout)
-                live_btn.scroll_into_view_if_needed()
-                time.sleep(1)
-                live_btn.click(force=True)
-                print("✅ Live button clicked (method 1 - specific XPath, force click)")
+                logger.info("🔍 Attempting to click Live button...")
+                live_btn.click(force=True, timeout=self._wait_ms)
+                logger.info("✅ Live button clicked (force click)")
                 clicked = True
-                time.sleep(2)
             except Exception as e1:
-                print("WARNING: " + f"⚠️ Method 1 (force click) failed: {e1}")
-                
-                # Method 2: Try JavaScript click on the same XPath
+                logger.warning(f"⚠️ Force click failed: {e1}")
+            
+            # Fallback: JavaScript click on whatever the union matched (no re-wait)
+            if not clicked:
                 try:
-                    print("🔍 Trying JavaScript click on specific XPath...")
-                    live_btn = self.page.locator('//*[@id="root"]/div/div[1]/div[3]/div/div[6]/a/div/p')
-                    live_btn.wait_for(state="visible", timeout=wait_timeout)
-                    live_btn.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    live_btn.evaluate("el => el.click()")
-                    print("✅ Live button clicked (method 2 - JavaScript click)")
-                    clicked = True
-                    time.sleep(2)
-                except Exception as e2:
-                    print("WARNING: " + f"⚠️ Method 2 (JavaScript click) failed: {e2}")
-                    
-                    # Method 3: Try clicking the parent anchor element
-                    try:
-                        print("🔍 Trying to click parent anchor element...")
-                        live_anchor = self.page.locator('//*[@id="root"]/div/div[1]/div[3]/div/div[6]/a')
-                        live_anchor.wait_for(state="visible", timeout=wait_timeout)
-                        live_anchor.scroll_into_view_if_needed()
-                        time.sleep(1)
-                        live_anchor.click(force=True)
-                        print("✅ Live anchor clicked (method 3 - parent anchor)")
+                    if live_btn.count() > 0:
+                        live_btn.evaluate("el => el.click()")
+                        logger.info("✅ Live button clicked (JavaScript click)")
                         clicked = True
-                        time.sleep(2)
-                    except Exception as e3:
-                        print("WARNING: " + f"⚠️ Method 3 (parent anchor) failed: {e3}")
-                        
-                        # Method 4: Try JavaScript click on parent anchor
-                        try:
-                            print("🔍 Trying JavaScript click on parent anchor...")
-                            live_anchor = self.page.locator('//*[@id="root"]/div/div[1]/div[3]/div/div[6]/a')
-                            live_anchor.wait_for(state="visible", timeout=wait_timeout)
-                            live_anchor.scroll_into_view_if_needed()
-                            time.sleep(1)
-                            live_anchor.evaluate("el => el.click()")
-                            print("✅ Live anchor clicked (method 4 - JavaScript on anchor)")
-                            clicked = True
-                            time.sleep(2)
-                        except Exception as e4:
-                            print("WARNING: " + f"⚠️ Method 4 (JavaScript on anchor) failed: {e4}")
-                            
-                            # Method 5: Try clicking by text content (fallback)
-                            try:
-                                print("🔍 Trying to find Live button by text content...")
-                                live_by_text = self.page.locator("//p[normalize-space()='Live']")
-                                if live_by_text.count() > 0:
-                                    # Try each Live button found
-                                    for i in range(live_by_text.count()):
-                                        try:
-                                            btn = live_by_text.nth(i)
-                                            btn.wait_for(state="visible", timeout=2000)
-                                            
-                                            # Check if it's the correct one by checking XPath structure
-                                            btn_xpath = btn.evaluate("""
-                                                el => {
-                                                    let path = [];
-                                                    while (el && el.nodeType === 1) {
-                                                        let index = 0;
-                                                        let sibling = el.previousElementSibling;
-                                                        while (sibling) {
-                                                            index++;
-                                                            sibling = sibling.previousElementSibling;
-                                                        }
-                                                        let tag = el.tagName.toLowerCase();
-                                                        path.unshift(`${tag}[${index + 1}]`);
-                                                        el = el.parentElement;
-                                                    }
-                                                    return path.join('/');
-                                                }
-                                            """)
-                                            
-                                            # If this button matches our target structure (div[6]/a/div/p), use it
-                                            if 'div[6]' in btn_xpath or len(btn_xpath.split('/')) >= 5:
-                                                btn.scroll_into_view_if_needed()
-                                                time.sleep(1)
-                                                btn.click(force=True)
-                                                print(f"✅ Live button clicked (method 5 - by text, button {i+1})")
-                                                clicked = True
-                                                time.sleep(2)
-                                                break
-                                        except Exception:
-                                            continue
-                            except Exception as e5:
-                                print("WARNING: " + f"⚠️ Method 5 (by text) failed: {e5}")
+                except Exception as e2:
+                    logger.warning(f"⚠️ JavaScript click failed: {e2}")
             
             if not clicked:
-                print("ERROR: " + "❌ Could not click Live button - all methods failed")
+                logger.error("❌ Could not click Live button - all methods failed")
                 return False
             
-            print("✅ Live button clicked successfully")
-            
-            login_success_wait = LOGIN_SUCCESS_WAIT or 3
-            login_success_wait = float(login_success_wait)
-            time.sleep(login_success_wait)
+            logger.info("✅ Live button clicked successfully")
             
             # Verify that we are on the live channels view by checking for channel list container
+            # (the wait itself signals readiness, no fixed pause after the click)
+            channels_container = self.page.locator(self.CHANNELS_CONTAINER_CSS)
             try:
-                channels_container = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div')
-                channels_container.wait_for(state="visible", timeout=wait_timeout)
-                print("✅ Verified: Now on live channels view")
+                channels_container.wait_for(state="visible", timeout=self._wait_ms)
+                logger.info("✅ Verified: Now on live channels view")
             except Exception:
                 # Retry click once if verification failed
-                print("WARNING: " + "⚠️ Live view not verified, retrying click once...")
+                logger.warning("⚠️ Live view not verified, retrying click once...")
                 try:
-                    # Retry with the specific XPath
-                    live_btn = self.page.locator('//*[@id="root"]/div/div[1]/div[3]/div/div[6]/a/div/p')
-                    live_btn.wait_for(state="visible", timeout=wait_timeout)
-                    live_btn.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    live_btn.click(force=True)
-                    time.sleep(login_success_wait)
-                    channels_container = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div')
-                    channels_container.wait_for(state="visible", timeout=wait_timeout)
-                    print("✅ Verified: Now on live channels view (after retry)")
+                    # Retry with the specific XPath (it was clickable moments ago)
+                    live_btn.click(force=True, timeout=self.NORMAL_WAIT_MS)
+                    channels_container.wait_for(state="visible", timeout=self._wait_ms)
+                    logger.info("✅ Verified: Now on live channels view (after retry)")
                 except Exception as e:
-                    print("ERROR: " + f"❌ Live view verification failed after retry: {e}")
+                    logger.error(f"❌ Live view verification failed after retry: {e}")
                     # Still return True if we clicked, as navigation might have worked
                     if clicked:
-                        print("WARNING: " + "⚠️ Click succeeded but verification failed - continuing anyway")
+                        logger.warning("⚠️ Click succeeded but verification failed - continuing anyway")
                         return True
                     return False
             
             return True
             
         except Exception as e:
-            print("ERROR: " + f"NO: Error navigating to live menu -> {e}")
+            logger.error(f"NO: Error navigating to live menu -> {e}")
             return False
     
     def get_all_channels(self) -> List[Tuple[str, int]]:
         """
         Get all available channels dynamically.
         
-        This method finds all channel buttons and extracts their names and indices.
+        This method reads every channel button's name and index from the channel
+        list in a single page.evaluate round-trip.
         
         Returns:
             List[Tuple[str, int]]: List of (channel_name, button_index) tuples
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
-            # Find all channel buttons using pattern: button[1], button[2], etc.
-            channels = []
-            max_channels = 50  # Maximum channels to check
+            # Let the first channel label render before reading the list
+            try:
+                self.page.locator(self.CHANNEL_LABEL_CSS.format(1)).wait_for(
+                    state="visible", timeout=2000
+                )
+            except Exception:
+                pass
             
-            for i in range(1, max_channels + 1):
-                try:
-                    # Try to find channel button with index i
-                    channel_btn = self.page.locator(f'//*[@id="root"]/div/div[2]/div/div/div[3]/div/button[{i}]/div[2]/p')
-                    channel_btn.wait_for(state="visible", timeout=2000)
-                    channel_name = channel_btn.text_content()
-                    if channel_name and channel_name.strip():
-                        channels.append((channel_name.strip(), i))
-                        print(f"Found channel {i}: {channel_name.strip()}")
-                except Exception:
-                    # No more channels found
-                    break
+            channels = [
+                (channel_name, index)
+                for channel_name, index in self.page.evaluate(
+                    _GET_CHANNELS_JS, self.CHANNELS_CONTAINER_CSS
+                )
+            ]
+            for channel_name, index in channels:
+                logger.info(f"Found channel {index}: {channel_name}")
             
             if channels:
-                print(f"✅ Total channels found: {len(channels)}")
-                return channels
+                logger.info(f"✅ Total channels found: {len(channels)}")
             else:
-                print("WARNING: " + "⚠️ No channels found. Trying alternative method...")
-                # Alternative: Try to find all buttons in the channel container
-                try:
-                    channel_container = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div')
-                    buttons = channel_container.locator('button').all()
-                    for idx, btn in enumerate(buttons, start=1):
-                        try:
-                            # Try to get text from div[2]/p
-                            text_elem = btn.locator('div[2]/p')
-                            if text_elem.count() > 0:
-                                channel_name = text_elem.first.text_content()
-                                if channel_name and channel_name.strip():
-                                    channels.append((channel_name.strip(), idx))
-                                    print(f"Found channel {idx}: {channel_name.strip()}")
-                        except Exception:
-                            continue
-                    
-                    if channels:
-                        print(f"✅ Total channels found (alternative method): {len(channels)}")
-                        return channels
-                except Exception as e:
-                    print("ERROR: " + f"Error in alternative channel detection: {e}")
-            
+                logger.warning("⚠️ No channels found.")
             return channels
             
         except Exception as e:
-            print("ERROR: " + f"NO: Error getting channels -> {e}")
+            logger.error(f"NO: Error getting channels -> {e}")
             return []
     
     def open_channel(self, channel_index: int, channel_name: str = "") -> bool:
@@ -470,151 +1143,163 @@ class LiveTestSaveClipAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
-            print(f"🔍 Attempting to open channel {channel_index} ({channel_name})...")
+            logger.info(f"🔍 Attempting to open channel {channel_index} ({channel_name})...")
             
             # Wait for channel list to be ready
-            time.sleep(3)
+            try:
+                self.page.locator(self.CHANNEL_BUTTON_CSS.format(1)).wait_for(
+                    state="visible", timeout=self._wait_ms
+                )
+            except Exception:
+                pass  # The click methods below report the failure
             
-            # Try multiple selectors and click methods
+            # The button at this index (locators built once, reused below)
             channel_opened = False
+            channel_btn = self.page.locator(self.CHANNEL_BUTTON_CSS.format(channel_index))
+            start_live_btn = self.page.locator(self.START_LIVE_BTN_CSS)
             
-            # Method 1: Try clicking the button directly
             try:
-                channel_btn = self.page.locator(f'//*[@id="root"]/div/div[2]/div/div/div[3]/div/button[{channel_index}]')
-                channel_btn.wait_for(state="visible", timeout=wait_timeout)
-                channel_btn.scroll_into_view_if_needed()
-                time.sleep(1)
-                channel_btn.click(force=True)
-                print(f"✅ Channel button clicked (method 1)")
-                time.sleep(3)
+                channel_btn.click(force=True, timeout=self._wait_ms)
+                logger.info(f"✅ Channel button clicked (force click)")
                 channel_opened = True
             except Exception as e1:
-                print("WARNING: " + f"⚠️ Method 1 failed: {e1}")
-                
-                # Method 2: Try clicking the text element (p tag)
+                logger.warning(f"⚠️ Force click failed: {e1}")
+            
+            # Fallback: JavaScript click on the same button (no re-wait)
+            if not channel_opened:
                 try:
-                    channel_text = self.page.locator(f'//*[@id="root"]/div/div[2]/div/div/div[3]/div/button[{channel_index}]/div[2]/p')
-                    channel_text.wait_for(state="visible", timeout=wait_timeout)
-                    channel_text.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    channel_text.click(force=True)
-                    print(f"✅ Channel text clicked (method 2)")
-                    time.sleep(3)
-                    channel_opened = True
-                except Exception as e2:
-                    print("WARNING: " + f"⚠️ Method 2 failed: {e2}")
-                    
-                    # Method 3: Try JavaScript click
-                    try:
-                        channel_btn = self.page.locator(f'//*[@id="root"]/div/div[2]/div/div/div[3]/div/button[{channel_index}]')
-                        channel_btn.wait_for(state="visible", timeout=wait_timeout)
-                        channel_btn.scroll_into_view_if_needed()
-                        time.sleep(1)
+                    if channel_btn.count() > 0:
                         channel_btn.evaluate("el => el.click()")
-                        print(f"✅ Channel button clicked via JavaScript (method 3)")
-                        time.sleep(3)
+                        logger.info(f"✅ Channel button clicked via JavaScript")
                         channel_opened = True
-                    except Exception as e3:
-                        print("WARNING: " + f"⚠️ Method 3 failed: {e3}")
-                        
-                        # Method 4: Try clicking by channel name text
-                        if channel_name:
-                            try:
-                                channel_by_name = self.page.locator(f'//*[@id="root"]/div/div[2]/div/div/div[3]/div//button[.//p[contains(text(), "{channel_name}")]]')
-                                channel_by_name.wait_for(state="visible", timeout=wait_timeout)
-                                channel_by_name.scroll_into_view_if_needed()
-                                time.sleep(1)
-                                channel_by_name.click(force=True)
-                                print(f"✅ Channel clicked by name (method 4)")
-                                time.sleep(3)
-                                channel_opened = True
-                            except Exception as e4:
-                                print("WARNING: " + f"⚠️ Method 4 failed: {e4}")
+                except Exception as e2:
+                    logger.warning(f"⚠️ JavaScript click failed: {e2}")
+            
+            # Last resort: the channel button whose label is exactly the channel name
+            # (get_by_text escapes the name, so quotes in it can't break the selector)
+            if not channel_opened and channel_name:
+                try:
+                    channel_by_name = self.page.locator(self.CHANNELS_CONTAINER_CSS).locator("button").filter(
+                        has=self.page.get_by_text(channel_name, exact=True)
+                    ).first
+                    channel_by_name.click(force=True, timeout=self.NORMAL_WAIT_MS)
+                    logger.info(f"✅ Channel clicked by name")
+                    channel_opened = True
+                except Exception as e3:
+                    logger.warning(f"⚠️ Click by name failed: {e3}")
             
             if channel_opened:
-                # Wait longer for page navigation after clicking channel
-                time.sleep(5)
-                
-                # Wait for page to settle (network idle)
+                # Wait for the channel view to render (video element or Start Live button)
+                # rather than a fixed pause + networkidle, which never settles on a page
+                # streaming live video. One predicate checks both, polled every 50ms.
                 try:
-                    self.page.wait_for_load_state("networkidle", timeout=10000)
+                    self.page.wait_for_function(
+                        _CHANNEL_OPENED_JS, arg=self.START_LIVE_BTN_CSS, timeout=5000, polling=50
+                    )
                 except Exception:
-                    pass  # Continue even if networkidle times out
+                    pass  # Checked below
                 
                 # Check if we're still on channel list (channel NOT opened)
+                # (the wait above already gave the channel view time to render, so an
+                # instant visibility check is enough; waiting here cost 3s on success)
                 channel_still_visible = False
                 try:
                     # If we can still see channel buttons, channel didn't open
-                    channel_list_check = self.page.locator(f'//*[@id="root"]/div/div[2]/div/div/div[3]/div/button[{channel_index}]')
-                    if channel_list_check.count() > 0:
-                        # Check if button is still visible (means we're still on list)
-                        try:
-                            channel_list_check.wait_for(state="visible", timeout=3000)
-                            channel_still_visible = True
-                        except Exception:
-                            # Button not visible, might have opened
-                            channel_still_visible = False
+                    channel_still_visible = channel_btn.is_visible()
                 except Exception:
                     channel_still_visible = False
                 
                 if channel_still_visible:
-                    print("ERROR: " + f"❌ Channel {channel_index} ({channel_name}) did NOT open - still on channel list!")
-                    print("ERROR: " + f"   Trying alternative click methods...")
+                    logger.error(f"❌ Channel {channel_index} ({channel_name}) did NOT open - still on channel list!")
+                    logger.error(f"   Trying alternative click methods...")
                     
                     # Try clicking again with different method
                     try:
                         # Try clicking the entire button area
-                        channel_container = self.page.locator(f'//*[@id="root"]/div/div[2]/div/div/div[3]/div/button[{channel_index}]')
-                        channel_container.click(force=True, timeout=5000)
-                        print(f"✅ Retry: Channel button clicked again (force click)")
-                        time.sleep(5)
-                        self.page.wait_for_load_state("networkidle", timeout=10000)
+                        channel_btn.click(force=True, timeout=self.NORMAL_WAIT_MS)
+                        logger.info(f"✅ Retry: Channel button clicked again (force click)")
                     except Exception as retry_error:
-                        print("ERROR: " + f"❌ Retry click also failed: {retry_error}")
+                        logger.error(f"❌ Retry click also failed: {retry_error}")
                         return False
                 
-                # Check if start live button is visible (indicates channel is opened)
+                # Check if start live button is visible or a video element exists (either
+                # indicates channel is opened); both are awaited together in one locator wait
                 channel_verified = False
+                video = self.page.locator("video")
                 try:
-                    start_live_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]/p')
-                    start_live_btn.wait_for(state="visible", timeout=10000)
-                    print(f"✅ Channel {channel_index} ({channel_name}) opened successfully! (Start Live button visible)")
-                    channel_verified = True
-                except Exception as e1:
-                    print("WARNING: " + f"⚠️ Start Live button not found: {e1}")
-                    # Alternative check: see if video element exists
-                    try:
-                        video = self.page.locator("video")
-                        video.wait_for(state="attached", timeout=5000)
-                        print(f"✅ Channel {channel_index} ({channel_name}) opened successfully! (Video element detected)")
+                    start_live_btn.or_(video).first.wait_for(state="attached", timeout=self.SLOW_WAIT_MS)
+                    if start_live_btn.is_visible():
+                        logger.info(f"✅ Channel {channel_index} ({channel_name}) opened successfully! (Start Live button visible)")
                         channel_verified = True
-                    except Exception as e2:
-                        print("WARNING: " + f"⚠️ Video element not found: {e2}")
+                    elif video.count() > 0:
+                        logger.info(f"✅ Channel {channel_index} ({channel_name}) opened successfully! (Video element detected)")
+                        channel_verified = True
+                    else:
+                        logger.warning("⚠️ Start Live button attached but not visible, and no video element")
+                except Exception as e:
+                    logger.warning(f"⚠️ Neither Start Live button nor video element found: {e}")
                 
                 if not channel_verified:
-                    # Check URL or page content to verify
-                    current_url = self.page.url
-                    page_title = self.page.title()
-                    print("ERROR: " + f"❌ Channel {channel_index} ({channel_name}) OPENING FAILED!")
-                    print("ERROR: " + f"   Current URL: {current_url}")
-                    print("ERROR: " + f"   Page title: {page_title}")
-                    print("ERROR: " + f"   Neither Start Live button nor video element found")
-                    print("ERROR: " + f"   The channel click might not have worked. Please verify manually.")
+                    # Check URL or page content to verify (one round-trip for all diagnostics)
+                    try:
+                        page_info = self.page.evaluate(_PAGE_INFO_JS)
+                    except Exception:
+                        page_info = {"url": self.page.url, "title": "", "buttons": 0}
+                    logger.error(f"❌ Channel {channel_index} ({channel_name}) OPENING FAILED!")
+                    logger.error(f"   Current URL: {page_info['url']}")
+                    logger.error(f"   Page title: {page_info['title']}")
+                    logger.error(f"   Buttons on page: {page_info['buttons']}")
+                    logger.error(f"   Neither Start Live button nor video element found")
+                    logger.error(f"   The channel click might not have worked. Please verify manually.")
                     return False
                 
                 return True
             else:
-                print("ERROR: " + f"❌ All click methods failed to open channel {channel_index} ({channel_name})")
-                print("ERROR: " + f"   Tried: Direct button click, Text click, JavaScript click, Name-based click")
+                logger.error(f"❌ All click methods failed to open channel {channel_index} ({channel_name})")
+                logger.error(f"   Tried: Button click, JavaScript click, click by name")
                 return False
             
         except Exception as e:
-            print("ERROR: " + f"NO: Error opening channel {channel_index} -> {e}")
+            logger.error(f"NO: Error opening channel {channel_index} -> {e}")
             return False
     
+    def _click_start_live_button(self) -> bool:
+        """
+        Click the Start-from-live button: a forced click on the <p> label or its parent
+        button, then a JavaScript click in one page round-trip as the fallback.
+        
+        Returns:
+            bool: True if one of the click methods succeeded, False otherwise
+        """
+        # The label or its parent button, whichever resolves first
+        start_live = self.page.locator(self.START_LIVE_BTN_CSS).or_(
+            self.page.locator(self.START_LIVE_PARENT_CSS)
+        ).first
+        
+        # Method 1: Forced (real mouse) click; click() itself waits for the element to
+        # have a box and scrolls it into view, so no separate wait/scroll round-trips
+        try:
+            start_live.click(force=True, timeout=self._wait_ms)
+            logger.info("✅ Start-from-live button clicked (method 1)")
+            return True
+        except Exception as e1:
+            logger.warning(f"⚠️ Method 1 failed: {e1}")
+        
+        # Method 2: JavaScript click on the label, else the button — tried in order inside
+        # the page so only one of them is clicked (a second click would toggle it back)
+        try:
+            clicked = self.page.evaluate(
+                _CLICK_FIRST_JS, [self.START_LIVE_BTN_CSS, self.START_LIVE_PARENT_CSS]
+            )
+            if clicked:
+                logger.info(f"✅ Start-from-live button clicked via JavaScript (method 2: {clicked})")
+                return True
+            logger.warning("⚠️ Method 2 failed: Start-from-live button not in the page")
+        except Exception as e2:
+            logger.warning(f"⚠️ Method 2 failed: {e2}")
+        
+        return False
+    
     def start_live_stream(self) -> bool:
         """
         Click start from live button to start the live stream.
@@ -623,683 +1308,221 @@ class LiveTestSaveClipAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
-            print("🔍 Attempting to click Start-from-live button...")
+            logger.info("🔍 Attempting to click Start-from-live button...")
             
-            # Wait before clicking
-            time.sleep(3)
-            
-            # Try multiple click methods
-            clicked = False
-            
-            # Method 1: Click the p tag directly
-            try:
-                start_live_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]/p')
-                start_live_btn.wait_for(state="visible", timeout=wait_timeout)
-                start_live_btn.scroll_into_view_if_needed()
-                time.sleep(1)
-                start_live_btn.click(force=True)
-                print("✅ Start-from-live button clicked (method 1)")
-                time.sleep(3)
-                clicked = True
-            except Exception as e1:
-                print("WARNING: " + f"⚠️ Method 1 failed: {e1}")
-                
-                # Method 2: Click the button parent
-                try:
-                    start_live_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]')
-                    start_live_btn.wait_for(state="visible", timeout=wait_timeout)
-                    start_live_btn.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    start_live_btn.click(force=True)
-                    print("✅ Start-from-live button clicked (method 2)")
-                    time.sleep(3)
-                    clicked = True
-                except Exception as e2:
-                    print("WARNING: " + f"⚠️ Method 2 failed: {e2}")
-                    
-                    # Method 3: JavaScript click
-                    try:
-                        start_live_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]')
-                        start_live_btn.wait_for(state="visible", timeout=wait_timeout)
-                        start_live_btn.scroll_into_view_if_needed()
-                        time.sleep(1)
-                        start_live_btn.evaluate("el => el.click()")
-                        print("✅ Start-from-live button clicked via JavaScript (method 3)")
-                        time.sleep(3)
-                        clicked = True
-                    except Exception as e3:
-                        print("WARNING: " + f"⚠️ Method 3 failed: {e3}")
+            # No pause or response wait around the click: run()'s response listener
+            # captures the stream playlist while the video wait below runs
+            clicked = self._click_start_live_button()
             
             if clicked:
                 # Verify video element is present after clicking
-                time.sleep(5)  # Wait longer for video to load
                 try:
                     video = self.page.locator("video")
                     video.wait_for(state="attached", timeout=10000)
+                    # One handle for the element, passed to every video script below instead
+                    # of re-querying the page for the <video> in each of them
+                    video_handle = video.element_handle(timeout=self.FAST_WAIT_MS)
                     
                     # FORCEFULLY extract and set the actual stream URL from network requests
-                    print("🔍 Forcefully extracting stream URL from network requests...")
+                    logger.info("🔍 Forcefully extracting stream URL from network requests...")
                     stream_url = None
                     
                     # First, check captured stream URLs from network requests
-                    if hasattr(self, 'captured_stream_urls') and self.captured_stream_urls:
+                    if self.captured_stream_urls:
                         stream_url = self.captured_stream_urls[-1]  # Use the latest one
-                        print(f"✅ Using captured stream URL: {stream_url}")
+                        logger.info(f"✅ Using captured stream URL: {stream_url}")
                     
                     # If not found, try to get the stream URL from the page
                     if not stream_url:
                         try:
-                            # Check if there's an HLS.js instance with the stream URL
-                            stream_url_check = self.page.evaluate("""
-                                (function(){
-                                    // Check for HLS.js instance
-                                    if (typeof Hls !== 'undefined') {
-                                        var videos = document.querySelectorAll('video');
-                                        for (var i = 0; i < videos.length; i++) {
-                                            var v = videos[i];
-                                            if (v.hls && v.hls.url) {
-                                                return v.hls.url;
-                                            }
-                                        }
-                                        // Check window for HLS instances
-                                        if (window.hlsInstances && window.hlsInstances.length > 0) {
-                                            return window.hlsInstances[0].url;
-                                        }
-                                    }
-                                    
-                                    // Check for video source elements
-                                    var v = document.querySelector('video');
-                                    if (v) {
-                                        var sources = v.querySelectorAll('source');
-                                        for (var i = 0; i < sources.length; i++) {
-                                            var src = sources[i].src;
-                                            if (src && (src.includes('.m3u8') || src.includes('nginx-clipping'))) {
-                                                return src;
-                                            }
-                                        }
-                                    }
-                                    
-                                    // Check data attributes or hidden inputs
-                                    var streamInputs = document.querySelectorAll('[data-stream-url], [data-hls-url], input[type="hidden"][value*=".m3u8"]');
-                                    for (var i = 0; i < streamInputs.length; i++) {
-                                        var url = streamInputs[i].getAttribute('data-stream-url') || 
-                                                  streamInputs[i].getAttribute('data-hls-url') || 
-                                                  streamInputs[i].value;
-                                        if (url && url.includes('.m3u8')) {
-                                            return url;
-                                        }
-                                    }
-                                    
-                                    return null;
-                                })()
-                            """)
+                            # Check if there's an HLS.js instance, <source> or data attribute with the stream URL
+                            stream_url_check = self.page.evaluate("window.__findStreamUrl && window.__findStreamUrl()")
                             
                             if stream_url_check:
                                 stream_url = stream_url_check
-                                print(f"✅ Found stream URL in page: {stream_url}")
+                                logger.info(f"✅ Found stream URL in page: {stream_url}")
                         except Exception as e:
-                            print("WARNING: " + f"⚠️ Could not extract stream URL from page: {e}")
+                            logger.warning(f"⚠️ Could not extract stream URL from page: {e}")
                     
-                    # If still not found, wait a bit for network requests to capture it
+                    # If still not found, the response listener keeps capturing playlists while
+                    # the stream button click and the video wait below run; it is checked after
+                    # them instead of being waited on first
                     if not stream_url:
-                        print("⏳ Waiting for stream URL to be captured from network requests...")
-                        for wait_net in range(5):
-                            time.sleep(2)
-                            if hasattr(self, 'captured_stream_urls') and self.captured_stream_urls:
-                                stream_url = self.captured_stream_urls[-1]
-                                print(f"✅ Stream URL captured: {stream_url}")
-                                break
+                        logger.info("⏳ Stream URL not captured yet, checking again after the video wait...")
                     
                     # Forcefully trigger the page's stream initialization
                     # The page might need events or clicks to start loading
-                    print("🔧 Forcefully triggering page's stream initialization...")
+                    logger.info("🔧 Forcefully triggering page's stream initialization...")
                     
-                    # Method 1: Try clicking any "Get Stream" or similar buttons
+                    # Method 1: Try clicking any "Get Stream" or similar button (all candidates
+                    # in one selector union, so a page without any costs a single query)
                     try:
-                        stream_buttons = [
-                            "//button[contains(.,'Get Stream')]",
-                            "//button[contains(.,'Load Stream')]",
-                            "//button[contains(.,'Start Stream')]",
-                            "//button[contains(@class,'stream')]",
-                            "//button[contains(@id,'stream')]"
-                        ]
-                        for btn_xpath in stream_buttons:
-                            try:
-                                btn = self.page.locator(btn_xpath)
-                                if btn.count() > 0:
-                                    btn.first.click()
-                                    print(f"✅ Clicked stream button: {btn_xpath}")
-                                    time.sleep(2)
-                                    break
-                            except:
-                                continue
+                        stream_btn = self.page.locator(_STREAM_BUTTONS_CSS)
+                        if stream_btn.count() > 0:
+                            stream_btn.first.click()
+                            logger.info("✅ Clicked stream button")
                     except Exception as e:
-                        print("DEBUG: " + f"   No stream button found: {e}")
+                        logger.debug(f"   No stream button found: {e}")
+                    
+                    # Method 2 (video/window events, load, play) runs in the page on its own:
+                    # the helper init script kicks the <video> when it appears or its src changes
                     
-                    # Method 2: Trigger video events to wake up the player
+                    # Wait in the page for the video to actually play (one call instead of a
+                    # Python loop of 2s evaluate round-trips); the predicate re-triggers the
+                    # page's player itself while it waits
+                    logger.info("🔍 Waiting for page's video player to load stream naturally...")
+                    video_playing = False
+                    self.video_state = None  # Refreshed by the reportVideoState binding
                     try:
-                        self.page.evaluate("""
-                            (function(){
-                                var v = document.querySelector('video');
-                                if (v) {
-                                    // Trigger all video events that might wake up the player
-                                    var events = ['loadstart', 'loadedmetadata', 'canplay', 'canplaythrough', 'loadeddata', 'play', 'playing'];
-                                    events.forEach(function(eventName) {
-                                        try {
-                                            v.dispatchEvent(new Event(eventName, {bubbles: true}));
-                                        } catch(e) {}
-                                    });
-                                    
-                                    // Force load if needed
-                                    if (v.networkState === 0 || v.networkState === 3) {
-                                        v.load();
-                                    }
-                                    
-                                    // Try to play
-                                    if (v.paused) {
-                                        v.play().catch(function(e) {
-                                            console.log('Auto-play blocked:', e);
-                                        });
-                                    }
-                                }
-                                
-                                // Also trigger any window events that might initialize the player
-                                try {
-                                    window.dispatchEvent(new Event('load'));
-                                    window.dispatchEvent(new Event('DOMContentLoaded'));
-                                } catch(e) {}
-                            })()
-                        """)
-                        print("✅ Triggered video and window events")
+                        outcome = self.page.wait_for_function(
+                            _VIDEO_PLAYING_JS, arg=int(time.time() * 1000),
+                            timeout=80000, polling=100
+                        ).json_value()
+                        if isinstance(outcome, dict):
+                            # Decode/unsupported-source errors never recover; give up now
+                            # rather than after the full wait so the caller can re-click
+                            logger.error(f"❌ Video failed with error code {outcome.get('errorCode')}: {outcome.get('error')}")
+                            return False
+                        video_playing = True
+                        current_time = (self.video_state or {}).get('currentTime') or 0
+                        logger.info(f"✅ Video is playing! (currentTime: {current_time:.1f}s)")
                     except Exception as e:
-                        print("DEBUG: " + f"   Could not trigger events: {e}")
+                        logger.warning(f"⚠️ Video not playing after waiting: {e}")
                     
-                    # Method 3: Wait and check if page's HLS.js needs time
-                    print("⏳ Waiting for page's own video player to initialize stream...")
-                    time.sleep(5)  # Give more time for page's JS to initialize
-                    
-                    # Wait for page's own player to load the stream
-                    # Also check if we need to manually trigger the page's player
-                    print("🔍 Waiting for page's video player to load stream naturally...")
-                    video_playing = False
+                    if not stream_url:
+                        if self.captured_stream_urls:
+                            stream_url = self.captured_stream_urls[-1]
+                            logger.info(f"✅ Stream URL captured: {stream_url}")
+                        else:
+                            logger.warning("⚠️ No stream playlist response captured")
                     
-                    for wait_attempt in range(40):  # Wait up to 80 seconds for page's player
+                    if not video_playing:
+                        # One snapshot for diagnostics and the last-resort triggers below
                         try:
-                            video_state = self.page.evaluate("""
-                                (function(){
-                                    var v = document.querySelector('video');
-                                    if (!v) return {exists: false};
-                                    
-                                    // Check if video is actually playing (best indicator)
-                                    var isPlaying = !v.paused && !v.ended && v.currentTime > 0 && v.readyState >= 2;
-                                    
-                                    // Check if page has its own HLS instance
-                                    var hasPageHLS = v.hls && typeof v.hls.loadSource === 'function';
-                                    var hlsReady = false;
-                                    var hlsState = null;
-                                    if (hasPageHLS) {
-                                        // Check HLS state
-                                        hlsReady = v.hls.media !== null;
-                                        try {
-                                            hlsState = v.hls.levels ? v.hls.levels.length : 0;
-                                        } catch(e) {
-                                            hlsState = 'unknown';
-                                        }
-                                    }
-                                    
-                                    // Check if there's a video source set (even if blob)
-                                    var hasSource = v.src || v.currentSrc || '';
-                                    var sourceType = hasSource.startsWith('blob:') ? 'blob' : (hasSource.startsWith('http') ? 'http' : 'none');
-                                    
-                                    return {
-                                        exists: true,
-                                        isPlaying: isPlaying,
-                                        readyState: v.readyState,
-                                        networkState: v.networkState,
-                                        paused: v.paused,
-                                        currentTime: v.currentTime,
-                                        duration: v.duration,
-                                        src: v.src || v.currentSrc || 'no src',
-                                        hasPageHLS: hasPageHLS,
-                                        hlsReady: hlsReady,
-                                        hlsState: hlsState,
-                                        sourceType: sourceType,
-                                        error: v.error ? v.error.message : null,
-                                        errorCode: v.error ? v.error.code : null,
-                                        buffered: v.buffered.length > 0
-                                    };
-                                })()
-                            """)
-                            
-                            # Every 10 attempts (20 seconds), try to trigger the player again
-                            if wait_attempt > 0 and wait_attempt % 10 == 0:
-                                print("🔄 Re-triggering page's player (periodic check)...")
+                            video_state = self.page.evaluate("window.__videoState ? window.__videoState() : null") or {"exists": False}
+                        except Exception as e:
+                            logger.warning(f"⚠️ Error checking video state: {e}")
+                            video_state = {"exists": False}
+                        
+                        if video_state.get('exists'):
+                            logger.info(f"📹 Video state: readyState={video_state.get('readyState')}, networkState={video_state.get('networkState')}, paused={video_state.get('paused')}")
+                            if video_state.get('hasPageHLS'):
+                                if video_state.get('hlsReady'):
+                                    logger.info(f"✅ Page's HLS.js is ready and attached (levels: {video_state.get('hlsState')})")
+                                else:
+                                    logger.info(f"⏳ Page's HLS.js detected but not ready yet... (waiting for media attachment)")
+                            elif video_state.get('sourceType') == 'none':
+                                logger.warning(f"⚠️ Page's player not initializing - no HLS instance and no source detected")
+                                # Try to find and click any initialization buttons
                                 try:
-                                    self.page.evaluate("""
-                                        (function(){
-                                            var v = document.querySelector('video');
-                                            if (v) {
-                                                // Try to reload/restart
-                                                if (v.networkState === 0 || v.networkState === 3) {
-                                                    v.load();
-                                                }
-                                                // Try to play
-                                                if (v.paused) {
-                                                    v.play().catch(function(e) {
-                                                        console.log('Periodic play attempt:', e.name);
-                                                    });
-                                                }
-                                            }
-                                        })()
-                                    """)
+                                    init_buttons = self.page.locator("//button[contains(.,'Play') or contains(.,'Start') or contains(.,'Load')]")
+                                    if init_buttons.count() > 0:
+                                        init_buttons.first.click()
+                                        logger.info("✅ Clicked potential initialization button")
                                 except:
                                     pass
-                            
-                            if video_state.get('exists'):
-                                is_playing = video_state.get('isPlaying', False)
-                                ready_state = video_state.get('readyState', 0)
-                                network_state = video_state.get('networkState', 0)
-                                has_page_hls = video_state.get('hasPageHLS', False)
-                                hls_ready = video_state.get('hlsReady', False)
-                                hls_state = video_state.get('hlsState')
-                                source_type = video_state.get('sourceType', 'none')
-                                current_time = video_state.get('currentTime', 0)
-                                buffered = video_state.get('buffered', False)
-                                
-                                # Log progress every 10 seconds (reduced frequency)
-                                if wait_attempt % 10 == 0:
-                                    print(f"📹 Video loading... (readyState={ready_state}, networkState={network_state})")
-                                
-                                # Best case: video is actually playing
-                                if is_playing:
-                                    video_playing = True
-                                    print(f"✅ Video is playing! (currentTime: {current_time:.1f}s, readyState: {ready_state})")
-                                    break
-                                
-                                # Good case: video has data and is ready to play
-                                if ready_state >= 2 and buffered:
-                                    print(f"✅ Video has data ready (readyState: {ready_state}, buffered: {buffered})")
-                                    # Try to play if paused
-                                    if video_state.get('paused'):
-                                        try:
-                                            self.page.evaluate("document.querySelector('video').play().catch(e => console.log('Play attempt:', e))")
-                                        except:
-                                            pass
-                                    # Continue waiting to see if it starts playing
-                                
-                                # Check for page's HLS instance
-                                if has_page_hls:
-                                    if hls_ready:
-                                        print(f"✅ Page's HLS.js is ready and attached (levels: {hls_state})")
-                                        # If HLS is ready but not playing, try to trigger play
-                                        if video_state.get('paused') and wait_attempt % 5 == 0:
-                                            try:
-                                                self.page.evaluate("""
-                                                    (function(){
-                                                        var v = document.querySelector('video');
-                                                        if (v && v.hls) {
-                                                            // Try to start playback
-                                                            v.play().catch(function(e) {
-                                                                console.log('HLS play attempt:', e.name);
-                                                            });
-                                                        }
-                                                    })()
-                                                """)
-                                            except:
-                                                pass
-                                    else:
-                                        if wait_attempt % 5 == 0:
-                                            print(f"⏳ Page's HLS.js detected but not ready yet... (waiting for media attachment)")
-                                    
-                                    # If no HLS and no source, the page's player might not have initialized
-                                    if not has_page_hls and source_type == 'none' and wait_attempt > 10:
-                                        print("WARNING: " + f"⚠️ Page's player not initializing - no HLS instance and no source detected")
-                                        # Try to find and click any initialization buttons
-                                        try:
-                                            init_buttons = self.page.locator("//button[contains(.,'Play') or contains(.,'Start') or contains(.,'Load')]")
-                                            if init_buttons.count() > 0:
-                                                init_buttons.first.click()
-                                                print("✅ Clicked potential initialization button")
-                                                time.sleep(3)
-                                        except:
-                                            pass
-                                    
-                                    # Check for errors (but don't fail - page's player might recover)
-                                    error_code = video_state.get('errorCode')
-                                    if error_code:
-                                        if wait_attempt % 10 == 0:  # Log error every 20 seconds
-                                            print("WARNING: " + f"⚠️ Video error code: {error_code}, but waiting for page's player to recover...")
-                                    
-                                    # If network is loading, that's good - continue waiting
-                                    if network_state == 2:  # NETWORK_LOADING
-                                        if wait_attempt % 5 == 0:
-                                            print(f"⏳ Video is loading... (readyState: {ready_state}, networkState: {network_state})")
-                            
-                            time.sleep(2)
-                        except Exception as e:
-                            print("WARNING: " + f"⚠️ Error checking video state: {e}")
-                            time.sleep(2)
+                            if video_state.get('errorCode'):
+                                logger.warning(f"⚠️ Video error code: {video_state.get('errorCode')}, but page's player might still recover...")
                         
-                        if not video_playing:
-                            print("WARNING: " + f"⚠️ Video not playing after waiting, but page's player might still be loading...")
-                            # Final attempt: check if we can manually trigger the page's player
-                            try:
-                                print("🔧 Final attempt: Checking if page's player needs manual trigger...")
-                                final_check = self.page.evaluate("""
-                                    (function(){
-                                        var v = document.querySelector('video');
-                                        if (!v) return {exists: false};
-                                        
-                                        // Check if there's a React component or state that controls the player
-                                        var reactPlayer = v.closest('[class*="player"], [class*="video"], [class*="stream"]');
-                                        
-                                        // Try to find any clickable elements that might start the stream
-                                        var playButtons = document.querySelectorAll('button[class*="play"], button[class*="start"], button[class*="stream"]');
-                                        
-                                        return {
-                                            exists: true,
-                                            hasReactPlayer: reactPlayer !== null,
-                                            playButtonsFound: playButtons.length,
-                                            readyState: v.readyState,
-                                            networkState: v.networkState,
-                                            src: v.src || v.currentSrc || 'no src'
-                                        };
-                                    })()
-                                """)
-                                
-                                if final_check.get('playButtonsFound', 0) > 0:
-                                    print(f"🔍 Found {final_check.get('playButtonsFound')} potential play buttons, trying to click...")
-                                    try:
-                                        play_btn = self.page.locator("button[class*='play'], button[class*='start'], button[class*='stream']").first
-                                        play_btn.click()
-                                        print("✅ Clicked play button")
-                                        time.sleep(5)
-                                    except:
-                                        pass
-                            except Exception as e:
-                                print("DEBUG: " + f"   Final check failed: {e}")
+                        # Final attempt: click any play/start/stream button the page offers
+                        logger.info("🔧 Final attempt: Checking if page's player needs manual trigger...")
+                        try:
+                            play_btn = self.page.locator("button[class*='play'], button[class*='start'], button[class*='stream']")
+                            if play_btn.count() > 0:
+                                logger.info(f"🔍 Found {play_btn.count()} potential play buttons, trying to click...")
+                                play_btn.first.click()
+                                logger.info("✅ Clicked play button")
+                        except Exception as e:
+                            logger.debug(f"   Final check failed: {e}")
                         
                         # Don't fail - the page's player might work even if not playing yet
                     
-                    # Try to play video manually (autoplay might be blocked)
-                    print("🔍 Attempting to play video manually...")
-                    try:
-                        play_result = self.page.evaluate("""
-                            (function(){
-                                var v = document.querySelector('video');
-                                if (!v) return {success: false, error: 'No video element'};
-                                
-                                // Set video attributes for better streaming
-                                v.preload = 'auto';
-                                v.muted = false;
-                                
-                                // Check if video player library is present (HLS.js, Video.js, etc.)
-                                var hasHLS = typeof Hls !== 'undefined';
-                                var hasVideoJS = typeof videojs !== 'undefined';
-                                var playerReady = true;
-                                
-                                if (hasHLS) {
-                                    // Check if HLS is ready
-                                    var hls = v.hls || (window.hlsInstances && window.hlsInstances[0]);
-                                    if (hls) {
-                                        playerReady = hls.readyState === 2;  // HLS.READY
-                                        console.log('HLS.js found, readyState:', hls.readyState);
-                                    }
-                                }
-                                
-                                // Don't call load() if video is already loading/loaded (it can interrupt)
-                                // Only call load() if video has no data and networkState indicates no source
-                                if (v.readyState === 0 && v.networkState === 3) {
-                                    // Try to reload the video
-                                    try {
-                                        v.load();
-                                        console.log('Video load() called');
-                                    } catch(e) {
-                                        console.log('Video load() error:', e);
-                                    }
-                                    return {
-                                        success: true,
-                                        action: 'load_called',
-                                        readyState: v.readyState,
-                                        networkState: v.networkState,
-                                        playerReady: playerReady
-                                    };
-                                }
-                                
-                                // Wait for video to be ready before playing
-                                if (v.readyState >= 1 || (playerReady && v.networkState >= 2)) {
-                                    try {
-                                        // Ensure video is not muted (for autoplay)
-                                        v.muted = false;
-                                        
-                                        // Try to play
-                                        var playPromise = v.play();
-                                        if (playPromise !== undefined) {
-                                            playPromise.then(() => {
-                                                console.log('Video play() succeeded');
-                                            }).catch(error => {
-                                                // Don't log AbortError - it's common
-                                                if (error.name !== 'AbortError') {
-                                                    console.error('Video play() failed:', error.name, error.message);
-                                                }
-                                            });
-                                        }
-                                        
-                                        return {
-                                            success: true,
-                                            action: 'play_attempted',
-                                            paused: v.paused,
-                                            readyState: v.readyState,
-                                            networkState: v.networkState,
-                                            src: v.src || v.currentSrc || 'no src',
-                                            autoplay: v.autoplay,
-                                            error: v.error ? v.error.message : null,
-                                            errorCode: v.error ? v.error.code : null,
-                                            playerReady: playerReady,
-                                            hasHLS: hasHLS,
-                                            hasVideoJS: hasVideoJS
-                                        };
-                                    } catch(e) {
-                                        return {success: false, error: e.message, playerReady: playerReady};
-                                    }
-                                } else {
-                                    return {
-                                        success: true,
-                                        action: 'waiting_for_data',
-                                        readyState: v.readyState,
-                                        networkState: v.networkState,
-                                        playerReady: playerReady,
-                                        hasHLS: hasHLS,
-                                        hasVideoJS: hasVideoJS
-                                    };
-                                }
-                            })()
-                        """)
-                        print(f"📹 Video play attempt: {play_result}")
-                        
-                        # Check for errors in play result
-                        if play_result.get('error'):
-                            print("ERROR: " + f"❌ Video play error: {play_result.get('error')}")
-                            if play_result.get('errorCode'):
-                                print("ERROR: " + f"   Error code: {play_result.get('errorCode')}")
-                    except Exception as play_error:
-                        print("WARNING: " + f"⚠️ Error trying to play video: {play_error}")
+                    # Try to play video manually (autoplay might be blocked), then read the
+                    # video's state and error 5s later, all in one round-trip
+                    logger.info("🔍 Attempting to play video manually...")
+                    probe = video_handle.evaluate(_PLAY_AND_PROBE_JS)
+                    play_result = probe.get('play') or {}
+                    video_state = probe.get('state') or {}
+                    playing = (not video_state.get('paused') and not video_state.get('ended')
+                               and (video_state.get('currentTime') or 0) > 0)
                     
-                    # Wait for video to start playing and check if it's actually playing
-                    time.sleep(5)
+                    logger.info(f"📹 Video play attempt: {play_result}")
+                    if play_result.get('error'):
+                        logger.error(f"❌ Video play error: {play_result.get('error')}")
+                        if play_result.get('errorCode'):
+                            logger.error(f"   Error code: {play_result.get('errorCode')}")
                     
-                    # Final check: Is video actually playing?
-                    try:
-                        final_video_check = self.page.evaluate("""
-                            (function(){
-                                var v = document.querySelector('video');
-                                if (!v) return {exists: false};
-                                return {
-                                    exists: true,
-                                    playing: !v.paused && !v.ended && v.currentTime > 0,
-                                    paused: v.paused,
-                                    readyState: v.readyState,
-                                    networkState: v.networkState,
-                                    currentTime: v.currentTime,
-                                    duration: v.duration,
-                                    error: v.error ? v.error.message : null,
-                                    src: v.src || v.currentSrc || 'no src'
-                                };
-                            })()
-                        """)
-                        
-                        if final_video_check.get('exists'):
-                            if final_video_check.get('playing'):
-                                print(f"✅ Video is playing! (currentTime: {final_video_check.get('currentTime', 0):.2f}s)")
-                            elif final_video_check.get('paused'):
-                                print("WARNING: " + f"⚠️ Video is paused (readyState: {final_video_check.get('readyState')}, networkState: {final_video_check.get('networkState')})")
-                            else:
-                                print(f"📹 Video state: paused={final_video_check.get('paused')}, readyState={final_video_check.get('readyState')}, networkState={final_video_check.get('networkState')}")
-                    except Exception as e:
-                        print("WARNING: " + f"⚠️ Error checking final video state: {e}")
+                    # Is video actually playing?
+                    if playing:
+                        logger.info(f"✅ Video is playing! (currentTime: {video_state.get('currentTime', 0):.2f}s)")
+                    elif video_state.get('paused'):
+                        logger.warning(f"⚠️ Video is paused (readyState: {video_state.get('readyState')}, networkState: {video_state.get('networkState')})")
+                    else:
+                        logger.info(f"📹 Video state: paused={video_state.get('paused')}, readyState={video_state.get('readyState')}, networkState={video_state.get('networkState')}")
                     
                     # Check if video has an error with detailed diagnostics
-                    video_error_check = self.page.evaluate("""
-                        (function(){
-                            var v = document.querySelector('video');
-                            if (!v) return {exists: false, error: 'No video element'};
-                            
-                            // Get all video sources
-                            var sources = [];
-                            var sourceElements = v.querySelectorAll('source');
-                            sourceElements.forEach(function(s) {
-                                sources.push({
-                                    src: s.src,
-                                    type: s.type
-                                });
-                            });
-                            
-                            // Check for errors
-                            var errorInfo = null;
-                            if (v.error) {
-                                errorInfo = {
-                                    message: v.error.message,
-                                    code: v.error.code,
-                                    MEDIA_ERR_ABORTED: v.error.code === 1,
-                                    MEDIA_ERR_NETWORK: v.error.code === 2,
-                                    MEDIA_ERR_DECODE: v.error.code === 3,
-                                    MEDIA_ERR_SRC_NOT_SUPPORTED: v.error.code === 4
-                                };
-                            }
-                            
-                            return {
-                                exists: true,
-                                error: errorInfo,
-                                readyState: v.readyState,
-                                networkState: v.networkState,
-                                src: v.src || v.currentSrc || 'no src',
-                                sources: sources,
-                                paused: v.paused,
-                                currentTime: v.currentTime,
-                                duration: v.duration,
-                                buffered: v.buffered.length > 0 ? {
-                                    start: v.buffered.start(0),
-                                    end: v.buffered.end(0)
-                                } : null
-                            };
-                        })()
-                    """)
-                    
-                    if video_error_check.get('error'):
-                        error_info = video_error_check.get('error')
-                        print("ERROR: " + f"❌ Video element has ERROR: {error_info.get('message', 'Unknown error')}")
-                        print("ERROR: " + f"   Error code: {error_info.get('code', 'N/A')}")
+                    error_code = video_state.get('errorCode')
+                    if error_code:
+                        logger.error(f"❌ Video element has ERROR: {video_state.get('error') or 'Unknown error'}")
+                        logger.error(f"   Error code: {error_code}")
                         
                         # Explain error codes
-                        if error_info.get('MEDIA_ERR_ABORTED'):
-                            print("ERROR: " + f"   → MEDIA_ERR_ABORTED: User aborted loading")
-                        elif error_info.get('MEDIA_ERR_NETWORK'):
-                            print("ERROR: " + f"   → MEDIA_ERR_NETWORK: Network error while loading")
-                        elif error_info.get('MEDIA_ERR_DECODE'):
-                            print("ERROR: " + f"   → MEDIA_ERR_DECODE: Decoding error")
-                        elif error_info.get('MEDIA_ERR_SRC_NOT_SUPPORTED'):
-                            print("ERROR: " + f"   → MEDIA_ERR_SRC_NOT_SUPPORTED: Format not supported")
+                        if error_code in _MEDIA_ERROR_DESCRIPTIONS:
+                            logger.error(f"   → {_MEDIA_ERROR_DESCRIPTIONS[error_code]}")
                         
-                        print("ERROR: " + f"   Video src: {video_error_check.get('src', 'N/A')}")
-                        sources = video_error_check.get('sources', [])
-                        if sources:
-                            print("ERROR: " + f"   Video sources:")
-                            for src in sources:
-                                print("ERROR: " + f"     - {src.get('src', 'N/A')} (type: {src.get('type', 'N/A')})")
+                        logger.error(f"   Video src: {video_state.get('src', 'N/A')}")
+                        if video_state.get('sourcesReport'):
+                            logger.error(f"   Video sources: {video_state['sourcesReport']}")
                         
-                        print("ERROR: " + f"   This indicates the stream failed to load")
-                        print("ERROR: " + f"   Possible solutions:")
-                        print("ERROR: " + f"   1. Check network connectivity")
-                        print("ERROR: " + f"   2. Verify stream URL is accessible")
-                        print("ERROR: " + f"   3. Check if stream format is supported")
-                        print("ERROR: " + f"   4. Try refreshing the page manually")
+                        logger.error(f"   This indicates the stream failed to load")
+                        logger.error(f"   Possible solutions:")
+                        logger.error(f"   1. Check network connectivity")
+                        logger.error(f"   2. Verify stream URL is accessible")
+                        logger.error(f"   3. Check if stream format is supported")
+                        logger.error(f"   4. Try refreshing the page manually")
                         return False
                     
                     # Log video state with more details
-                    print(f"📹 Video state: readyState={video_error_check.get('readyState')}, networkState={video_error_check.get('networkState')}, paused={video_error_check.get('paused')}")
-                    print(f"📹 Video src: {video_error_check.get('src', 'N/A')}")
-                    sources = video_error_check.get('sources', [])
-                    if sources:
-                        print(f"📹 Video sources: {len(sources)} found")
-                        for src in sources:
-                            print(f"   - {src.get('src', 'N/A')} (type: {src.get('type', 'N/A')})")
+                    logger.info(f"📹 Video src: {video_state.get('src', 'N/A')}")
+                    if video_state.get('sourcesReport'):
+                        logger.info(f"📹 Video sources: {video_state['sourcesReport']}")
                     
-                    buffered = video_error_check.get('buffered')
-                    if buffered:
-                        print(f"📹 Video buffered: {buffered.get('start', 0):.2f}s - {buffered.get('end', 0):.2f}s")
+                    if video_state.get('bufferedEnd') is not None:
+                        logger.info(f"📹 Video buffered: {video_state['bufferedStart']:.2f}s - {video_state['bufferedEnd']:.2f}s")
                     
-                    # If video is paused, try to play it multiple times
-                    if video_error_check.get('paused'):
-                        print("🔍 Video is paused, attempting to play...")
-                        for attempt in range(3):
-                            try:
-                                play_result = self.page.evaluate("""
-                                    (function(){
-                                        var v = document.querySelector('video');
-                                        if (!v) return {success: false, error: 'No video'};
-                                        try {
-                                            v.muted = false;
-                                            var promise = v.play();
-                                            return {
-                                                success: true,
-                                                paused: v.paused,
-                                                readyState: v.readyState
-                                            };
-                                        } catch(e) {
-                                            return {success: false, error: e.message};
-                                        }
-                                    })()
-                                """)
-                                if not play_result.get('paused'):
-                                    print(f"✅ Video started playing (attempt {attempt + 1})")
-                                    break
-                                time.sleep(2)
-                            except Exception as e:
-                                print("WARNING: " + f"⚠️ Play attempt {attempt + 1} failed: {e}")
+                    # If video is paused, play it muted (the autoplay policy allows that); the
+                    # up to 3 attempts, 2s apart, run inside the page in this one call
+                    if video_state.get('paused'):
+                        logger.info("🔍 Video is paused, attempting to play...")
+                        try:
+                            play_result = video_handle.evaluate(_PLAY_MUTED_JS)
+                            if play_result.get('success'):
+                                logger.info(f"✅ Video started playing (attempt {play_result.get('attempt')})")
+                            else:
+                                logger.warning(f"⚠️ Play attempt failed: {play_result.get('error') or 'still paused'}")
+                        except Exception as e:
+                            logger.warning(f"⚠️ Play attempt failed: {e}")
                     
-                    print(f"✅ Live stream started successfully (video detected, readyState: {video_error_check.get('readyState', 'N/A')})!")
+                    logger.info(f"✅ Live stream started successfully (video detected, readyState: {video_state.get('readyState', 'N/A')})!")
                     return True
                 except Exception as e:
-                    print("WARNING: " + f"⚠️ Live stream button clicked but video not detected: {e}")
-                    print("WARNING: " + f"   This might be normal if video takes longer to load")
+                    logger.warning(f"⚠️ Live stream button clicked but video not detected: {e}")
+                    logger.warning(f"   This might be normal if video takes longer to load")
                     # Check if video exists but not ready
                     video_exists = self.page.locator("video").count() > 0
                     if video_exists:
-                        print(f"   Video element exists but might still be loading")
+                        logger.info(f"   Video element exists but might still be loading")
                         return True
                     else:
-                        print("ERROR: " + f"   Video element not found - stream might not have started")
+                        logger.error(f"   Video element not found - stream might not have started")
                         return False
             else:
-                print("ERROR: " + "❌ All methods failed to click Start-from-live button")
-                print("ERROR: " + "   Tried: Direct click, Button parent click, JavaScript click")
+                logger.error("❌ All methods failed to click Start-from-live button")
+                logger.error("   Tried: Forced click, JavaScript click")
                 return False
             
         except Exception as e:
-            print("ERROR: " + f"NO: Error starting live stream -> {e}")
+            logger.error(f"NO: Error starting live stream -> {e}")
             return False
     
     def track_live_stream_time(self, channel_name: str) -> Tuple[bool, str, str]:
@@ -1313,277 +1536,125 @@ class LiveTestSaveClipAutomation:
             Tuple[bool, str, str]: (success, live_time, pc_time)
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
             # Ensure video element is present
             video = self.page.locator("video")
-            video.wait_for(state="attached", timeout=wait_timeout)
-            
-            # Setup MutationObserver JavaScript
-            setup_observer_js = r"""
-              (function(){
-                const TAG = '[STREAM_TIME]';
-                const seen = new Set();
-                const timePattern = /\b\d{1,2}:\d{2}(?::\d{2})?(\s*\/\s*\d{1,2}:\d{2}(?::\d{2})?)?\b/;
-
-                function scanAllTextNodes(root){
-                  const walker = document.createTreeWalker(root || document.body, NodeFilter.SHOW_TEXT, null);
-                  const found = [];
-                  let node;
-                  while ((node = walker.nextNode())){
-                    const t = (node.textContent || '').trim();
-                    if (!t) continue;
-                    const m = t.match(timePattern);
-                    if (m && m[0]){
-                      const val = m[0];
-                      if (!seen.has(val)){
-                        seen.add(val);
-                        found.push(val);
-                      }
-                    }
-                  }
-                  return found;
-                }
-
-                const initial = scanAllTextNodes(document.body);
-                if (initial.length){
-                  console.log(TAG + ' initial: ' + initial.join(', '));
-                }
-
-                if (!window.__streamTimeObserver){
-                  window.__streamTimeObserver = new MutationObserver((mutations)=>{
-                    let any = false;
-                    for (const m of mutations){
-                      if (m.type === 'childList'){
-                        m.addedNodes && m.addedNodes.forEach(n=>{
-                          if (n.nodeType === Node.TEXT_NODE){
-                            const t = (n.textContent||'').trim();
-                            const mm = t.match(timePattern);
-                            if (mm && mm[0] && !seen.has(mm[0])){ seen.add(mm[0]); console.log(TAG + ' update: ' + mm[0]); any = true; }
-                          } else if (n.nodeType === Node.ELEMENT_NODE){
-                            const f = scanAllTextNodes(n);
-                            if (f.length){ console.log(TAG + ' update: ' + f.join(', ')); any = true; }
-                          }
-                        });
-                      } else if (m.type === 'characterData'){
-                        const t = (m.target && m.target.data || '').trim();
-                        const mm = t.match(timePattern);
-                        if (mm && mm[0] && !seen.has(mm[0])){ seen.add(mm[0]); console.log(TAG + ' update: ' + mm[0]); any = true; }
-                      } else if (m.type === 'attributes'){
-                        const el = m.target;
-                        const f = scanAllTextNodes(el);
-                        if (f.length){ console.log(TAG + ' update: ' + f.join(', ')); any = true; }
-                      }
-                    }
-                  });
-                  window.__streamTimeObserver.observe(document.body, { subtree: true, childList: true, characterData: true, attributes: true });
-                }
-
-                return initial;
-              })();
-            """
+            video.wait_for(state="attached", timeout=self._wait_ms)
             
-            initial_matches = self.page.evaluate(setup_observer_js)
-            # Don't log initial matches - too verbose
+            # Start logging stream-time text changes (helper installed by run())
+            self.page.evaluate("window.__watchStreamTime()")
             
-            # First, wait for video element to be ready and try to play it
+            # Nudge a paused video once, then wait in the page (one call) until the video is
+            # ready or has failed for good; after a definitive failure Start-from-live is
+            # re-clicked once before giving up instead of waiting out the timeout
             video_ready = False
-            video_wait_start = time.time()
+            stream_failed = False
             video_wait_timeout = 60  # Wait up to 60 seconds for video (increased for streaming)
             
-            print(f"🔍 Waiting for video element to be ready (timeout: {video_wait_timeout}s)...")
+            logger.info(f"🔍 Waiting for video element to be ready (timeout: {video_wait_timeout}s)...")
             
-            while time.time() - video_wait_start < video_wait_timeout:
+            for attempt in range(2):
                 try:
-                    video_count = self.page.locator("video").count()
-                    if video_count > 0:
-                        # Check if video is actually loaded and try to play
-                        video_info = self.page.evaluate("""
-                            (function(){
-                                var v = document.querySelector('video');
-                                if (!v) return {exists: false, ready: false, error: null};
-                                
-                                // Don't try to play if video is still loading (readyState 0)
-                                // Wait for at least metadata (readyState >= 1)
-                                var shouldTryPlay = false;
-                                if (v.readyState >= 1 && v.paused) {
-                                    shouldTryPlay = true;
-                                }
-                                
-                                if (shouldTryPlay) {
-                                    try {
-                                        // Only play if we have metadata or data
-                                        var playPromise = v.play();
-                                        if (playPromise !== undefined) {
-                                            playPromise.catch(function(error) {
-                                                // Don't log AbortError - it's common when video is reloading
-                                                if (error.name !== 'AbortError') {
-                                                    console.log('Video play error:', error.name, error.message);
-                                                }
-                                            });
-                                        }
-                                    } catch(e) {
-                                        if (e.name !== 'AbortError') {
-                                            console.log('Play exception:', e.name, e.message);
-                                        }
-                                    }
-                                }
-                                
-                                return {
-                                    exists: true,
-                                    ready: v.readyState >= 2,
-                                    readyState: v.readyState,
-                                    networkState: v.networkState,
-                                    error: v.error ? v.error.message : null,
-                                    errorCode: v.error ? v.error.code : null,
-                                    src: v.src || v.currentSrc || 'no src',
-                                    paused: v.paused,
-                                    currentTime: v.currentTime,
-                                    duration: v.duration,
-                                    buffered: v.buffered.length > 0
-                                };
-                            })()
-                        """)
-                        
-                        if video_info.get('exists'):
-                            ready_state = video_info.get('readyState', 0)
-                            network_state = video_info.get('networkState', 0)
-                            
-                            # Log progress every 10 seconds (reduced frequency)
-                            elapsed = time.time() - video_wait_start
-                            if int(elapsed) % 10 == 0:
-                                print(f"📹 Video loading... (readyState={ready_state}, networkState={network_state})")
-                            
-                            if video_info.get('error'):
-                                # Don't fail immediately on error - might recover
-                                error_code = video_info.get('errorCode')
-                                # MEDIA_ERR_SRC_NOT_SUPPORTED (4) is critical
-                                if error_code == 4:
-                                    print("ERROR: " + f"❌ Video format not supported (error code 4)")
-                                    print("ERROR: " + f"   Video src: {video_info.get('src')}")
-                                    break
-                                else:
-                                    print("WARNING: " + f"⚠️ Video element has error: {video_info.get('error')}")
-                                    print("WARNING: " + f"   Error code: {error_code}, continuing to wait...")
-                            
-                            # Check if video is actually playing (not just loaded)
-                            is_playing = not video_info.get('paused', True) and video_info.get('currentTime', 0) > 0
-                            
-                            # Video is ready if:
-                            # 1. Video is actually playing (best case)
-                            # 2. readyState >= 2 (HAVE_CURRENT_DATA) - has current frame data
-                            # 3. readyState >= 1 (HAVE_METADATA) AND networkState >= 2 (NETWORK_LOADING) - loading metadata
-                            # 4. Video has buffered data
-                            if is_playing:
-                                video_ready = True
-                                current_time = video_info.get('currentTime', 0)
-                                print(f"✅ Video is playing! (currentTime: {current_time:.2f}s, readyState: {ready_state})")
-                                break
-                            elif ready_state >= 2:
-                                video_ready = True
-                                print(f"✅ Video element is ready (readyState: {ready_state}, networkState: {network_state})")
-                                break
-                            elif ready_state >= 1 and (network_state >= 2 or video_info.get('buffered')):
-                                # Video is loading, continue waiting
-                                if network_state == 2:  # NETWORK_LOADING
-                                    print(f"⏳ Video is loading data (readyState: {ready_state}, networkState: {network_state})")
-                                elif video_info.get('buffered'):
-                                    video_ready = True
-                                    print(f"✅ Video has buffered data (readyState: {ready_state})")
-                                    break
-                            
-                    time.sleep(3)  # Check every 3 seconds
+                    self.page.evaluate(_PLAY_IF_PAUSED_JS)
+                    video_info = self.page.wait_for_function(
+                        _VIDEO_READY_JS,
+                        arg={"graceMs": _NO_SOURCE_GRACE_S * 1000, "start": int(time.time() * 1000)},
+                        timeout=video_wait_timeout * 1000, polling=250
+                    ).json_value()
                 except Exception as e:
-                    print("WARNING: " + f"⚠️ Error checking video: {e}")
-                    time.sleep(3)
+                    logger.warning(f"⚠️ Video not ready after waiting: {e}")
+                    break
+                
+                ready = video_info.get('ready')
+                ready_state = video_info.get('readyState')
+                network_state = video_info.get('networkState')
+                if ready == 'playing':
+                    video_ready = True
+                    logger.info(f"✅ Video is playing! (currentTime: {video_info.get('currentTime', 0):.2f}s, readyState: {ready_state})")
+                    break
+                if ready == 'ready':
+                    video_ready = True
+                    logger.info(f"✅ Video element is ready (readyState: {ready_state}, networkState: {network_state})")
+                    break
+                if ready == 'buffered':
+                    video_ready = True
+                    logger.info(f"✅ Video has buffered data (readyState: {ready_state})")
+                    break
+                
+                if video_info.get('failed') == 'error':
+                    logger.error(f"❌ Video failed with error code {video_info.get('errorCode')}: {video_info.get('error')}")
+                else:
+                    logger.error(f"❌ Video has had no source for {_NO_SOURCE_GRACE_S}s")
+                logger.error(f"   Video src: {video_info.get('src')}")
+                if attempt == 0 and self._click_start_live_button():
+                    logger.info("🔄 Start-from-live clicked again, waiting for video...")
+                    self.page.wait_for_timeout(self.NORMAL_WAIT_MS)
+                    continue
+                stream_failed = True
+                break
             
-            if not video_ready:
+            if not video_ready and not stream_failed:
                 # Final check - maybe video exists but not fully loaded
                 try:
-                    final_check = self.page.evaluate("""
-                        (function(){
-                            var v = document.querySelector('video');
-                            if (!v) return {exists: false};
-                            return {
-                                exists: true,
-                                readyState: v.readyState,
-                                networkState: v.networkState,
-                                error: v.error ? v.error.message : null,
-                                src: v.src || v.currentSrc || 'no src'
-                            };
-                        })()
-                    """)
+                    final_check = self.page.evaluate("window.__videoState()")
                     
                     if final_check.get('exists'):
-                        print("WARNING: " + f"⚠️ Video exists but not fully ready after {video_wait_timeout}s")
-                        print("WARNING: " + f"   readyState: {final_check.get('readyState')}, networkState: {final_check.get('networkState')}")
-                        print("WARNING: " + f"   src: {final_check.get('src')}")
+                        logger.warning(f"⚠️ Video exists but not fully ready after {video_wait_timeout}s")
+                        logger.warning(f"   readyState: {final_check.get('readyState')}, networkState: {final_check.get('networkState')}")
+                        logger.warning(f"   src: {final_check.get('src')}")
                         if final_check.get('error'):
-                            print("ERROR: " + f"   Error: {final_check.get('error')}")
+                            logger.error(f"   Error: {final_check.get('error')}")
                         # Continue anyway - might work
                         video_ready = True
                 except Exception:
                     pass
             
             if not video_ready:
-                print("ERROR: " + f"❌ Channel '{channel_name}' - Video element not ready after {video_wait_timeout} seconds")
-                print("ERROR: " + f"   This might indicate a stream error or loading issue")
-                print("ERROR: " + f"   Possible causes:")
-                print("ERROR: " + f"   - Network connectivity issues")
-                print("ERROR: " + f"   - Stream server not responding")
-                print("ERROR: " + f"   - Browser autoplay policy blocking")
-                print("ERROR: " + f"   - Video codec not supported")
-                print("ERROR: " + f"   Please check the browser manually to see if stream is playing")
+                logger.error(f"❌ Channel '{channel_name}' - Video element not ready after {video_wait_timeout} seconds")
+                logger.error(f"   This might indicate a stream error or loading issue")
+                logger.error(f"   Possible causes:")
+                logger.error(f"   - Network connectivity issues")
+                logger.error(f"   - Stream server not responding")
+                logger.error(f"   - Browser autoplay policy blocking")
+                logger.error(f"   - Video codec not supported")
+                logger.error(f"   Please check the browser manually to see if stream is playing")
                 return False, "", ""
             
-            # Poll video element directly for time
-            start_ts = time.time()
+            # Collect time samples in the page from the video's timeupdate events and fetch
+            # them in one call once two distinct seconds are in (or after poll_duration)
             collected_times = []
             pc_time_at_samples = []
-            poll_duration = 15  # Poll for 15 seconds to get a sample
+            poll_duration = 15  # Wait up to 15 seconds for the samples
             
-            while time.time() - start_ts < poll_duration:
+            try:
+                self.page.evaluate("window.__collectTimeSamples()")
                 try:
-                    vals = self.page.evaluate("""
-                        (function(){
-                            var v = document.querySelector('video');
-                            if (!v) return null;
-                            return [v.currentTime, v.duration];
-                        })()
-                    """)
-                    if vals and isinstance(vals, list) and len(vals) == 2:
-                        cur = vals[0] if vals[0] is not None else 0
-                        dur = vals[1] if vals[1] is not None else 0
-                        
-                        # Only collect if we have valid values
-                        if dur and dur > 0:
-                            def _fmt(sec):
-                                try:
-                                    sec = float(sec)
-                                    sec = int(sec)
-                                except Exception:
-                                    return "0:00"
-                                h = sec // 3600
-                                m = (sec % 3600) // 60
-                                s = sec % 60
-                                if h:
-                                    return f"{h}:{m:02d}:{s:02d}"
-                                return f"{m}:{s:02d}"
-                            
-                            direct_val = f"{_fmt(cur)} / {_fmt(dur)}"
-                            if direct_val not in collected_times:
-                                collected_times.append(direct_val)
-                                pc_time_at_samples.append(datetime.now().strftime("%H:%M:%S"))
-                                # Only log first sample, not every sample
-                                if len(collected_times) == 1:
-                                    print(f"📊 Collected time sample: {direct_val}")
-                                if len(collected_times) >= 2:
-                                    break
-                except Exception as e:
-                    print("WARNING: " + f"⚠️ Error polling video time: {e}")
-                    pass
-                time.sleep(2)
+                    self.page.wait_for_function(
+                        "() => window.__nimarSamples.length >= 2",
+                        timeout=poll_duration * 1000, polling=250
+                    )
+                except Exception:
+                    pass  # Use whatever was collected
+                samples = self.page.evaluate("window.__nimarSamples.splice(0)")
+                if not samples:
+                    # No timeupdate (e.g. paused video): take one direct reading instead
+                    vals = self._probe_video()
+                    if vals and vals[1]:
+                        samples = [[None, vals[0], vals[1]]]
+            except Exception as e:
+                logger.warning(f"⚠️ Error sampling video time: {e}")
+                samples = []
+            
+            seen_times = set()
+            for sampled_at, cur, dur in samples:
+                direct_val = f"{_fmt_clock(cur or 0)} / {_fmt_clock(dur)}"
+                if direct_val not in seen_times:
+                    seen_times.add(direct_val)
+                    collected_times.append(direct_val)
+                    sampled = datetime.fromtimestamp(sampled_at / 1000) if sampled_at else datetime.now()
+                    pc_time_at_samples.append(sampled.strftime("%H:%M:%S"))
+            if collected_times:
+                # Only log first sample, not every sample
+                logger.info(f"📊 Collected time sample: {collected_times[0]}")
             
             # Get results
             if collected_times:
@@ -1594,16 +1665,16 @@ class LiveTestSaveClipAutomation:
                 except Exception:
                     current_part = latest
                 
-                print(f"✅ Channel '{channel_name}' - Live time: {current_part}, PC time: {pc_now}")
+                logger.info(f"✅ Channel '{channel_name}' - Live time: {current_part}, PC time: {pc_now}")
                 return True, current_part, pc_now
             else:
-                print("ERROR: " + f"❌ Channel '{channel_name}' - Could not collect stream time after {poll_duration} seconds")
-                print("ERROR: " + f"   Video might not be playing or stream might have an error")
-                print("ERROR: " + f"   Please check the browser manually")
+                logger.error(f"❌ Channel '{channel_name}' - Could not collect stream time after {poll_duration} seconds")
+                logger.error(f"   Video might not be playing or stream might have an error")
+                logger.error(f"   Please check the browser manually")
                 return False, "", ""
             
         except Exception as e:
-            print("ERROR: " + f"NO: Error tracking stream time for channel '{channel_name}' -> {e}")
+            logger.error(f"NO: Error tracking stream time for channel '{channel_name}' -> {e}")
             return False, "", ""
     
     def verify_previous_days_streams(self, channel_name: str, days: int = 2) -> List[Tuple[str, bool, float]]:
@@ -1624,35 +1695,36 @@ class LiveTestSaveClipAutomation:
                 from datetime import datetime, timedelta
                 prev_date = (datetime.now() - timedelta(days=day_offset)).strftime("%Y-%m-%d")
                 
-                print(f"📅 Verifying {channel_name} - Previous day {day_offset}: {prev_date}")
+                logger.info(f"📅 Verifying {channel_name} - Previous day {day_offset}: {prev_date}")
                 
                 # Open calendar (must be on live view first)
-                time.sleep(3)
-                
                 # Verify we're on live view before opening calendar
                 try:
                     # Check if we're on live view by looking for calendar button or live controls
                     live_view_check = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[2]')
-                    live_view_check.wait_for(state="visible", timeout=5000)
-                    print(f"✅ Confirmed on live view before opening calendar")
+                    live_view_check.wait_for(state="visible", timeout=self._wait_ms)
+                    logger.info(f"✅ Confirmed on live view before opening calendar")
                 except Exception as e:
-                    print("ERROR: " + f"❌ Not on live view! Cannot open calendar. Error: {e}")
-                    print("ERROR: " + f"   Please ensure we're on the live stream view before verifying previous days")
+                    logger.error(f"❌ Not on live view! Cannot open calendar. Error: {e}")
+                    logger.error(f"   Please ensure we're on the live stream view before verifying previous days")
                     results.append((prev_date, False, 0.0))
                     continue
                 
                 calendar_opened = self.open_calendar()
-                time.sleep(3)
                 
                 if not calendar_opened:
-                    print("ERROR: " + f"❌ Calendar did NOT open for date {prev_date}")
-                    print("ERROR: " + f"   Cannot proceed with date selection")
+                    logger.error(f"❌ Calendar did NOT open for date {prev_date}")
+                    logger.error(f"   Cannot proceed with date selection")
                     results.append((prev_date, False, 0.0))
                     continue
                 
                 if calendar_opened:
-                    # Step 1: Click on date input field to open calendar modal
-                    time.sleep(3)
+                    # Step 1: Click on date input field to open calendar modal, once the
+                    # calendar has rendered it (or its picker)
+                    try:
+                        self.page.locator(_DATE_PICKER_CSS).first.wait_for(state="attached", timeout=self._wait_ms)
+                    except Exception:
+                        logger.warning("⚠️ Date input / picker not found after opening calendar")
                     date_input_clicked = False
                     
                     try:
@@ -1670,13 +1742,9 @@ class LiveTestSaveClipAutomation:
                             try:
                                 date_input = self.page.locator(selector).first
                                 if date_input.count() > 0:
-                                    date_input.wait_for(state="visible", timeout=5000)
-                                    date_input.scroll_into_view_if_needed()
-                                    time.sleep(1)
-                                    date_input.click()
-                                    print(f"✅ Date input clicked (selector: {selector})")
+                                    date_input.click(timeout=5000)
+                                    logger.info(f"✅ Date input clicked (selector: {selector})")
                                     date_input_clicked = True
-                                    time.sleep(2)
                                     break
                             except Exception:
                                 continue
@@ -1689,21 +1757,20 @@ class LiveTestSaveClipAutomation:
                                     dialog = dialogs.first
                                     date_input_in_dialog = dialog.locator('input').first
                                     if date_input_in_dialog.count() > 0:
-                                        date_input_in_dialog.wait_for(state="visible", timeout=5000)
-                                        date_input_in_dialog.scroll_into_view_if_needed()
-                                        time.sleep(1)
-                                        date_input_in_dialog.click()
-                                        print("✅ Date input clicked in dialog")
+                                        date_input_in_dialog.click(timeout=5000)
+                                        logger.info("✅ Date input clicked in dialog")
                                         date_input_clicked = True
-                                        time.sleep(2)
                             except Exception:
                                 pass
                         
                     except Exception as e:
-                        print("WARNING: " + f"⚠️ Could not click date input: {e}")
+                        logger.warning(f"⚠️ Could not click date input: {e}")
                     
-                    # Step 2: Wait for calendar modal to open
-                    time.sleep(2)
+                    # Step 2: Wait for calendar modal to open (its day cells)
+                    try:
+                        self.page.locator(_CALENDAR_DAYS_CSS).first.wait_for(state="attached", timeout=self._wait_ms)
+                    except Exception:
+                        logger.warning("⚠️ Calendar day grid not found, trying the date strategies anyway")
                     
                     # Step 3: Click on the specific date in the calendar grid
                     date_selected = False
@@ -1731,13 +1798,9 @@ class LiveTestSaveClipAutomation:
                             try:
                                 date_button = self.page.locator(strategy).first
                                 if date_button.count() > 0:
-                                    date_button.wait_for(state="visible", timeout=5000)
-                                    date_button.scroll_into_view_if_needed()
-                                    time.sleep(1)
-                                    date_button.click(force=True)
-                                    print(f"✅ Date {day_number} clicked in calendar (strategy: {strategy[:50]})")
+                                    date_button.click(force=True, timeout=5000)
+                                    logger.info(f"✅ Date {day_number} clicked in calendar (strategy: {strategy[:50]})")
                                     date_selected = True
-                                    time.sleep(2)
                                     break
                             except Exception:
                                 continue
@@ -1745,304 +1808,190 @@ class LiveTestSaveClipAutomation:
                         # Fallback: JavaScript click on date button
                         if not date_selected:
                             try:
-                                click_date_js = f"""
-                                (function(dayNum, dateStr){{
-                                    // Find all buttons in calendar
-                                    const buttons = Array.from(document.querySelectorAll('button, [role="button"]'));
-                                    for (const btn of buttons) {{
-                                        const text = (btn.textContent || '').trim();
-                                        const ariaLabel = (btn.getAttribute('aria-label') || '').toLowerCase();
-                                        const dataDate = btn.getAttribute('data-date');
-                                        
-                                        // Check if button matches day number or date
-                                        if (text === String(dayNum) || 
-                                            text === String(dayNum).padStart(2, '0') ||
-                                            ariaLabel.includes(dateStr.toLowerCase()) ||
-                                            dataDate === dateStr) {{
-                                            // Make sure it's in a calendar context
-                                            const parent = btn.closest('[role="dialog"], [role="presentation"], .MuiPickersPopper-root, .MuiPopover-root, .MuiCalendarPicker-root');
-                                            if (parent) {{
-                                                btn.click();
-                                                return true;
-                                            }}
-                                        }}
-                                    }}
-                                    return false;
-                                }})({day_number}, '{prev_date}')
-                                """
-                                result = self.page.evaluate(click_date_js)
+                                result = self.page.evaluate(_CLICK_CALENDAR_DAY_JS, [day_number, prev_date])
                                 if result:
-                                    print(f"✅ Date {day_number} clicked via JavaScript")
+                                    logger.info(f"✅ Date {day_number} clicked via JavaScript")
                                     date_selected = True
-                                    time.sleep(2)
                             except Exception as js_err:
-                                print("WARNING: " + f"⚠️ JavaScript date click failed: {js_err}")
+                                logger.warning(f"⚠️ JavaScript date click failed: {js_err}")
                         
                     except Exception as date_select_err:
-                        print("ERROR: " + f"❌ Error selecting date {prev_date}: {date_select_err}")
+                        logger.error(f"❌ Error selecting date {prev_date}: {date_select_err}")
                     
                     if not date_selected:
-                        print("ERROR: " + f"❌ Could not select date {prev_date} from calendar modal")
-                        print("ERROR: " + f"   Trying fallback: Direct date input set")
+                        logger.error(f"❌ Could not select date {prev_date} from calendar modal")
+                        logger.error(f"   Trying fallback: Direct date input set")
                         
                         # Fallback: Try direct date input set
                         try:
-                            set_date_js = """
-                              (function(dateValue){
-                                function setVal(el, val){
-                                  el.value = val;
-                                  el.dispatchEvent(new Event('input', {bubbles:true}));
-                                  el.dispatchEvent(new Event('change', {bubbles:true}));
-                                }
-                                const isVisible = el => !!(el && el.offsetParent !== null);
-                                const inputs = Array.from(document.querySelectorAll('input'))
-                                  .filter(isVisible);
-                                let changed = false;
-                                for (const el of inputs){
-                                  const t = (el.getAttribute('type')||'').toLowerCase();
-                                  const ph = (el.getAttribute('placeholder')||'').toLowerCase();
-                                  const ar = (el.getAttribute('aria-label')||'').toLowerCase();
-                                  const name = (el.getAttribute('name')||'').toLowerCase();
-                                  if (t === 'date' || ph.includes('date') || ar.includes('date') || name.includes('date')){
-                                    setVal(el, dateValue); changed = true; break;
-                                  }
-                                }
-                                if (!changed){
-                                  const dialogs = Array.from(document.querySelectorAll('[role="dialog"], [role="presentation"], .MuiPickersPopper-root, .MuiPopover-root'));
-                                  for (const d of dialogs){
-                                    const el = d.querySelector('input');
-                                    if (isVisible(el)){ setVal(el, dateValue); changed = true; break; }
-                                  }
-                                }
-                                return changed;
-                              })
-                            """
-                            ok = self.page.evaluate(set_date_js, prev_date)
+                            ok = self.page.evaluate(_SET_DATE_INPUT_JS, prev_date)
                             if ok:
-                                print(f"✅ Set date via fallback method: {prev_date}")
+                                logger.info(f"✅ Set date via fallback method: {prev_date}")
                                 date_selected = True
                             else:
-                                print("ERROR: " + f"❌ Fallback date set also failed")
+                                logger.error(f"❌ Fallback date set also failed")
                                 results.append((prev_date, False, 0.0))
                                 continue
                         except Exception as fallback_err:
-                            print("ERROR: " + f"❌ Fallback date set error: {fallback_err}")
+                            logger.error(f"❌ Fallback date set error: {fallback_err}")
                             results.append((prev_date, False, 0.0))
                             continue
                     
                     # Step 4: Close calendar modal (if still open)
-                    time.sleep(2)
                     try:
                         # Try pressing Escape to close calendar
                         self.page.keyboard.press("Escape")
-                        time.sleep(1)
-                        print("✅ Calendar closed (Escape key)")
+                        logger.info("✅ Calendar closed (Escape key)")
                     except Exception:
                         # Try clicking outside calendar
                         try:
                             self.page.mouse.click(100, 100)
-                            time.sleep(1)
-                            print("✅ Calendar closed (clicked outside)")
+                            logger.info("✅ Calendar closed (clicked outside)")
                         except Exception:
-                            print("WARNING: " + "⚠️ Could not close calendar, continuing anyway...")
-                            time.sleep(1)
+                            logger.warning("⚠️ Could not close calendar, continuing anyway...")
+                    try:
+                        self.page.locator(_PICKER_POPUP_CSS).first.wait_for(state="hidden", timeout=self.FAST_WAIT_MS)
+                    except Exception:
+                        pass
                 
-                # Click Get Stream button - Forcefully with multiple strategies
-                wait_timeout = WAIT_TIMEOUT or 20
-                wait_timeout_ms = wait_timeout * 1000
+                # Video src before Get Stream, so the duration wait below can tell the
+                # previous day's stream from the one still on screen
+                old_src = None
+                try:
+                    old_src = (self.page.evaluate(_VIDEO_SRC_TIME_JS) or [None])[0]
+                except Exception:
+                    pass
                 
+                # Click Get Stream button - Forcefully with multiple strategies (each click
+                # waits for the button itself)
                 get_stream_clicked = False
-                time.sleep(3)
                 
                 # Strategy 1: Direct click with force
                 try:
                     get_stream_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[4]/div/div/div[2]/div/button/span')
-                    get_stream_btn.wait_for(state="visible", timeout=wait_timeout)
-                    get_stream_btn.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    get_stream_btn.click(force=True)
-                    print(f"✅ Get Stream clicked for {prev_date} (method 1: direct force click)")
+                    get_stream_btn.click(force=True, timeout=self._wait_ms)
+                    logger.info(f"✅ Get Stream clicked for {prev_date} (method 1: direct force click)")
                     get_stream_clicked = True
                 except Exception as e1:
-                    print("WARNING: " + f"⚠️ Method 1 failed: {e1}")
+                    logger.warning(f"⚠️ Method 1 failed: {e1}")
                     
                     # Strategy 2: JavaScript click on span
                     try:
                         get_stream_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[4]/div/div/div[2]/div/button/span')
-                        get_stream_btn.wait_for(state="visible", timeout=wait_timeout)
-                        get_stream_btn.scroll_into_view_if_needed()
-                        time.sleep(1)
-                        get_stream_btn.evaluate("el => el.click()")
-                        print(f"✅ Get Stream clicked for {prev_date} (method 2: JavaScript on span)")
+                        get_stream_btn.evaluate("el => el.click()", timeout=self.FAST_WAIT_MS)
+                        logger.info(f"✅ Get Stream clicked for {prev_date} (method 2: JavaScript on span)")
                         get_stream_clicked = True
                     except Exception as e2:
-                        print("WARNING: " + f"⚠️ Method 2 failed: {e2}")
+                        logger.warning(f"⚠️ Method 2 failed: {e2}")
                         
                         # Strategy 3: Click parent button
                         try:
                             get_stream_btn_parent = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[4]/div/div/div[2]/div/button')
-                            get_stream_btn_parent.wait_for(state="visible", timeout=wait_timeout)
-                            get_stream_btn_parent.scroll_into_view_if_needed()
-                            time.sleep(1)
-                            get_stream_btn_parent.click(force=True)
-                            print(f"✅ Get Stream clicked for {prev_date} (method 3: parent button)")
+                            get_stream_btn_parent.click(force=True, timeout=self.FAST_WAIT_MS)
+                            logger.info(f"✅ Get Stream clicked for {prev_date} (method 3: parent button)")
                             get_stream_clicked = True
                         except Exception as e3:
-                            print("WARNING: " + f"⚠️ Method 3 failed: {e3}")
+                            logger.warning(f"⚠️ Method 3 failed: {e3}")
                             
                             # Strategy 4: JavaScript click on parent button
                             try:
                                 get_stream_btn_parent = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[4]/div/div/div[2]/div/button')
-                                get_stream_btn_parent.wait_for(state="visible", timeout=wait_timeout)
-                                get_stream_btn_parent.scroll_into_view_if_needed()
-                                time.sleep(1)
-                                get_stream_btn_parent.evaluate("el => el.click()")
-                                print(f"✅ Get Stream clicked for {prev_date} (method 4: JavaScript on parent)")
+                                get_stream_btn_parent.evaluate("el => el.click()", timeout=self.FAST_WAIT_MS)
+                                logger.info(f"✅ Get Stream clicked for {prev_date} (method 4: JavaScript on parent)")
                                 get_stream_clicked = True
                             except Exception as e4:
-                                print("ERROR: " + f"❌ All methods failed to click Get Stream: {e4}")
+                                logger.error(f"❌ All methods failed to click Get Stream: {e4}")
                                 results.append((prev_date, False, 0.0))
                                 continue
                 
                 if not get_stream_clicked:
-                    print("ERROR: " + f"❌ Could not click Get Stream button for {prev_date}")
+                    logger.error(f"❌ Could not click Get Stream button for {prev_date}")
                     results.append((prev_date, False, 0.0))
                     continue
                 
-                # Wait after Get Stream click (as requested by user)
-                wait_after_get_stream = WAIT_AFTER_GET_STREAM or 5
-                wait_after_get_stream = float(wait_after_get_stream)
-                print(f"⏳ Waiting {wait_after_get_stream} seconds after Get Stream click...")
-                time.sleep(wait_after_get_stream)
-                
-                # Verify URL contains the previous date (critical check)
-                # Wait longer for URL to update after Get Stream click
+                # Wait for the URL to switch to the previous date; returns as soon as the
+                # portal navigates instead of after a fixed pause plus 1s URL polls
                 url_verified = False
-                current_url = ""
                 max_url_wait = 15  # Wait up to 15 seconds for URL to update
-                url_check_start = time.time()
-                
-                print(f"🔍 Checking URL for date {prev_date}...")
-                while time.time() - url_check_start < max_url_wait:
-                    try:
-                        current_url = self.page.url
-                        print(f"   Current URL: {current_url}")
-                        if prev_date in current_url:
-                            url_verified = True
-                            print(f"✅ URL verified: Contains date {prev_date} in URL")
-                            break
-                    except Exception:
-                        pass
-                    time.sleep(1)  # Check every second
+                logger.info(f"🔍 Checking URL for date {prev_date}...")
+                try:
+                    self.page.wait_for_url(
+                        lambda url: prev_date in url, wait_until="commit", timeout=max_url_wait * 1000
+                    )
+                    url_verified = True
+                    logger.info(f"✅ URL verified: Contains date {prev_date} in URL")
+                except Exception:
+                    pass
+                current_url = self.page.url
                 
                 if not url_verified:
-                    print("ERROR: " + f"❌ {channel_name} - {prev_date}: URL does NOT contain date {prev_date}")
-                    print("ERROR: " + f"   Current URL: {current_url}")
-                    print("ERROR: " + f"   Expected date in URL: {prev_date}")
-                    print("ERROR: " + f"   Stream for {prev_date} is NOT available (URL did not update)")
+                    logger.error(f"❌ {channel_name} - {prev_date}: URL does NOT contain date {prev_date}")
+                    logger.error(f"   Current URL: {current_url}")
+                    logger.error(f"   Expected date in URL: {prev_date}")
+                    logger.error(f"   Stream for {prev_date} is NOT available (URL did not update)")
                     results.append((prev_date, False, 0.0))
                     continue
                 
-                # Quick duration check (no wait for video to play, just capture if available)
-                # Wait 5 seconds is already done above, now just check duration
+                # Wait (up to WAIT_AFTER_GET_STREAM + 2s) for the new stream's metadata; returns
+                # on the first finite duration of a src other than the one before the click
+                # instead of after the full wait (no play needed)
                 duration_seconds = 0.0
                 loaded = False
-                
+                wait_after_get_stream = float(WAIT_AFTER_GET_STREAM or 5)
+                logger.info(f"⏳ Waiting up to {wait_after_get_stream + 2:.0f} seconds for the stream duration...")
                 try:
-                    # Quick check for video duration immediately (no play, just metadata)
-                    vals = self.page.evaluate(
-                        """
-                        (function(){
-                            var v = document.querySelector('video');
-                            if(!v) return null;
-                            // Just get duration if available, don't try to play
-                            var dur = v.duration;
-                            if(isFinite(dur) && dur > 0) {
-                                return [v.readyState, dur];
-                            }
-                            // If duration not available, try loading metadata only (fast)
-                            try {
-                                v.load(); // Load metadata without playing
-                            } catch(e) {}
-                            // Return current state
-                            return [v.readyState, isFinite(v.duration) && v.duration > 0 ? v.duration : null];
-                        })()
-                        """
-                    )
-                    
-                    if vals and isinstance(vals, list) and len(vals) == 2:
-                        rs, dur = vals
-                        if dur and float(dur) > 0:
-                            loaded = True
-                            duration_seconds = float(dur)
-                            print(f"✅ {channel_name} - {prev_date}: Duration captured - {duration_seconds:.0f} seconds")
-                        else:
-                            # One quick retry after 2 seconds (total ~7 seconds from Get Stream click)
-                            time.sleep(2)
-                            vals2 = self.page.evaluate(
-                                """
-                                (function(){
-                                    var v = document.querySelector('video');
-                                    if(!v) return null;
-                                    var dur = v.duration;
-                                    return [v.readyState, isFinite(dur) && dur > 0 ? dur : null];
-                                })()
-                                """
-                            )
-                            if vals2 and isinstance(vals2, list) and len(vals2) == 2:
-                                rs2, dur2 = vals2
-                                if dur2 and float(dur2) > 0:
-                                    loaded = True
-                                    duration_seconds = float(dur2)
-                                    print(f"✅ {channel_name} - {prev_date}: Duration captured (retry) - {duration_seconds:.0f} seconds")
+                    dur = self.page.wait_for_function(
+                        _VIDEO_DURATION_JS, arg=old_src,
+                        timeout=(wait_after_get_stream + 2) * 1000, polling=250
+                    ).json_value()
+                    loaded = True
+                    duration_seconds = float(dur)
+                    logger.info(f"✅ {channel_name} - {prev_date}: Duration captured - {duration_seconds:.0f} seconds")
                 except Exception as dur_err:
-                    print("WARNING: " + f"⚠️ Error checking duration: {dur_err}")
+                    logger.warning(f"⚠️ Error checking duration: {dur_err}")
                 
                 if loaded and duration_seconds > 0:
                     hours = duration_seconds / 3600.0
                     h = int(duration_seconds) // 3600
                     m = (int(duration_seconds) % 3600) // 60
                     s = int(duration_seconds) % 60
-                    print(f"✅ {channel_name} - {prev_date}: Stream duration - {hours:.2f} hours ({h}:{m:02d}:{s:02d})")
+                    logger.info(f"✅ {channel_name} - {prev_date}: Stream duration - {hours:.2f} hours ({h}:{m:02d}:{s:02d})")
                     results.append((prev_date, True, duration_seconds))
                 else:
-                    print("WARNING: " + f"⚠️ {channel_name} - {prev_date}: Duration not available (stream might not exist)")
+                    logger.warning(f"⚠️ {channel_name} - {prev_date}: Duration not available (stream might not exist)")
                     results.append((prev_date, False, 0.0))
                 
                 # After verifying each day, go back to live view for next day verification
                 # (We need to be on live view to open calendar again for next day)
                 if day_offset < days:
-                    print(f"↩️ Returning to live view for next day verification...")
-                    time.sleep(3)
+                    logger.info(f"↩️ Returning to live view for next day verification...")
+                    # return_to_live() waits for the live view; the next day's calendar
+                    # button check waits for the rest
                     return_success = self.return_to_live()
                     if not return_success:
-                        print("ERROR: " + f"❌ Failed to return to live view after verifying {prev_date}")
-                        print("ERROR: " + f"   Cannot proceed with next day verification")
+                        logger.error(f"❌ Failed to return to live view after verifying {prev_date}")
+                        logger.error(f"   Cannot proceed with next day verification")
                         # Try to continue anyway, but log the issue
-                    time.sleep(3)
                     
             except Exception as e:
-                print("ERROR: " + f"❌ Error verifying {prev_date} for {channel_name}: {e}")
+                logger.error(f"❌ Error verifying {prev_date} for {channel_name}: {e}")
                 results.append((prev_date, False, 0.0))
                 # Try to return to live even if error occurred
                 try:
                     if day_offset < days:
                         self.return_to_live()
-                        time.sleep(2)
                 except Exception:
                     pass
         
         # After all days are verified, ensure we're back on live view
         try:
-            print(f"↩️ Final return to live view after all days verified...")
-            time.sleep(3)
+            logger.info(f"↩️ Final return to live view after all days verified...")
             return_success = self.return_to_live()
             if not return_success:
-                print("ERROR: " + f"❌ Failed to return to live view after verifying all days")
-                print("ERROR: " + f"   This might cause issues when going back to channel list")
-            time.sleep(3)
+                logger.error(f"❌ Failed to return to live view after verifying all days")
+                logger.error(f"   This might cause issues when going back to channel list")
         except Exception as e:
-            print("ERROR: " + f"❌ Exception while returning to live view: {e}")
+            logger.error(f"❌ Exception while returning to live view: {e}")
         
         return results
     
@@ -2056,82 +2005,67 @@ class LiveTestSaveClipAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
-            print("↩️ Going back to channel list...")
-            time.sleep(2)
+            logger.info("↩️ Going back to channel list...")
+            channels_container = self.page.locator(self.CHANNELS_CONTAINER_CSS)
             
             # Method 1: Use navigate_to_live_menu() which has logout protection
             try:
                 if self.navigate_to_live_menu():
-                    # Verify we're on channel list
-                    try:
-                        channels_container = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div')
-                        channels_container.wait_for(state="visible", timeout=wait_timeout)
-                        print("✅ Successfully returned to channel list")
-                        time.sleep(2)
-                        return True
-                    except Exception:
-                        print("WARNING: " + "⚠️ navigate_to_live_menu succeeded but channel list not verified")
-                        # Still return True as navigation might have worked
-                        return True
+                    # Verify we're on channel list (navigate_to_live_menu already waited for it)
+                    if self._poll(channels_container.is_visible, timeout=self.FAST_WAIT_MS / 1000):
+                        logger.info("✅ Successfully returned to channel list")
+                    else:
+                        logger.warning("⚠️ navigate_to_live_menu succeeded but channel list not verified")
+                    # Still return True as navigation might have worked
+                    return True
             except Exception as e1:
-                print("WARNING: " + f"⚠️ navigate_to_live_menu failed: {e1}")
+                logger.warning(f"⚠️ navigate_to_live_menu failed: {e1}")
             
             # Method 2: Try specific XPath for Live button (if available)
             try:
                 sidebar = self.page.locator('//*[@id="root"]/div/div[1]')
-                sidebar.wait_for(state="visible", timeout=wait_timeout)
+                sidebar.wait_for(state="visible", timeout=self._wait_ms)
                 
                 live_buttons = sidebar.locator("//p[normalize-space()='Live']")
-                for i in range(live_buttons.count()):
+                # Parent text of every candidate in one round-trip (used to skip logout)
+                parent_texts = live_buttons.evaluate_all(
+                    "els => els.map(el => (el.closest('div, a, button')?.textContent || '').toLowerCase())"
+                )
+                for i, parent_text in enumerate(parent_texts):
                     try:
                         btn = live_buttons.nth(i)
                         # Check it's not logout
-                        parent_text = btn.evaluate("el => (el.closest('div, a, button')?.textContent || '').toLowerCase()")
                         if 'logout' not in parent_text:
-                            btn.wait_for(state="visible", timeout=2000)
-                            btn.scroll_into_view_if_needed()
-                            time.sleep(0.5)
+                            btn.wait_for(state="visible", timeout=self.FAST_WAIT_MS)
                             btn.click()
-                            print(f"✅ Clicked Live button (method 2, button {i+1})")
-                            time.sleep(3)
+                            logger.info(f"✅ Clicked Live button (method 2, button {i+1})")
                             
-                            # Verify we're on channel list
-                            try:
-                                channels_container = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div')
-                                channels_container.wait_for(state="visible", timeout=wait_timeout)
-                                print("✅ Successfully returned to channel list (method 2)")
+                            # Verify we're on channel list (backoff polling instead of a fixed 3s pause)
+                            if self._poll(channels_container.is_visible, timeout=self.NORMAL_WAIT_MS / 1000):
+                                logger.info("✅ Successfully returned to channel list (method 2)")
                                 return True
-                            except Exception:
-                                pass
                     except Exception:
                         continue
             except Exception as e2:
-                print("WARNING: " + f"⚠️ Method 2 failed: {e2}")
+                logger.warning(f"⚠️ Method 2 failed: {e2}")
             
             # Method 3: Try browser back as last resort
             try:
                 self.page.go_back()
-                print("✅ Used browser back to go to channel list")
-                time.sleep(3)
+                logger.info("✅ Used browser back to go to channel list")
                 
-                # Verify we're on channel list
-                try:
-                    channels_container = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div')
-                    channels_container.wait_for(state="visible", timeout=wait_timeout)
-                    print("✅ Successfully returned to channel list (method 3 - browser back)")
-                    return True
-                except Exception:
-                    print("WARNING: " + "⚠️ Browser back executed but channel list not verified")
-                    return True  # Still return True as navigation might have worked
+                # Verify we're on channel list (backoff polling instead of a fixed 3s pause)
+                if self._poll(channels_container.is_visible, timeout=self._wait_s):
+                    logger.info("✅ Successfully returned to channel list (method 3 - browser back)")
+                else:
+                    logger.warning("⚠️ Browser back executed but channel list not verified")
+                return True  # Still return True as navigation might have worked
             except Exception as e3:
-                print("ERROR: " + f"❌ All methods failed to go back to channel list: {e3}")
+                logger.error(f"❌ All methods failed to go back to channel list: {e3}")
                 return False
                     
         except Exception as e:
-            print("ERROR: " + f"NO: Error going back to channel list -> {e}")
+            logger.error(f"NO: Error going back to channel list -> {e}")
             return False
     
     def process_all_channels(self) -> List[dict]:
@@ -2156,23 +2090,22 @@ class LiveTestSaveClipAutomation:
         channels = self.get_all_channels()
         
         if not channels:
-            print("ERROR: " + "❌ No channels found. Cannot process.")
+            logger.error("❌ No channels found. Cannot process.")
             return results
         
-        print(f"\n{'='*80}")
-        print(f"📺 Processing {len(channels)} channels...")
-        print(f"{'='*80}\n")
+        logger.info(f"\n{'='*80}")
+        logger.info(f"📺 Processing {len(channels)} channels...")
+        logger.info(f"{'='*80}\n")
         
         for channel_name, channel_index in channels:
             try:
-                print(f"\n{'='*80}")
-                print(f"📺 Processing Channel: {channel_name} (Index: {channel_index})")
-                print(f"{'='*80}")
+                logger.info(f"\n{'='*80}")
+                logger.info(f"📺 Processing Channel: {channel_name} (Index: {channel_index})")
+                logger.info(f"{'='*80}")
                 
-                # Step 1: Open channel
-                time.sleep(3)
+                # Step 1: Open channel (open_channel waits for the list and for the channel view)
                 if not self.open_channel(channel_index, channel_name):
-                    print("ERROR: " + f"❌ Failed to open channel: {channel_name}")
+                    logger.error(f"❌ Failed to open channel: {channel_name}")
                     results.append({
                         'channel_name': channel_name,
                         'channel_index': channel_index,
@@ -2183,69 +2116,49 @@ class LiveTestSaveClipAutomation:
                     })
                     continue
                 
-                # Wait after opening channel
-                time.sleep(3)
-                
                 # Step 2: Click live button to go to live state (using specific XPath)
-                print(f"🔴 Clicking live button to go to live state...")
+                logger.info(f"🔴 Clicking live button to go to live state...")
                 live_button_clicked = False
-                wait_timeout = WAIT_TIMEOUT or 20
-                wait_timeout_ms = wait_timeout * 1000
-                
+                # Use the specific XPath provided by user
+                live_btn = self.page.locator(self.START_LIVE_BTN_CSS)
                 try:
-                    # Use the specific XPath provided by user
-                    live_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]/p')
-                    live_btn.wait_for(state="visible", timeout=wait_timeout)
-                    live_btn.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    live_btn.click(force=True)
-                    print(f"✅ Live button clicked (using specific XPath)")
+                    live_btn.click(force=True, timeout=self._wait_ms)
+                    logger.info(f"✅ Live button clicked (using specific XPath)")
                     live_button_clicked = True
-                    time.sleep(3)
                 except Exception as e1:
-                    print("WARNING: " + f"⚠️ Direct click failed: {e1}, trying JavaScript...")
+                    logger.warning(f"⚠️ Direct click failed: {e1}, trying JavaScript...")
                     try:
-                        live_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]/p')
                         live_btn.evaluate("el => el.click()")
-                        print(f"✅ Live button clicked via JavaScript")
+                        logger.info(f"✅ Live button clicked via JavaScript")
                         live_button_clicked = True
-                        time.sleep(3)
                     except Exception as e2:
-                        print("ERROR: " + f"❌ Failed to click live button: {e2}")
+                        logger.error(f"❌ Failed to click live button: {e2}")
                 
                 if not live_button_clicked:
-                    print("WARNING: " + f"⚠️ Could not click live button for: {channel_name}, continuing anyway...")
+                    logger.warning(f"⚠️ Could not click live button for: {channel_name}, continuing anyway...")
                 
-                # Wait for stream to start
-                time.sleep(5)
-                
-                # Step 3: Track live stream time and compare with PC time
-                print(f"⏱️ Tracking stream time and comparing with PC time...")
+                # Step 3: Track live stream time and compare with PC time (it starts by
+                # waiting for the video to be ready, so no pause for the stream to start)
+                logger.info(f"⏱️ Tracking stream time and comparing with PC time...")
                 live_success, live_time, pc_time = self.track_live_stream_time(channel_name)
                 
                 # Compare and report stream time vs PC time
                 if live_success and live_time and pc_time:
-                    print(f"\n{'='*80}")
-                    print(f"⏱️ TIME COMPARISON FOR {channel_name}")
-                    print(f"{'='*80}")
-                    print(f"📺 Stream Time: {live_time}")
-                    print(f"🖥️  PC Time:     {pc_time}")
-                    print(f"{'='*80}\n")
+                    logger.info(f"\n{'='*80}")
+                    logger.info(f"⏱️ TIME COMPARISON FOR {channel_name}")
+                    logger.info(f"{'='*80}")
+                    logger.info(f"📺 Stream Time: {live_time}")
+                    logger.info(f"🖥️  PC Time:     {pc_time}")
+                    logger.info(f"{'='*80}\n")
                 else:
-                    print("WARNING: " + f"⚠️ Could not track live time for: {channel_name}")
+                    logger.warning(f"⚠️ Could not track live time for: {channel_name}")
                     live_time = ""
                     pc_time = ""
                 
-                # Wait after tracking time
-                time.sleep(3)
-                
                 # Step 4 & 5: Verify previous 2 days (1 day old and 2 days old)
-                print(f"📅 Verifying previous days streams (1 day and 2 days old)...")
+                logger.info(f"📅 Verifying previous days streams (1 day and 2 days old)...")
                 previous_days_results = self.verify_previous_days_streams(channel_name, days=2)
                 
-                # Wait after verification
-                time.sleep(3)
-                
                 # Store results
                 channel_result = {
                     'channel_name': channel_name,
@@ -2258,12 +2171,12 @@ class LiveTestSaveClipAutomation:
                 results.append(channel_result)
                 
                 # Print detailed summary for this channel
-                print(f"\n{'='*80}")
-                print(f"📊 FINAL SUMMARY FOR {channel_name}")
-                print(f"{'='*80}")
-                print(f"⏱️ Stream Time: {live_time if live_time else 'N/A'}")
-                print(f"🖥️  PC Time:     {pc_time if pc_time else 'N/A'}")
-                print(f"\n📅 Previous Days Streams:")
+                logger.info(f"\n{'='*80}")
+                logger.info(f"📊 FINAL SUMMARY FOR {channel_name}")
+                logger.info(f"{'='*80}")
+                logger.info(f"⏱️ Stream Time: {live_time if live_time else 'N/A'}")
+                logger.info(f"🖥️  PC Time:     {pc_time if pc_time else 'N/A'}")
+                logger.info(f"\n📅 Previous Days Streams:")
                 for date, loaded, duration in previous_days_results:
                     status = "✅ Loaded" if loaded else "❌ Not Loaded"
                     if loaded:
@@ -2271,22 +2184,21 @@ class LiveTestSaveClipAutomation:
                         h = int(duration) // 3600
                         m = (int(duration) % 3600) // 60
                         s = int(duration) % 60
-                        print(f"   {date}: {status} - Total Duration: {hours:.2f} hours ({h}:{m:02d}:{s:02d})")
+                        logger.info(f"   {date}: {status} - Total Duration: {hours:.2f} hours ({h}:{m:02d}:{s:02d})")
                     else:
-                        print(f"   {date}: {status}")
-                print(f"{'='*80}\n")
+                        logger.info(f"   {date}: {status}")
+                logger.info(f"{'='*80}\n")
                 
                 # Step 6: Go back to channel list (for all channels except last)
                 if channel_index < channels[-1][1]:  # Not the last channel
-                    print(f"↩️ Going back to channel list for next channel...")
-                    time.sleep(3)
+                    logger.info(f"↩️ Going back to channel list for next channel...")
+                    # Both paths wait for the channel list container themselves
                     if not self.go_back_to_channel_list():
-                        print("WARNING: " + f"⚠️ Failed to go back to channel list, trying navigate_to_live_menu...")
+                        logger.warning(f"⚠️ Failed to go back to channel list, trying navigate_to_live_menu...")
                         self.navigate_to_live_menu()
-                    time.sleep(3)
                     
             except Exception as e:
-                print("ERROR: " + f"❌ Error processing channel {channel_name}: {e}")
+                logger.error(f"❌ Error processing channel {channel_name}: {e}")
                 results.append({
                     'channel_name': channel_name,
                     'channel_index': channel_index,
@@ -2297,7 +2209,7 @@ class LiveTestSaveClipAutomation:
                 })
                 # Try to go back to channel list
                 try:
-                    print(f"↩️ Attempting to go back to channel list after error...")
+                    logger.info(f"↩️ Attempting to go back to channel list after error...")
                     self.go_back_to_channel_list()
                 except Exception:
                     try:
@@ -2309,7 +2221,7 @@ class LiveTestSaveClipAutomation:
     
     def track_stream_time(self) -> bool:
         """
-        Track live stream time using MutationObserver and console log polling.
+        Track live stream time using MutationObserver and in-page time samples.
         
         This method sets up JavaScript observers to track stream time updates
         and collects samples for comparison.
@@ -2318,154 +2230,52 @@ class LiveTestSaveClipAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
             # Ensure video element is present
             video = self.page.locator("video")
-            video.wait_for(state="attached", timeout=wait_timeout)
-            
-            # Setup MutationObserver JavaScript
-            setup_observer_js = r"""
-      (function(){
-        const TAG = '[STREAM_TIME]';
-        const seen = new Set();
-        const timePattern = /\b\d{1,2}:\d{2}(?::\d{2})?(\s*\/\s*\d{1,2}:\d{2}(?::\d{2})?)?\b/;
-
-        function scanAllTextNodes(root){
-          const walker = document.createTreeWalker(root || document.body, NodeFilter.SHOW_TEXT, null);
-          const found = [];
-          let node;
-          while ((node = walker.nextNode())){
-            const t = (node.textContent || '').trim();
-            if (!t) continue;
-            const m = t.match(timePattern);
-            if (m && m[0]){
-              const val = m[0];
-              if (!seen.has(val)){
-                seen.add(val);
-                found.push(val);
-              }
-            }
-          }
-          return found;
-        }
-
-        const initial = scanAllTextNodes(document.body);
-        if (initial.length){
-          console.log(TAG + ' initial: ' + initial.join(', '));
-        }
-
-        if (!window.__streamTimeObserver){
-          window.__streamTimeObserver = new MutationObserver((mutations)=>{
-            let any = false;
-            for (const m of mutations){
-              if (m.type === 'childList'){
-                m.addedNodes && m.addedNodes.forEach(n=>{
-                  if (n.nodeType === Node.TEXT_NODE){
-                    const t = (n.textContent||'').trim();
-                    const mm = t.match(timePattern);
-                    if (mm && mm[0] && !seen.has(mm[0])){ seen.add(mm[0]); console.log(TAG + ' update: ' + mm[0]); any = true; }
-                  } else if (n.nodeType === Node.ELEMENT_NODE){
-                    const f = scanAllTextNodes(n);
-                    if (f.length){ console.log(TAG + ' update: ' + f.join(', ')); any = true; }
-                  }
-                });
-              } else if (m.type === 'characterData'){
-                const t = (m.target && m.target.data || '').trim();
-                const mm = t.match(timePattern);
-                if (mm && mm[0] && !seen.has(mm[0])){ seen.add(mm[0]); console.log(TAG + ' update: ' + mm[0]); any = true; }
-              } else if (m.type === 'attributes'){
-                const el = m.target;
-                const f = scanAllTextNodes(el);
-                if (f.length){ console.log(TAG + ' update: ' + f.join(', ')); any = true; }
-              }
-            }
-          });
-          window.__streamTimeObserver.observe(document.body, { subtree: true, childList: true, characterData: true, attributes: true });
-        }
-
-                return initial;
-              })();
-            """
-
-            initial_matches = self.page.evaluate(setup_observer_js)
-            # Don't log initial matches - too verbose
-            
-            # Fallback: poll video element
-            setup_video_poll_js = """
-          (function(){
-            if (window.__streamTimeVideoTimer) return 'already-set';
-            function fmt(sec){
-              if (isNaN(sec) || sec < 0) return '0:00';
-              sec = Math.floor(sec);
-              const h = Math.floor(sec/3600);
-              const m = Math.floor((sec%3600)/60);
-              const s = sec%60;
-              const mm = (h>0? String(m).padStart(2,'0'): String(m));
-              const ss = String(s).padStart(2,'0');
-              return h>0 ? `${h}:${mm}:${ss}` : `${m}:${ss}`;
-            }
-            function tick(){
-              const v = document.querySelector('video');
-              if (!v) return;
-              const cur = fmt(v.currentTime);
-              const dur = fmt(v.duration);
-              console.log('[STREAM_TIME] video: ' + cur + ' / ' + dur);
-            }
-            window.__streamTimeVideoTimer = setInterval(tick, 1000);
-            return 'set';
-          })();
-        """
-            res = self.page.evaluate(setup_video_poll_js)
-            # Don't log polling setup - too verbose
-
-            # Poll console logs for time updates
-            seen_console_times = set(initial_matches or [])
-            time_regex = re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?(?:\s*/\s*\d{1,2}:\d{2}(?::\d{2})?)?\b")
-
-            start_ts = time.time()
-            last_direct_val = None
-            collected_times = []
-            pc_time_at_samples = []
+            video.wait_for(state="attached", timeout=self._wait_ms)
+            
+            # Log stream-time text changes, plus the video's own time every second
+            # (helpers installed by run())
+            self.page.evaluate("window.__watchStreamTime()")
+            self.page.evaluate(_STREAM_TIME_TICKER_JS)
             
-            while time.time() - start_ts < 60:
-                # Check console messages (Playwright doesn't have direct console log access like Selenium)
-                # Use direct video sampling instead
+            # Same in-page timeupdate samples as track_live_stream_time, fetched in one
+            # call once three distinct seconds are in (or after 60s)
+            try:
+                self.page.evaluate("window.__collectTimeSamples()")
                 try:
-                    vals = self.page.evaluate("var v=document.querySelector('video'); return v? [v.currentTime, v.duration]: null;")
-                    if vals and isinstance(vals, list) and len(vals) == 2:
-                        cur = int(vals[0]) if vals[0] is not None else 0
-                        dur = int(vals[1]) if vals[1] is not None else 0
-                        
-                        def _fmt(sec):
-                            try:
-                                sec = int(sec)
-                            except Exception:
-                                return "0:00"
-                            h = sec // 3600
-                            m = (sec % 3600) // 60
-                            s = sec % 60
-                            if h:
-                                return f"{h}:{m:02d}:{s:02d}"
-                            return f"{m}:{s:02d}"
-                        
-                        direct_val = f"{_fmt(cur)} / {_fmt(dur)}"
-                        if direct_val != last_direct_val:
-                            last_direct_val = direct_val
-                            # Only log first sample, not every update
-                            if len(collected_times) == 0:
-                                print(f"📊 Stream time: {direct_val}")
-                            collected_times.append(direct_val)
-                            pc_time_at_samples.append(datetime.now().strftime("%H:%M:%S"))
-                            if len(collected_times) >= 3:
-                                break
+                    self.page.wait_for_function(
+                        "() => window.__nimarSamples.length >= 3",
+                        timeout=60000, polling=250
+                    )
                 except Exception:
-                    pass
-                
+                    pass  # Use whatever was collected
+                samples = self.page.evaluate("window.__nimarSamples.splice(0)")
+                if not samples:
+                    # No timeupdate (e.g. paused video): take one direct reading instead
+                    vals = self._probe_video()
+                    if vals:
+                        samples = [[None, vals[0], vals[1]]]
+            except Exception as e:
+                logger.warning(f"⚠️ Error sampling video time: {e}")
+                samples = []
+            
+            last_direct_val = None
+            collected_times = []
+            pc_time_at_samples = []
+            for sampled_at, cur, dur in samples:
+                direct_val = f"{_fmt_clock(cur or 0)} / {_fmt_clock(dur or 0)}"
+                if direct_val == last_direct_val:
+                    continue
+                last_direct_val = direct_val
+                # Only log first sample, not every update
+                if not collected_times:
+                    logger.info(f"📊 Stream time: {direct_val}")
+                collected_times.append(direct_val)
+                pc_at = datetime.fromtimestamp(sampled_at / 1000) if sampled_at else datetime.now()
+                pc_time_at_samples.append(pc_at.strftime("%H:%M:%S"))
                 if len(collected_times) >= 3:
                     break
-                time.sleep(1)
 
             # Store results
             if collected_times:
@@ -2487,12 +2297,12 @@ class LiveTestSaveClipAutomation:
                     ],
                 )
             else:
-                print("WARNING: " + "NO: Could not collect stream time samples for comparison")
+                logger.warning("NO: Could not collect stream time samples for comparison")
             
             return True
 
         except Exception as e:
-            print("ERROR: " + f"NO: Error setting up dynamic stream time tracking -> {e}")
+            logger.error(f"NO: Error setting up dynamic stream time tracking -> {e}")
             return False
     
     def open_calendar(self) -> bool:
@@ -2505,15 +2315,12 @@ class LiveTestSaveClipAutomation:
             bool: True if calendar opened, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
-            # Try SVG path first
+            # Try SVG path first (short probe; the button fallback gets the full wait)
             try:
                 calendar_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[2]/svg/path')
-                calendar_btn.wait_for(state="visible", timeout=wait_timeout)
+                calendar_btn.wait_for(state="visible", timeout=self.FAST_WAIT_MS)
                 calendar_btn.click()
-                print("YES: Calendar opened")
+                logger.info("YES: Calendar opened")
                 time.sleep(2)
                 return True
             except Exception:
@@ -2522,17 +2329,17 @@ class LiveTestSaveClipAutomation:
             # Fallback to button
             try:
                 calendar_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[2]')
-                calendar_btn.wait_for(state="visible", timeout=wait_timeout)
+                calendar_btn.wait_for(state="visible", timeout=self._wait_ms)
                 calendar_btn.click()
-                print("YES: Calendar opened")
+                logger.info("YES: Calendar opened")
                 time.sleep(2)
                 return True
             except Exception:
-                print("WARNING: " + "NO: Calendar button not found (both selectors failed)")
+                logger.warning("NO: Calendar button not found (both selectors failed)")
                 return False
                 
         except Exception as e:
-            print("ERROR: " + f"NO: Error opening calendar -> {e}")
+            logger.error(f"NO: Error opening calendar -> {e}")
             return False
     
     def set_previous_day_date(self) -> bool:
@@ -2549,47 +2356,16 @@ class LiveTestSaveClipAutomation:
             prev_day = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
             self.prev_date_token = prev_day
 
-            set_date_js = """
-          (function(v){
-            function setVal(el, val){
-              el.value = val;
-              el.dispatchEvent(new Event('input', {bubbles:true}));
-              el.dispatchEvent(new Event('change', {bubbles:true}));
-            }
-            const isVisible = el => !!(el && el.offsetParent !== null);
-            const inputs = Array.from(document.querySelectorAll('input'))
-              .filter(isVisible);
-            let changed = false;
-            for (const el of inputs){
-              const t = (el.getAttribute('type')||'').toLowerCase();
-              const ph = (el.getAttribute('placeholder')||'').toLowerCase();
-              const ar = (el.getAttribute('aria-label')||'').toLowerCase();
-              const name = (el.getAttribute('name')||'').toLowerCase();
-              if (t === 'date' || ph.includes('date') || ar.includes('date') || name.includes('date')){
-                setVal(el, v); changed = true; break;
-              }
-            }
-            if (!changed){
-              const dialogs = Array.from(document.querySelectorAll('[role="dialog"], [role="presentation"], .MuiPickersPopper-root, .MuiPopover-root'));
-              for (const d of dialogs){
-                const el = d.querySelector('input');
-                if (isVisible(el)){ setVal(el, v); changed = true; break; }
-              }
-            }
-            return changed;
-          })(arguments[0]);
-        """
-            
-            ok = self.page.evaluate(set_date_js, prev_day)
+            ok = self.page.evaluate(_SET_DATE_INPUT_JS, prev_day)
             if ok:
-                print(f"YES: Set previous day date -> {prev_day}")
+                logger.info(f"YES: Set previous day date -> {prev_day}")
                 return True
             else:
-                print("WARNING: " + f"NO: Could not set previous day date -> {prev_day}")
+                logger.warning(f"NO: Could not set previous day date -> {prev_day}")
                 return False
                 
         except Exception as e:
-            print("ERROR: " + f"NO: Error while setting date -> {e}")
+            logger.error(f"NO: Error while setting date -> {e}")
             return False
     
     def get_previous_day_stream(self) -> bool:
@@ -2603,26 +2379,23 @@ class LiveTestSaveClipAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
             # Get old video source
             old_src = None
             try:
-                old_src = self.page.evaluate("var v=document.querySelector('video'); return v? v.currentSrc || v.src : null;")
+                old_src = (self.page.evaluate(_VIDEO_SRC_TIME_JS) or [None])[0]
             except Exception:
                 pass
             
             # Click Get Stream button
             get_stream_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[4]/div/div/div[2]/div/button/span')
-            get_stream_btn.wait_for(state="visible", timeout=wait_timeout)
+            get_stream_btn.wait_for(state="visible", timeout=self._wait_ms)
             get_stream_btn.click()
-            print("YES: Get Stream button clicked")
+            logger.info("YES: Get Stream button clicked")
             
             # Refresh after Get Stream
             try:
                 self.page.reload()
-                print("INFO: Previous-day page refreshed after Get Stream click")
+                logger.info("Previous-day page refreshed after Get Stream click")
             except Exception:
                 pass
             
@@ -2632,8 +2405,8 @@ class LiveTestSaveClipAutomation:
             t0 = time.time()
             changed = False
             while time.time() - t0 < 15:
-                vals = self.page.evaluate("var v=document.querySelector('video'); return v? [v.currentSrc||v.src, v.currentTime]: null;")
-                if vals and isinstance(vals, list) and len(vals) == 2:
+                vals = self.page.evaluate(_VIDEO_SRC_TIME_JS)
+                if vals:
                     src_now, cur_now = vals[0], vals[1]
                     if (old_src and src_now and src_now != old_src) or (cur_now is not None and cur_now < 2):
                         changed = True
@@ -2641,24 +2414,17 @@ class LiveTestSaveClipAutomation:
                 time.sleep(0.5)
             
             if changed:
-                print("YES: Previous day stream loaded (video updated)")
+                logger.info("YES: Previous day stream loaded (video updated)")
             else:
-                print("WARNING: " + "WARN: Video did not update after clicking Get Stream (continuing)")
+                logger.warning("WARN: Video did not update after clicking Get Stream (continuing)")
 
             # Collect duration
             loaded = False
             t0 = time.time()
             while time.time() - t0 < 60:
                 try:
-                    vals = self.page.evaluate(
-                        """
-                        var v=document.querySelector('video');
-                        if(!v) return null;
-                        if(!(isFinite(v.duration) && v.duration>0)) { try{ v.load(); v.play(); setTimeout(()=>{try{v.pause()}catch(e){}}, 500); }catch(e){} }
-                        return [v.readyState, isFinite(v.duration)?v.duration:null];
-                        """
-                    )
-                    if vals and isinstance(vals, list) and len(vals) == 2:
+                    vals = self.page.evaluate(_VIDEO_LOAD_DURATION_JS)
+                    if vals:
                         rs, dur = vals
                         if dur and float(dur) > 0 and (rs is None or int(rs) >= 1):
                             loaded = True
@@ -2668,13 +2434,13 @@ class LiveTestSaveClipAutomation:
                 time.sleep(0.5)
 
             if loaded:
-                vals = self.page.evaluate("var v=document.querySelector('video'); return v? [v.currentTime, v.duration]: null;")
-                if vals and isinstance(vals, list) and len(vals) == 2 and vals[1]:
+                vals = self._probe_video()
+                if vals and vals[1]:
                     self.prev_total_seconds = float(vals[1])
                 else:
-                    print("WARNING: " + "NO: Could not read previous day stream duration (pre-refresh)")
+                    logger.warning("NO: Could not read previous day stream duration (pre-refresh)")
             else:
-                print("WARNING: " + "NO: Previous day video did not finish loading (pre-refresh)")
+                logger.warning("NO: Previous day video did not finish loading (pre-refresh)")
 
             # Verify URL and refresh
             try:
@@ -2688,16 +2454,16 @@ class LiveTestSaveClipAutomation:
                         break
                     time.sleep(0.5)
                 if verified:
-                    print(f"YES: URL reflects selected date -> {self.page.url}")
+                    logger.info(f"YES: URL reflects selected date -> {self.page.url}")
                 else:
-                    print("WARNING: " + f"WARN: URL did not include date token '{expected_token}' within wait window")
+                    logger.warning(f"WARN: URL did not include date token '{expected_token}' within wait window")
             except Exception:
                 pass
 
             # Refresh page
             try:
                 self.page.reload()
-                print("INFO: Previous-day page refreshed")
+                logger.info("Previous-day page refreshed")
             except Exception:
                 pass
             time.sleep(5)
@@ -2705,8 +2471,8 @@ class LiveTestSaveClipAutomation:
             # Recompute duration after refresh if needed
             try:
                 if self.prev_total_seconds is None:
-                    vals = self.page.evaluate("var v=document.querySelector('video'); return v? [v.currentTime, v.duration]: null;")
-                    if vals and isinstance(vals, list) and len(vals) == 2 and vals[1]:
+                    vals = self._probe_video()
+                    if vals and vals[1]:
                         self.prev_total_seconds = float(vals[1])
                 
                 if self.prev_total_seconds:
@@ -2726,14 +2492,14 @@ class LiveTestSaveClipAutomation:
                         ],
                     )
                 else:
-                    print("WARNING: " + "NO: Previous day duration not available after refresh")
+                    logger.warning("NO: Previous day duration not available after refresh")
             except Exception as e:
-                print("ERROR: " + f"NO: Error computing previous day status after refresh -> {e}")
+                logger.error(f"NO: Error computing previous day status after refresh -> {e}")
             
             return True
             
         except Exception as e:
-            print("ERROR: " + f"NO: Error getting previous day stream -> {e}")
+            logger.error(f"NO: Error getting previous day stream -> {e}")
             return False
     
     def return_to_live(self) -> bool:
@@ -2744,100 +2510,85 @@ class LiveTestSaveClipAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
-            print("🔍 Attempting to return to live view...")
+            logger.info("🔍 Attempting to return to live view...")
             
             # Try multiple methods to return to live
             returned = False
             
             # Method 1: Try primary XPath for "Back to Live" button (p tag)
+            back_live = self.page.locator(self.START_LIVE_BTN_CSS)
             try:
-                back_live = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]/p')
-                back_live.wait_for(state="visible", timeout=wait_timeout)
-                back_live.scroll_into_view_if_needed()
-                time.sleep(1)
-                back_live.click(force=True)
-                print("✅ Back to Live clicked (method 1)")
+                back_live.click(force=True, timeout=self._wait_ms)
+                logger.info("✅ Back to Live clicked (method 1)")
                 time.sleep(3)
                 returned = True
             except Exception as e1:
-                print("WARNING: " + f"⚠️ Method 1 failed: {e1}")
+                logger.warning(f"⚠️ Method 1 failed: {e1}")
                 
                 # Method 2: Try JavaScript click
                 try:
-                    back_live = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]/p')
-                    back_live.wait_for(state="visible", timeout=wait_timeout)
-                    back_live.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    back_live.evaluate("el => el.click()")
-                    print("✅ Back to Live clicked via JavaScript (method 2)")
+                    back_live.evaluate("el => el.click()", timeout=self.FAST_WAIT_MS)
+                    logger.info("✅ Back to Live clicked via JavaScript (method 2)")
                     time.sleep(3)
                     returned = True
                 except Exception as e2:
-                    print("WARNING: " + f"⚠️ Method 2 failed: {e2}")
+                    logger.warning(f"⚠️ Method 2 failed: {e2}")
                     
                     # Method 3: Try clicking the button parent
                     try:
-                        back_live_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]')
-                        back_live_btn.wait_for(state="visible", timeout=wait_timeout)
-                        back_live_btn.scroll_into_view_if_needed()
-                        time.sleep(1)
-                        back_live_btn.click(force=True)
-                        print("✅ Back to Live button clicked (method 3)")
+                        back_live_btn = self.page.locator(self.START_LIVE_PARENT_CSS)
+                        back_live_btn.click(force=True, timeout=self.FAST_WAIT_MS)
+                        logger.info("✅ Back to Live button clicked (method 3)")
                         time.sleep(3)
                         returned = True
                     except Exception as e3:
-                        print("WARNING: " + f"⚠️ Method 3 failed: {e3}")
+                        logger.warning(f"⚠️ Method 3 failed: {e3}")
                         
                         # Method 4: Try alternative XPath (might be different layout)
                         try:
                             alt_back_live = self.page.locator('//button[contains(., "Live") or contains(., "Back")]')
                             if alt_back_live.count() > 0:
-                                alt_back_live.first.scroll_into_view_if_needed()
-                                time.sleep(1)
-                                alt_back_live.first.click(force=True)
-                                print("✅ Back to Live clicked (method 4 - alternative)")
+                                alt_back_live.first.click(force=True, timeout=self.FAST_WAIT_MS)
+                                logger.info("✅ Back to Live clicked (method 4 - alternative)")
                                 time.sleep(3)
                                 returned = True
                         except Exception as e4:
-                            print("WARNING: " + f"⚠️ Method 4 failed: {e4}")
+                            logger.warning(f"⚠️ Method 4 failed: {e4}")
             
             if returned:
                 # Verify we're back on live view
                 time.sleep(2)
                 try:
                     # Check if "Start from Live" button is visible (indicates we're on live view)
-                    start_live_check = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[3]/p')
+                    start_live_check = self.page.locator(self.START_LIVE_BTN_CSS)
                     start_live_check.wait_for(state="visible", timeout=5000)
-                    print("✅ Successfully returned to live view (verified)")
+                    logger.info("✅ Successfully returned to live view (verified)")
                 except Exception:
                     # Alternative: Check for video element or calendar button
                     try:
                         calendar_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[2]')
                         calendar_btn.wait_for(state="visible", timeout=5000)
-                        print("✅ Successfully returned to live view (calendar button visible)")
+                        logger.info("✅ Successfully returned to live view (calendar button visible)")
                     except Exception:
-                        print("WARNING: " + "⚠️ Returned to live but verification uncertain")
+                        logger.warning("⚠️ Returned to live but verification uncertain")
                 
                 # Refresh and wait
                 try:
                     self.page.reload()
-                    print("INFO: Page refreshed after returning to live")
+                    logger.info("Page refreshed after returning to live")
                     time.sleep(5)
                 except Exception as e:
-                    print("WARNING: " + f"⚠️ Page refresh failed: {e}")
+                    logger.warning(f"⚠️ Page refresh failed: {e}")
                 
                 return True
             else:
-                print("ERROR: " + "❌ All methods failed to return to live view")
-                print("ERROR: " + "   Tried: Direct click, JavaScript click, Button parent click, Alternative XPath")
-                print("ERROR: " + "   Cannot proceed with next day verification")
+                logger.error("❌ All methods failed to return to live view")
+                logger.error("   Tried: Direct click, JavaScript click, Button parent click, Alternative XPath")
+                logger.error("   Cannot proceed with next day verification")
                 return False
             
         except Exception as e:
-            print("ERROR: " + f"❌ Error returning to live -> {e}")
+            logger.error(f"❌ Error returning to live -> {e}")
             return False
     
     def crop_and_save_clip(self) -> bool:
@@ -2855,26 +2606,19 @@ class LiveTestSaveClipAutomation:
             bool: True if successful, False otherwise
         """
         try:
-            wait_timeout = WAIT_TIMEOUT or 20
-            wait_timeout_ms = wait_timeout * 1000
-            
             # 1) Click scissors button (using JavaScript like Selenium script)
             try:
                 scissors = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[1]/svg/path')
-                scissors.wait_for(state="attached", timeout=wait_timeout)
-                scissors.scroll_into_view_if_needed()
-                scissors.evaluate("el => el.click()")
-                print("YES: Scissors button clicked")
+                scissors.evaluate("el => el.click()", timeout=self.FAST_WAIT_MS)
+                logger.info("YES: Scissors button clicked")
             except Exception:
                 # Fallback to parent button with JavaScript
                 try:
                     parent_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[3]/div[2]/button[1]')
-                    parent_btn.wait_for(state="visible", timeout=wait_timeout)
-                    parent_btn.scroll_into_view_if_needed()
-                    parent_btn.evaluate("el => el.click()")
-                    print("YES: Scissors parent button clicked")
+                    parent_btn.evaluate("el => el.click()", timeout=self._wait_ms)
+                    logger.info("YES: Scissors parent button clicked")
                 except Exception as e_sc:
-                    print("ERROR: " + f"NO: Scissors button not clickable -> {e_sc}")
+                    logger.error(f"NO: Scissors button not clickable -> {e_sc}")
                     return False
 
             time.sleep(1)
@@ -2882,7 +2626,7 @@ class LiveTestSaveClipAutomation:
             # 2) Click Start Cropping (using multiple strategies like Selenium script)
             try:
                 start_parent = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[4]/div[2]/button')
-                start_parent.wait_for(state="visible", timeout=wait_timeout)
+                start_parent.wait_for(state="visible", timeout=self._wait_ms)
                 start_parent.scroll_into_view_if_needed()
                 
                 # Remove possible overlays that block clicks (like Selenium script)
@@ -2907,9 +2651,9 @@ class LiveTestSaveClipAutomation:
                 if not clicked:
                     raise Exception("all click strategies failed")
                 
-                print("YES: Start cropping clicked")
+                logger.info("YES: Start cropping clicked")
             except Exception as e_st:
-                print("ERROR: " + f"NO: Start cropping not clickable -> {e_st}")
+                logger.error(f"NO: Start cropping not clickable -> {e_st}")
                 return False
 
             time.sleep(1)
@@ -2924,26 +2668,26 @@ class LiveTestSaveClipAutomation:
                     start_handle = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[5]/div/div/div[2]')
                     end_handle = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[5]/div/div/div[3]')
                     
-                    track.wait_for(state="attached", timeout=wait_timeout)
-                    start_handle.wait_for(state="attached", timeout=wait_timeout)
-                    end_handle.wait_for(state="attached", timeout=wait_timeout)
+                    track.wait_for(state="attached", timeout=self._wait_ms)
+                    start_handle.wait_for(state="attached", timeout=self._wait_ms)
+                    end_handle.wait_for(state="attached", timeout=self._wait_ms)
                     
                     # Wait a bit for track to be fully rendered
                     time.sleep(0.5)
                     
-                    # Get video duration - using proper arrow function syntax
-                    duration_sec = self.page.evaluate("() => { const v = document.querySelector('video'); return v ? v.duration : 0; }") or 0
+                    # Get video duration
+                    duration_sec = (self._probe_video() or [0, 0])[1] or 0
                     
                     # Get track dimensions
                     track_box = track.bounding_box()
                     if not track_box:
-                        print("WARNING: " + "WARN: Missing track bounds; retrying...")
+                        logger.warning("WARN: Missing track bounds; retrying...")
                         time.sleep(0.3)
                         continue
 
                     track_width = track_box['width']
                     if not (duration_sec and track_width and duration_sec > 0):
-                        print("WARNING: " + "WARN: Missing duration/track width; retrying...")
+                        logger.warning("WARN: Missing duration/track width; retrying...")
                         time.sleep(0.3)
                         continue
                     
@@ -2956,7 +2700,7 @@ class LiveTestSaveClipAutomation:
                     end_box = end_handle.bounding_box()
                     
                     if not track_box or not start_box or not end_box:
-                        print("WARNING: " + "WARN: Missing element bounds; retrying...")
+                        logger.warning("WARN: Missing element bounds; retrying...")
                         time.sleep(0.3)
                         continue
                     
@@ -2995,7 +2739,7 @@ class LiveTestSaveClipAutomation:
                             self.page.mouse.up()
                             time.sleep(0.5)
                         except Exception as drag_err:
-                            print("WARNING: " + f"WARN: Start handle drag failed: {drag_err}; continuing...")
+                            logger.warning(f"WARN: Start handle drag failed: {drag_err}; continuing...")
                             time.sleep(0.3)
 
                     # Wait and get updated end handle position
@@ -3029,7 +2773,7 @@ class LiveTestSaveClipAutomation:
                                 self.page.mouse.up()
                                 time.sleep(0.5)
                             except Exception as drag_err:
-                                print("WARNING: " + f"WARN: End handle drag failed: {drag_err}; continuing...")
+                                logger.warning(f"WARN: End handle drag failed: {drag_err}; continuing...")
                                 time.sleep(0.3)
 
                     # Verify selection - simplified (just wait and assume success)
@@ -3047,30 +2791,30 @@ class LiveTestSaveClipAutomation:
                             
                             # Check if handles actually moved
                             if abs(final_sx - sx) > 2 or abs(final_ex - ex) > 2:
-                                print("YES: Slider handles moved successfully")
+                                logger.info("YES: Slider handles moved successfully")
                             else:
-                                print("WARNING: " + "WARN: Slider handles may not have moved; proceeding anyway")
+                                logger.warning("WARN: Slider handles may not have moved; proceeding anyway")
                         else:
-                            print("WARNING: " + "WARN: Could not verify slider position; proceeding anyway")
+                            logger.warning("WARN: Could not verify slider position; proceeding anyway")
                     except Exception as e:
-                        print("WARNING: " + f"WARN: Could not verify slider position: {e}; proceeding anyway")
+                        logger.warning(f"WARN: Could not verify slider position: {e}; proceeding anyway")
 
-                    print("YES: Range set successfully (safe in-bounds drag)")
+                    logger.info("YES: Range set successfully (safe in-bounds drag)")
                     break
                     
                 except Exception as e_move:
                     error_msg = str(e_move)
                     if attempts < 5:
-                        print("WARNING: " + f"WARN: Slider adjustment failed (attempt {attempts}/5): {error_msg[:100]}... retrying...")
+                        logger.warning(f"WARN: Slider adjustment failed (attempt {attempts}/5): {error_msg[:100]}... retrying...")
                         time.sleep(0.5)
                         continue
                     else:
-                        print("ERROR: " + f"NO: Error while adjusting crop range -> {error_msg}")
+                        logger.error(f"NO: Error while adjusting crop range -> {error_msg}")
                         import traceback
-                        print("ERROR: " + f"Full traceback: {traceback.format_exc()}")
+                        logger.error(f"Full traceback: {traceback.format_exc()}")
                         return False
             else:
-                print("ERROR: " + "NO: Failed to set selection after retries")
+                logger.error("NO: Failed to set selection after retries")
                 return False
             
             # 4) Click Export button (using multiple strategies like Selenium script)
@@ -3083,7 +2827,8 @@ class LiveTestSaveClipAutomation:
             for xp, how in export_strategies:
                 try:
                     el = self.page.locator(xp)
-                    el.wait_for(state="attached", timeout=wait_timeout)
+                    # The inner <svg> is only probed; its parent button gets the full wait
+                    el.wait_for(state="attached", timeout=self.FAST_WAIT_MS if how == 'js' else self._wait_ms)
                     el.scroll_into_view_if_needed()
                     if how == 'js':
                         el.evaluate("el => el.click()")
@@ -3094,26 +2839,26 @@ class LiveTestSaveClipAutomation:
                             # Fallback to JavaScript if native click fails
                             el.evaluate("el => el.click()")
                     clicked_export = True
-                    print("YES: Export button clicked")
+                    logger.info("YES: Export button clicked")
                     break
                 except Exception:
                     continue
                 
             if not clicked_export:
-                print("ERROR: " + "NO: Export button not clickable after strategies")
+                logger.error("NO: Export button not clickable after strategies")
                 return False
             
             # Wait 20 seconds after Export button click (as requested)
-            print("⏳ Waiting 20 seconds after Export button click...")
+            logger.info("⏳ Waiting 20 seconds after Export button click...")
             time.sleep(20)
             
             # Wait for publish dialog
             try:
                 publish_dialog = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[5]/div/div/div[2]/input[1]')
                 publish_dialog.wait_for(state="visible", timeout=60000)
-                print("YES: Publish dialog appeared")
+                logger.info("YES: Publish dialog appeared")
             except Exception as e_wait:
-                print("ERROR: " + f"NO: Publish dialog did not appear -> {e_wait}")
+                logger.error(f"NO: Publish dialog did not appear -> {e_wait}")
                 return False
 
             # 5) Fill metadata (using clear and fill like Selenium script)
@@ -3126,9 +2871,9 @@ class LiveTestSaveClipAutomation:
             desc_input = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[5]/div/div/div[2]/input[3]')
             
             
-            post_title.wait_for(state="visible", timeout=wait_timeout)
-            title_input.wait_for(state="visible", timeout=wait_timeout)
-            desc_input.wait_for(state="visible", timeout=wait_timeout)
+            post_title.wait_for(state="visible", timeout=self._wait_ms)
+            title_input.wait_for(state="visible", timeout=self._wait_ms)
+            desc_input.wait_for(state="visible", timeout=self._wait_ms)
             
             # Clear and fill like Selenium script
             for el, text in [(post_title, rand_post), (title_input, rand_title), (desc_input, rand_desc)]:
@@ -3146,12 +2891,12 @@ class LiveTestSaveClipAutomation:
             # 6) Click Save button (using JavaScript like Selenium script)
             try:
                 save_btn = self.page.locator('//*[@id="root"]/div/div[2]/div/div/div[3]/div[1]/div[5]/div/div/div[1]/div/button/span')
-                save_btn.wait_for(state="visible", timeout=wait_timeout)
+                save_btn.wait_for(state="visible", timeout=self._wait_ms)
                 save_btn.evaluate("el => el.click()")
-                print("YES: Save button clicked (clip submitted)")
+                logger.info("YES: Save button clicked (clip submitted)")
                 
                 # Wait 20 seconds after Save button click (as requested)
-                print("⏳ Waiting 20 seconds after Save button click...")
+                logger.info("⏳ Waiting 20 seconds after Save button click...")
                 time.sleep(20)
                 
                 # Print final status (using current channel data if available)
@@ -3184,11 +2929,11 @@ class LiveTestSaveClipAutomation:
                 return True
                 
             except Exception as e_sv:
-                print("ERROR: " + f"NO: Save button not clickable -> {e_sv}")
+                logger.error(f"NO: Save button not clickable -> {e_sv}")
                 return False
 
         except Exception as e:
-            print("ERROR: " + f"NO: Error during crop/export workflow -> {e}")
+            logger.error(f"NO: Error during crop/export workflow -> {e}")
             return False
     
     def run(self) -> bool:
@@ -3227,18 +2972,18 @@ class LiveTestSaveClipAutomation:
             use_simple_browser = False
             
             if use_simple_browser:
-                print("🌐 Using simple browser mode (regular Edge, not Playwright controlled)")
+                logger.info("🌐 Using simple browser mode (regular Edge, not Playwright controlled)")
                 # Launch regular Edge browser
                 import subprocess
                 import webbrowser
                 if PORTAL_URL:
-                    print(f"📂 Opening {PORTAL_URL} in your default browser...")
-                    print("⚠️ You will need to manually complete the login and test workflow")
+                    logger.info(f"📂 Opening {PORTAL_URL} in your default browser...")
+                    logger.info("⚠️ You will need to manually complete the login and test workflow")
                     webbrowser.open(PORTAL_URL)
                     input("Press Enter after you've completed the test manually...")
                     return True
             else:
-                print("🤖 Using Playwright controlled Edge browser")
+                logger.info("🤖 Using Playwright controlled Edge browser")
             
             self.playwright = sync_playwright().start()
             launch_args = [
@@ -3273,7 +3018,7 @@ class LiveTestSaveClipAutomation:
             
             if use_system_edge:
                 # Use installed Edge with persistent context to leverage full codec support (like manual browser)
-                print("🧩 Using system Edge with persistent context for full codec support")
+                logger.info("🧩 Using system Edge with persistent context for full codec support")
                 user_data_dir = str(Path.home() / ".nimar_edge_profile")
                 try:
                     self.context = self.playwright.chromium.launch_persistent_context(
@@ -3291,17 +3036,17 @@ class LiveTestSaveClipAutomation:
                     )
                     self.page = self.context.new_page()
                 except Exception as e:
-                    print("WARNING: " + f"⚠️ Failed to launch system Edge persistent context: {e}. Falling back to Edge channel.")
+                    logger.warning(f"⚠️ Failed to launch system Edge persistent context: {e}. Falling back to Edge channel.")
                     use_system_edge = False
             
             if not use_system_edge:
                 if use_edge_channel:
                     # Try using installed Edge via channel without persistent profile
-                    print("🧪 Using Edge channel for Playwright launch")
+                    logger.info("🧪 Using Edge channel for Playwright launch")
                     try:
                         self.browser = self.playwright.chromium.launch(channel="msedge", headless=browser_headless, args=launch_args)
                     except Exception as e:
-                        print("WARNING: " + f"⚠️ Edge channel launch failed: {e}. Falling back to bundled Chromium.")
+                        logger.warning(f"⚠️ Edge channel launch failed: {e}. Falling back to bundled Chromium.")
                         self.browser = self.playwright.chromium.launch(headless=browser_headless, args=launch_args)
                 else:
                     self.browser = self.playwright.chromium.launch(headless=browser_headless, args=launch_args)
@@ -3309,8 +3054,14 @@ class LiveTestSaveClipAutomation:
                 # Set permissions for video/audio streaming (autoplay is not a permission, handled via launch args)
                 permissions = ["camera", "microphone"]
                 
+                # Reuse a recent login session (cookies) if one was saved
+                session_state = self._fresh_session_state()
+                if session_state:
+                    logger.info("🔁 Reusing saved login session (OTP will be skipped if still valid)")
+                
                 # Create context with video streaming support
                 self.context = self.browser.new_context(
+                    storage_state=session_state,
                     ignore_https_errors=browser_ignore_https,
                     no_viewport=browser_no_viewport,
                     viewport=None,
@@ -3325,13 +3076,24 @@ class LiveTestSaveClipAutomation:
                 # Grant permissions to page
                 self.page = self.context.new_page()
             
+            # Keep the HTTP cache on so the player bundle and UI assets are reused across
+            # channels, and skip images/fonts (the HLS playlist and segments never match)
+            try:
+                cdp = self.context.new_cdp_session(self.page)
+                cdp.send("Network.enable")
+                cdp.send("Network.setCacheDisabled", {"cacheDisabled": False})
+                if LIVE_BLOCK_HEAVY_RESOURCES:
+                    cdp.send("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
+            except Exception as e:
+                logger.warning(f"⚠️ Could not configure network cache/blocking: {e}")
+            
             # Grant permissions explicitly (autoplay is handled via browser args, not permissions)
             try:
                 self.context.grant_permissions(permissions, origin=PORTAL_URL)
-                print(f"✅ Granted permissions: {', '.join(permissions)}")
-                print(f"✅ Autoplay enabled via browser launch arguments")
+                logger.info(f"✅ Granted permissions: {', '.join(permissions)}")
+                logger.info(f"✅ Autoplay enabled via browser launch arguments")
             except Exception as e:
-                print("WARNING: " + f"⚠️ Could not grant permissions: {e}")
+                logger.warning(f"⚠️ Could not grant permissions: {e}")
             
             # Add JavaScript to handle video autoplay and error handling
             self.page.add_init_script("""
@@ -3343,12 +3105,16 @@ class LiveTestSaveClipAutomation:
                 });
                 
                 // Allow video autoplay and handle errors
+                // (start muted so the autoplay policy never blocks play(); unmute once playing)
                 HTMLVideoElement.prototype.play = (function(original) {
                     return function() {
-                        this.muted = false;
-                        var promise = original.apply(this, arguments);
+                        var video = this;
+                        video.muted = true;
+                        var promise = original.apply(video, arguments);
                         if (promise !== undefined) {
-                            promise.catch(function(error) {
+                            promise.then(function() {
+                                video.muted = false;
+                            }, function(error) {
                                 console.error('Video play error:', error);
                             });
                         }
@@ -3445,22 +3211,23 @@ class LiveTestSaveClipAutomation:
                         "aborterror: the play() request was interrupted"
                     ]):
                         return  # Don't log these non-critical errors
-                    print("ERROR: " + f"🔴 Console Error: {msg.text}")
+                    logger.error(f"🔴 Console Error: {msg.text}")
                 elif "video" in msg_text or "stream" in msg_text:
                     # Only log important video messages, not every console log
                     if "error" in msg_text or "failed" in msg_text:
-                        print(f"📹 Console: {msg.text}")
+                        logger.info(f"📹 Console: {msg.text}")
             
             self.page.on("console", handle_console)
             
             # Set up page error listener
             def handle_page_error(error):
-                print("ERROR: " + f"🔴 Page Error: {error}")
+                logger.error(f"🔴 Page Error: {error}")
             
             self.page.on("pageerror", handle_page_error)
             
-            # Store stream URLs from network requests
+            # Store stream URLs from network requests (the set is for membership checks)
             self.captured_stream_urls = []
+            seen_stream_urls = set()
             
             # Set up request/response monitoring for video streams (only log important ones)
             def handle_response(response):
@@ -3469,56 +3236,45 @@ class LiveTestSaveClipAutomation:
                 if '.m3u8' in url.lower():
                     status = response.status
                     if status >= 400:
-                        print("ERROR: " + f"🔴 Stream Playlist Failed: {url} - Status: {status}")
+                        logger.error(f"🔴 Stream Playlist Failed: {url} - Status: {status}")
                     elif status == 200 or status == 206:
                         # Only capture .m3u8 URLs for later use, don't log every request
-                        if url not in self.captured_stream_urls:
+                        if url not in seen_stream_urls:
+                            seen_stream_urls.add(url)
                             self.captured_stream_urls.append(url)
-                            print(f"✅ Captured stream playlist: {url}")
+                            logger.info(f"✅ Captured stream playlist: {url}")
             
             self.page.on("response", handle_response)
             
             # Monitor for video source changes
             def handle_video_source_change():
                 """Monitor when video source is set"""
-                self.page.evaluate("""
-                    (function(){
-                        var observer = new MutationObserver(function(mutations) {
-                            mutations.forEach(function(mutation) {
-                                if (mutation.type === 'attributes' && mutation.attributeName === 'src') {
-                                    var v = mutation.target;
-                                    console.log('Video src changed:', v.src || v.currentSrc);
-                                    if (v.src || v.currentSrc) {
-                                        v.load();
-                                    }
-                                }
-                            });
-                        });
-                        
-                        // Observe video elements
-                        var videos = document.querySelectorAll('video');
-                        videos.forEach(function(v) {
-                            observer.observe(v, { attributes: true, attributeFilter: ['src'] });
-                        });
-                        
-                        // Also observe for new video elements
-                        var bodyObserver = new MutationObserver(function(mutations) {
-                            mutations.forEach(function(mutation) {
-                                mutation.addedNodes.forEach(function(node) {
-                                    if (node.tagName === 'VIDEO') {
-                                        observer.observe(node, { attributes: true, attributeFilter: ['src'] });
-                                    }
-                                });
-                            });
-                        });
-                        bodyObserver.observe(document.body, { childList: true, subtree: true });
-                    })();
-                """)
+                self.page.evaluate(_VIDEO_SRC_WATCH_JS)
             
             # Set up video source monitoring after page loads
             self.page.on("load", handle_video_source_change)
             
-            print("✅ Browser initialized with video streaming support and error monitoring")
+            # A cached <video> handle belongs to the old document after navigation
+            def handle_frame_navigated(frame):
+                if frame == self.page.main_frame:
+                    self._video_handle = None
+            
+            self.page.on("framenavigated", handle_frame_navigated)
+            
+            # Video state pushed from the page on media events (no polling from Python)
+            def handle_video_state(source, state):
+                previous = self.video_state or {}
+                self.video_state = state
+                if state.get('event') != previous.get('event'):
+                    logger.debug(f"📹 Video {state.get('event')} (readyState={state.get('readyState')}, networkState={state.get('networkState')})")
+            
+            self.page.expose_binding("reportVideoState", handle_video_state)
+            self.page.add_init_script(_VIDEO_STATE_REPORTER_JS)
+            
+            # Stream-URL / video-state / player-kick helpers used by start_live_stream()
+            self.page.add_init_script(_PAGE_HELPERS_JS)
+            
+            logger.info("✅ Browser initialized with video streaming support and error monitoring")
             
             # Navigate to portal
             self.page.goto(PORTAL_URL)
@@ -3526,53 +3282,52 @@ class LiveTestSaveClipAutomation:
             time.sleep(5)
             
             # Login using OTP
-            print("🔐 Starting OTP-based login...")
+            logger.info("🔐 Starting OTP-based login...")
             login_success = login_with_otp_sync(self.page)
             
             if not login_success:
-                print("ERROR: " + "❌ Login failed. Exiting.")
+                logger.error("❌ Login failed. Exiting.")
                 return False
             
-            print("✅ Login successful! Proceeding with live test workflow...")
-            login_success_wait = float(LOGIN_SUCCESS_WAIT or 5)
-            time.sleep(login_success_wait)
+            logger.info("✅ Login successful! Proceeding with live test workflow...")
+            time.sleep(self._login_wait_s)
             
             # Navigate to live menu
             if not self.navigate_to_live_menu():
-                print("ERROR: " + "❌ Failed to navigate to live menu. Exiting.")
+                logger.error("❌ Failed to navigate to live menu. Exiting.")
                 return False
             
             # Process all channels
             channel_results = self.process_all_channels()
             
             if not channel_results:
-                print("ERROR: " + "❌ No channels were processed. Exiting.")
+                logger.error("❌ No channels were processed. Exiting.")
                 return False
             
             # Print final summary of all channels (proper format)
-            print(f"\n{'='*80}")
-            print("📊 FINAL SUMMARY - ALL CHANNELS")
-            print(f"{'='*80}")
+            logger.info(f"\n{'='*80}")
+            logger.info("📊 FINAL SUMMARY - ALL CHANNELS")
+            logger.info(f"{'='*80}")
             for result in channel_results:
-                print(f"\n📺 Channel: {result['channel_name']}")
-                print(f"   ⏱️  Live Stream Time: {result['live_time'] if result['live_time'] else 'N/A'}")
-                print(f"   🖥️  PC Time:           {result['pc_time'] if result['pc_time'] else 'N/A'}")
-                print(f"   📅 Previous Days Streams:")
+                logger.info(f"\n📺 Channel: {result['channel_name']}")
+                logger.info(f"   ⏱️  Live Stream Time: {result['live_time'] if result['live_time'] else 'N/A'}")
+                logger.info(f"   🖥️  PC Time:           {result['pc_time'] if result['pc_time'] else 'N/A'}")
+                logger.info(f"   📅 Previous Days Streams:")
                 for date, loaded, duration in result['previous_days']:
                     if loaded:
                         hours = duration / 3600.0
                         h = int(duration) // 3600
                         m = (int(duration) % 3600) // 60
                         s = int(duration) % 60
-                        print(f"      ✅ {date}: Available - Total Duration: {hours:.2f} hours ({h}:{m:02d}:{s:02d})")
+                        logger.info(f"      ✅ {date}: Available - Total Duration: {hours:.2f} hours ({h}:{m:02d}:{s:02d})")
                     else:
-                        print(f"      ❌ {date}: NOT Available")
-            print(f"\n{'='*80}\n")
+                        logger.info(f"      ❌ {date}: NOT Available")
+            logger.info(f"\n{'='*80}\n")
             
             # Print complete table at the end
-            print(f"\n{'='*180}")
-            print("📋 COMPLETE CHANNELS STATUS TABLE")
-            print(f"{'='*180}")
+            logger.info(f"\n{'='*180}")
+            logger.info("📋 COMPLETE CHANNELS STATUS TABLE")
+            logger.info(f"{'='*180}")
             
             # Table header - dynamic based on number of previous days checked
             max_days = 0
@@ -3595,8 +3350,8 @@ class LiveTestSaveClipAutomation:
             
             header = " | ".join(header_parts)
             separator = "-" * 180
-            print(header)
-            print(separator)
+            logger.info(header)
+            logger.info(separator)
             
             # Table rows
             for result in channel_results:
@@ -3658,59 +3413,59 @@ class LiveTestSaveClipAutomation:
                         formatted_row_parts.append(part)
                 
                 row = " | ".join(formatted_row_parts)
-                print(row)
+                logger.info(row)
             
-            print(separator)
-            print(f"{'='*180}\n")
+            logger.info(separator)
+            logger.info(f"{'='*180}\n")
             
             # Navigate back to live menu for clip creation
-            print(f"\n{'='*80}")
-            print("🎬 Starting clip creation workflow...")
-            print(f"{'='*80}\n")
+            logger.info(f"\n{'='*80}")
+            logger.info("🎬 Starting clip creation workflow...")
+            logger.info(f"{'='*80}\n")
             
             if not self.navigate_to_live_menu():
-                print("WARNING: " + "⚠️ Could not navigate back to live menu for clip creation.")
+                logger.warning("⚠️ Could not navigate back to live menu for clip creation.")
                 return True  # Return True even if clip creation fails, as channel verification is complete
             
             # Get all channels and always select second channel for clip creation
-            print("📺 Getting channels for clip creation...")
+            logger.info("📺 Getting channels for clip creation...")
             channels = self.get_all_channels()
             
             if not channels:
-                print("ERROR: " + "❌ No channels found for clip creation. Exiting.")
+                logger.error("❌ No channels found for clip creation. Exiting.")
                 return True  # Return True even if clip creation fails
             
             if len(channels) < 2:
-                print("WARNING: " + "⚠️ Only one channel found, using first channel for clip creation.")
+                logger.warning("⚠️ Only one channel found, using first channel for clip creation.")
                 second_channel_name, second_channel_index = channels[0]
             else:
                 # Always use second channel for clip creation
                 second_channel_name, second_channel_index = channels[1]
             
-            print(f"📺 Opening second channel for clip creation: {second_channel_name}")
+            logger.info(f"📺 Opening second channel for clip creation: {second_channel_name}")
             
             # Open channel for clip creation
             time.sleep(3)
             if not self.open_channel(second_channel_index, second_channel_name):
-                print("ERROR: " + f"❌ Failed to open channel for clip: {second_channel_name}")
+                logger.error(f"❌ Failed to open channel for clip: {second_channel_name}")
                 return True  # Return True even if clip creation fails
             
-            print("✅ Channel opened")
+            logger.info("✅ Channel opened")
             time.sleep(3)
             
             # Create clip directly (no stream initialization needed, as per clip-creation-only.py)
-            print("✂️ Creating 5-minute clip...")
+            logger.info("✂️ Creating 5-minute clip...")
             if not self.crop_and_save_clip():
-                print("WARNING: " + "⚠️ Crop and save clip had issues.")
+                logger.warning("⚠️ Crop and save clip had issues.")
             else:
-                print("✅ Clip created and saved successfully!")
+                logger.info("✅ Clip created and saved successfully!")
             
-            print("\n✅ Script completed successfully! Closing browser...")
+            logger.info("\n✅ Script completed successfully! Closing browser...")
             
             return True
             
         except Exception as e:
-            print("ERROR: " + f"❌ Error during automation: {e}")
+            logger.error(f"❌ Error during automation: {e}")
             return False
         finally:
             # Close browser
@@ -3720,14 +3475,15 @@ class LiveTestSaveClipAutomation:
                 if self.playwright:
                     self.playwright.stop()
             except Exception as e:
-                print("WARNING: " + f"Error closing browser: {e}")
+                logger.warning(f"Error closing browser: {e}")
 
 
 if __name__ == "__main__":
+    setup_logging(LOG_LEVEL)
     automation = LiveTestSaveClipAutomation()
     success = automation.run()
     
     if success:
-        print("✅ Automation completed successfully!")
+        logger.info("✅ Automation completed successfully!")
     else:
-        print("ERROR: ❌ Automation failed. Check logs for details.")
+        logger.error("❌ Automation failed. Check logs for details.")